@@ -0,0 +1,142 @@
+# Copyright 2019 British Broadcasting Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Compares the CPU cost to the registry of heartbeats over HTTP, as
+POST /health/nodes/<id> through the Flask test client, with heartbeats received
+as UDP datagrams by the HeartbeatListener, against an in-memory registry.
+
+    python benchmarks/bench_heartbeat.py [heartbeats]
+
+HTTP is timed without the auth middleware or a proxy in front of it, and
+includes the test client. UDP datagrams are sent by a separate process, paced
+so that the kernel does not drop them, and only the receiving process's CPU
+time is counted, covering receipt, parsing and the batched heartbeats.
+"""
+
+from __future__ import print_function
+
+import os
+import sys
+import json
+import time
+import uuid
+import socket
+import resource
+import subprocess
+
+import gevent
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.realpath(__file__)), ".."))
+
+from nmoscommon.webapi import WebAPI  # noqa E402
+
+from nmosregistration.v1_3 import routes as v1_3  # noqa E402
+from nmosregistration.udpheartbeat import HeartbeatListener  # noqa E402
+
+NODES = 1000
+SEND_RATE = 10000  # datagrams per second sent to the listener
+
+
+class MockResponse(object):
+    def __init__(self, status_code, value):
+        self.status_code = status_code
+        self.content = json.dumps({"node": {"value": str(value)}})
+
+
+class MemoryRegistry(object):
+    """Just enough of a registry for heartbeats: every node is registered and alive"""
+
+    class RegistryUnavailable(Exception):
+        pass
+
+    def put_health(self, rkey, value, ttl=None, prev_exist=None, port=2379):
+        return MockResponse(200, value)
+
+
+class MockLogger(object):
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: None
+
+
+def routes():
+    return v1_3.Routes(MockLogger(), MemoryRegistry())
+
+
+def cpu_time():
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    return usage.ru_utime + usage.ru_stime
+
+
+def bench_http(node_ids, heartbeats):
+    api_routes = routes()
+
+    class API(WebAPI):
+        def __init__(self):
+            super(API, self).__init__()
+            self.add_routes(api_routes, basepath="/x-nmos/registration/v1.3")
+
+    client = API().app.test_client()
+    start = cpu_time()
+    for i in range(heartbeats):
+        client.post("/x-nmos/registration/v1.3/health/nodes/" + node_ids[i % len(node_ids)])
+    return (cpu_time() - start) / heartbeats
+
+
+def send(port, node_ids, heartbeats):
+    sender = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    start = time.time()
+    for i in range(heartbeats):
+        sender.sendto(node_ids[i % len(node_ids)].encode('ascii'), ('127.0.0.1', port))
+        ahead = start + float(i) / SEND_RATE - time.time()
+        if ahead > 0:
+            time.sleep(ahead)
+
+
+def bench_udp(node_ids, heartbeats):
+    listener = HeartbeatListener(routes()._health_result, 0, host='127.0.0.1', logger=MockLogger())
+    listener.start()
+    port = listener.socket.getsockname()[1]
+
+    sender = subprocess.Popen([sys.executable, os.path.realpath(__file__), "--send", str(port), str(heartbeats)],
+                              stdin=subprocess.PIPE)
+    sender.stdin.write("\n".join(node_ids).encode('ascii'))
+    sender.stdin.close()
+    start = cpu_time()
+    while sender.poll() is None:
+        gevent.sleep(0.1)
+    gevent.sleep(0.5)
+    listener.flush()
+    used = cpu_time() - start
+
+    listener.stop()
+    received = listener.stats['received']
+    return used / max(1, received), received
+
+
+def main():
+    if len(sys.argv) > 1 and sys.argv[1] == "--send":
+        send(int(sys.argv[2]), sys.stdin.read().split(), int(sys.argv[3]))
+        return
+
+    heartbeats = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    node_ids = [str(uuid.uuid4()) for _ in range(NODES)]
+
+    print("http {:7.1f}us CPU per heartbeat".format(bench_http(node_ids, heartbeats) * 1e6))
+    per_datagram, received = bench_udp(node_ids, heartbeats)
+    print("udp  {:7.1f}us CPU per heartbeat received ({} of {})".format(per_datagram * 1e6, received, heartbeats))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,98 @@
+# Copyright 2019 British Broadcasting Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Compares the JSON libraries nmosregistration.jsoncodec may use, over the v1.3
+fixtures: decoding and encoding each resource, and decoding an etcd listing of
+500 receivers, values and all, as get_all() does.
+
+    python benchmarks/bench_jsoncodec.py [iterations]
+
+Libraries which are not installed are skipped.
+"""
+
+from __future__ import print_function
+
+import os
+import sys
+import json
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.realpath(__file__)))
+
+from fixtures import registrations  # noqa E402
+
+LISTING_SIZE = 500
+
+
+def codecs():
+    found = [("json", json.loads, json.dumps)]
+    try:
+        import ujson
+        found.append(("ujson", ujson.loads, ujson.dumps))
+    except ImportError:
+        pass
+    try:
+        import orjson
+        found.append(("orjson", orjson.loads, lambda obj: orjson.dumps(obj).decode('utf-8')))
+    except ImportError:
+        pass
+    return found
+
+
+def listing(bodies):
+    receiver = [body["data"] for body in bodies if body["type"] == "receiver"][0]
+    nodes = [
+        {"key": "/resource/receivers/{}".format(i), "value": json.dumps(receiver), "modifiedIndex": i}
+        for i in range(LISTING_SIZE)
+    ]
+    return json.dumps({"action": "get", "node": {"key": "/resource/receivers", "dir": True, "nodes": nodes}})
+
+
+def timed(f, iterations):
+    start = time.time()
+    for _ in range(iterations):
+        f()
+    return (time.time() - start) / iterations
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    bodies = registrations()
+    encoded = [json.dumps(body) for body in bodies]
+    etcd_listing = listing(bodies)
+
+    for name, loads, dumps in codecs():
+        def decode_all():
+            for body in encoded:
+                loads(body)
+
+        def encode_all():
+            for body in bodies:
+                dumps(body)
+
+        def decode_listing():
+            for node in loads(etcd_listing)["node"]["nodes"]:
+                loads(node["value"])
+
+        print("{:7} loads {:5.1f}us  dumps {:5.1f}us  listing {:5.2f}ms".format(
+            name,
+            timed(decode_all, iterations) / len(bodies) * 1e6,
+            timed(encode_all, iterations) / len(bodies) * 1e6,
+            timed(decode_listing, max(1, iterations // 100)) * 1e3,
+        ))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,92 @@
+# Copyright 2019 British Broadcasting Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Compares RegModifier.modify() with the recursive schema walker it replaced,
+over the v1.3 fixtures.
+
+    python benchmarks/bench_modifier.py [iterations]
+"""
+
+from __future__ import print_function
+
+import os
+import sys
+import copy
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.realpath(__file__)), ".."))
+
+from six import class_types  # noqa E402
+
+from nmosregistration.modifier import RegModifier, CustomModifier, GENERAL_SCHEMA, SCHEMA  # noqa E402
+from fixtures import registrations  # noqa E402
+
+
+class RecursiveRegModifier(object):
+    """The modifier as it was before its schemas were compiled"""
+
+    def __init__(self, logger):
+        self.logger = logger
+
+    def modify(self, data):
+        resource = self._modify_against_schema(data, GENERAL_SCHEMA)
+        specific_schema = SCHEMA.get(data['type'], None)
+        if specific_schema is not None:
+            data = self._modify_against_schema(resource, specific_schema)
+        return data
+
+    def _modify_against_schema(self, data, schema):
+        for k, vtype in schema.items():
+            if k in data.keys():
+                if type(vtype) is list:
+                    for child_schema in vtype:
+                        if type(child_schema) is dict:
+                            for child_data in data[k]:
+                                data[k][child_data] = self._modify_against_schema(child_data, child_schema)
+                        elif (
+                                isinstance(child_schema, (type, class_types)) and
+                                issubclass(child_schema, CustomModifier) and
+                                len(vtype) == 1
+                        ):
+                            custom = child_schema()
+                            for index, val in enumerate(data[k]):
+                                data[k][index] = custom.modify(val)
+                elif isinstance(vtype, (type, class_types)) and issubclass(vtype, CustomModifier):
+                    custom = vtype()
+                    data[k] = custom.modify(data[k])
+                elif type(vtype) is dict:
+                    data[k] = self._modify_against_schema(data[k], schema[k])
+        return data
+
+
+def run(modifier, bodies, iterations):
+    # Inputs are copied up front, so that only modify() is timed
+    inputs = [copy.deepcopy(bodies) for _ in range(iterations)]
+    start = time.time()
+    for batch in inputs:
+        for body in batch:
+            modifier.modify(body)
+    return (time.time() - start) / (iterations * len(bodies))
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    bodies = registrations()
+    for name, modifier in [("recursive", RecursiveRegModifier(None)), ("compiled", RegModifier(None))]:
+        print("{:10} {:.2f}us per resource".format(name, run(modifier, bodies, iterations) * 1e6))
+
+
+if __name__ == '__main__':
+    main()
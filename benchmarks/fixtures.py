@@ -0,0 +1,39 @@
+# Copyright 2019 British Broadcasting Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+The v1.3 test fixtures, as registration request bodies, for benchmarks.
+"""
+
+import os
+import json
+
+FIXTURES = os.path.join(os.path.dirname(os.path.realpath(__file__)), "..", "tests", "v1_3", "fixtures")
+
+
+def fixture_type(filename):
+    name = filename[:-len(".json")]
+    if name.endswith("flow"):
+        return "flow"
+    return name.split("-")[0]
+
+
+def registrations():
+    """Return a list of {"type", "data"} registration bodies, one for each fixture"""
+    bodies = []
+    for filename in sorted(os.listdir(FIXTURES)):
+        if filename.endswith(".json"):
+            with open(os.path.join(FIXTURES, filename)) as fixture:
+                bodies.append({"type": fixture_type(filename), "data": json.load(fixture)})
+    return bodies
@@ -19,36 +19,52 @@ import json
 import pprint
 
 
-def get_schema(name, dir):
+def get_schema(name, dir, definitions):
+    """
+    Load schema NAME from DIR into DEFINITIONS, followed by any schemas it
+    references. References are left in place so that each shared schema is
+    emitted only once; they are resolved at validation time.
+    """
 
-    def process(obj):
+    def find_refs(obj):
         if isinstance(obj, dict):
-            if len(obj) == 1 and "$ref" in obj:
-                return get_schema(obj['$ref'], dir)
-            return {k: process(v) for k, v in obj.items()}
+            if "$ref" in obj:
+                yield obj['$ref']
+            for v in obj.values():
+                for ref in find_refs(v):
+                    yield ref
         elif isinstance(obj, list):
-            return [process(x) for x in obj]
-        else:
-            return obj
+            for x in obj:
+                for ref in find_refs(x):
+                    yield ref
+
+    if name in definitions:
+        return
 
-    local = {}
     filename = "{}/{}".format(dir, name)
     with open(filename, 'r') as fh:
-        local = process(json.load(fh))
-    return local
+        definitions[name] = json.load(fh)
+
+    for ref in find_refs(definitions[name]):
+        get_schema(ref.split('#')[0], dir, definitions)
 
 
 if __name__ == '__main__':
     supported_types = ["node", "device", "source", "flow", "sender", "receiver"]
     schema_dir = sys.argv[1]
-    schema = {}
+    definitions = {}
 
     for name in supported_types:
-        schema[name] = get_schema("{}.json".format(name), schema_dir)
+        get_schema("{}.json".format(name), schema_dir, definitions)
 
     print('"""')
     print('Defines mapping of resource types to schema')
     print('Generated. Do not edit!')
     print('"""')
-    print('SCHEMA = ', end='')
-    pprint.pprint(schema)
+    print('DEFINITIONS = ', end='')
+    pprint.pprint(definitions, width=120)
+    print('')
+    print('SCHEMA = {')
+    for name in sorted(supported_types):
+        print("    '{0}': DEFINITIONS['{0}.json'],".format(name))
+    print('}')
@@ -20,7 +20,17 @@ from nmoscommon.auth.auth_middleware import AuthMiddleware
 from nmoscommon.nmoscommonconfig import config as _config
 
 from .garbage import GarbageCollect
+from .liveness import HeartbeatAbsorber
+from .watcher import Watcher
+from .existence import ExistenceCache
+from .mirror import Mirror, MIRROR_WATCH_TIMEOUT
+from .availability import Availability
+from .writebuffer import WriteBuffer
+from .coalescer import Coalescer
+from .singleflight import SingleFlight
+from .idindex import IdIndex
 from .etcd_backend import EtcdInterface
+from .common.routes import NODE_SEEN_TTL
 from .v1_0 import routes as v1_0
 from .v1_1 import routes as v1_1
 from .v1_2 import routes as v1_2
@@ -49,22 +59,116 @@ class AggregatorAPI(WebAPI):
         garbage_collect_interval = int(self._config.get("garbage_collect_interval", 10))
         self._garbage_collector = GarbageCollect(identifier=HOST, registry=registry, interval=garbage_collect_interval)
 
-        self._v1_0_api = v1_0.Routes(logger=logger, registry=registry)
+        # Changes made elsewhere are followed by watching the registry
+        mirror = self._config.get("registry_mirror", False)
+        watch_args = {"recursive": True, "timeout": MIRROR_WATCH_TIMEOUT} if mirror else {}
+        self._watcher = Watcher(registry=registry, prefix="resource", logger=logger, **watch_args)
+        self._health_watcher = Watcher(registry=registry, prefix="health", logger=logger, **watch_args)
+
+        # Heartbeats are written straight through to the registry unless a refresh factor is set
+        heartbeat_refresh_factor = int(self._config.get("heartbeat_refresh_factor", 1))
+        self._liveness = None
+        if heartbeat_refresh_factor > 1:
+            self._liveness = HeartbeatAbsorber(
+                registry=registry, ttl=NODE_SEEN_TTL, factor=heartbeat_refresh_factor,
+                workers=int(self._config.get("heartbeat_refresh_workers", 4)), logger=logger,
+                watcher=self._health_watcher
+            )
+            self._liveness.subscribe(self._garbage_collector.node_expired)
+            self._health_watcher.start()
+
+        self._existence = None
+        if self._config.get("existence_cache", True):
+            self._existence = ExistenceCache(registry=registry, watcher=self._watcher)
+            self._watcher.start()
+
+        # Listings may be answered from an index of resource IDs
+        self._id_index = None
+        if self._config.get("id_index", False):
+            self._id_index = IdIndex(registry=registry, watcher=self._watcher)
+            self._watcher.start()
+
+        self._mirror = None
+        if mirror:
+            self._mirror = Mirror(self._watcher, self._health_watcher)
+            self._watcher.start()
+            self._health_watcher.start()
+
+        # Requests are turned away at once while the registry is known to be unavailable
+        self._availability = None
+        unavailable_threshold = int(self._config.get("unavailable_threshold", 3))
+        if unavailable_threshold > 0:
+            self._availability = Availability(
+                registry, watcher=self._watcher, threshold=unavailable_threshold,
+                window=float(self._config.get("unavailable_window", 5))
+            )
+
+        # ...or their writes are held until it is available again
+        self._write_buffer = None
+        write_buffer_size = int(self._config.get("write_buffer_size", 0))
+        if write_buffer_size > 0 and self._availability is None:
+            logger.writeWarning("write_buffer_size needs unavailable_threshold to be set, not holding writes")
+        elif write_buffer_size > 0:
+            self._write_buffer = WriteBuffer(
+                registry, self._availability, limit=write_buffer_size,
+                path=self._config.get("write_buffer_file"), logger=logger
+            )
+
+        # Rapid updates to the same resource may be coalesced into one write
+        self._coalescer = None
+        coalesce_window = float(self._config.get("coalesce_window", 0))
+        if coalesce_window > 0:
+            self._coalescer = Coalescer(window=coalesce_window)
+
+        # Concurrent identical requests may share one backend operation
+        self._singleflight = None
+        if self._config.get("singleflight", False):
+            self._singleflight = SingleFlight()
+
+        components = {
+            "liveness": self._liveness,
+            "existence": self._existence,
+            "mirror": self._mirror,
+            "availability": self._availability,
+            "write_buffer": self._write_buffer,
+            "coalescer": self._coalescer,
+            "singleflight": self._singleflight,
+            "id_index": self._id_index
+        }
+
+        self._v1_0_api = v1_0.Routes(logger=logger, registry=registry, **components)
         self.add_routes(self._v1_0_api, basepath="/x-nmos/registration/v1.0")
 
-        self._v1_1_api = v1_1.Routes(logger=logger, registry=registry)
+        self._v1_1_api = v1_1.Routes(logger=logger, registry=registry, **components)
         self.add_routes(self._v1_1_api, basepath="/x-nmos/registration/v1.1")
 
-        self._v1_2_api = v1_2.Routes(logger=logger, registry=registry)
+        self._v1_2_api = v1_2.Routes(logger=logger, registry=registry, **components)
         self.add_routes(self._v1_2_api, basepath="/x-nmos/registration/v1.2")
 
-        self._v1_3_api = v1_3.Routes(logger=logger, registry=registry)
+        self._v1_3_api = v1_3.Routes(logger=logger, registry=registry, **components)
         self.add_routes(self._v1_3_api, basepath="/x-nmos/registration/v1.3")
 
+    def heartbeat(self, node_id):
+        """Heartbeat a node other than via HTTP, returning its result"""
+        return self._v1_3_api._health_result(node_id)
+
     @route('/')
     def __root(self):
         return (200, [AGGREGATOR_APINAMESPACE + "/"])
 
+    @route('/stats')
+    def __stats(self):
+        stats = {}
+        if self._mirror is not None:
+            stats["mirror"] = self._mirror.get_stats()
+        if self._write_buffer is not None:
+            stats["write_buffer"] = self._write_buffer.get_stats()
+        if self._coalescer is not None:
+            stats["coalescer"] = self._coalescer.get_stats()
+        if self._singleflight is not None:
+            stats["singleflight"] = self._singleflight.get_stats()
+        return (200, stats)
+
     @route('/' + AGGREGATOR_APINAMESPACE + '/')
     def __namespaceroot(self):
         return (200, [AGGREGATOR_APINAME + "/"])
@@ -0,0 +1,90 @@
+# Copyright 2019 British Broadcasting Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Tracks whether the registry is reachable, so that while it is known to be down
+requests can be turned away at once rather than each waiting for the registry
+to time out.
+
+The registry is taken to be down once THRESHOLD requests to it, or attempts by
+a watcher to follow it, have failed within WINDOW seconds of each other, with
+nothing heard from it in between; a single failed request is not enough. It is
+probed at once, and then every RETRY_AFTER seconds while it is down, and taken
+to be up again as soon as a probe succeeds or a watcher is back in step with it.
+"""
+
+import time
+import gevent
+from collections import deque
+
+RETRY_AFTER = 5  # seconds clients are asked to wait while the registry is unavailable
+THRESHOLD = 3  # failures after which the registry is taken to be down
+WINDOW = 5  # seconds within which those failures must fall
+
+
+class Availability(object):
+
+    def __init__(self, registry, watcher=None, retry_after=RETRY_AFTER, threshold=THRESHOLD, window=WINDOW):
+        self.registry = registry
+        self.retry_after = retry_after
+        self.threshold = threshold
+        self.window = window
+        self.since = None
+        self._failures = deque()
+        self._prober = None
+        if watcher is not None:
+            watcher.subscribe(self._on_event, self._on_reset)
+
+    def available(self):
+        """Test whether requests should be made to the registry"""
+        return self.since is None
+
+    def failed(self):
+        if self.since is not None:
+            return
+        now = time.time()
+        self._failures.append(now)
+        while self._failures[0] < now - self.window:
+            self._failures.popleft()
+        if len(self._failures) < self.threshold:
+            return
+
+        self._failures.clear()
+        self.since = now
+        if self._prober is None and self.retry_after > 0:
+            self._prober = gevent.spawn(self._probe)
+
+    def succeeded(self):
+        self.since = None
+        self._failures.clear()
+
+    def _probe(self):
+        try:
+            while self.since is not None:
+                try:
+                    self.registry.get_raw("resource", recurse=False)
+                    self.succeeded()
+                except self.registry.RegistryUnavailable:
+                    gevent.sleep(self.retry_after)
+        finally:
+            self._prober = None
+
+    def _on_event(self, action, key, node, prev_node):
+        self.succeeded()
+
+    def _on_reset(self, index, root=None):
+        if index is None:
+            self.failed()
+        else:
+            self.succeeded()
@@ -0,0 +1,88 @@
+# Copyright 2019 British Broadcasting Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Coalescing of rapid successive writes to the same key.
+
+A write is held for a short window before it is made. Any later write to the
+key within the window replaces it, so that only the newest is made, and the
+callers of all of them get its result. Writes to a key are made in the order
+they were held, and other writes to the key, such as deletions, flush any
+write held for it first.
+"""
+
+import gevent
+from gevent.event import AsyncResult
+
+WINDOW = 0.05  # seconds for which a write is held
+
+
+class Coalescer(object):
+
+    def __init__(self, window=WINDOW):
+        self.window = window
+        self.stats = {'writes': 0, 'coalesced': 0}
+        self._pending = {}
+        self._committing = {}
+
+    def get_stats(self):
+        stats = dict(self.stats)
+        stats['pending'] = len(self._pending)
+        return stats
+
+    def submit(self, key, f, *args, **kwargs):
+        """
+        Hold the write F(*ARGS, **KWARGS) to KEY, replacing any held already.
+        Returns the result of the write made, or raises its exception.
+        """
+        pending = self._pending.get(key)
+        if pending is not None:
+            pending[0] = (f, args, kwargs)
+            self.stats['coalesced'] += 1
+        else:
+            pending = self._pending[key] = [(f, args, kwargs), AsyncResult()]
+            gevent.spawn_later(self.window, self._commit, key, pending)
+        return pending[1].get()
+
+    def flush(self, key):
+        """Make any write held for KEY now, and wait for writes to it to finish"""
+        pending = self._pending.get(key)
+        if pending is not None:
+            self._commit(key, pending)
+        committing = self._committing.get(key)
+        if committing is not None:
+            committing.wait()
+
+    def _commit(self, key, pending):
+        if self._pending.get(key) is not pending:
+            # Already flushed
+            return
+        del self._pending[key]
+
+        # Wait for the write before this one to the key
+        result = pending[1]
+        previous = self._committing.get(key)
+        self._committing[key] = result
+        if previous is not None:
+            previous.wait()
+
+        f, args, kwargs = pending[0]
+        try:
+            result.set(f(*args, **kwargs))
+        except Exception as e:
+            result.set_exception(e)
+        finally:
+            self.stats['writes'] += 1
+            if self._committing.get(key) is result:
+                del self._committing[key]
@@ -12,144 +12,691 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import json
 import time
+import six
+import bisect
+import hashlib
+import gevent
 import jsonschema
+from gevent.pool import Pool
+from six.moves.urllib.parse import urlencode
 
-from flask import request, abort, make_response
-from nmoscommon.webapi import route, jsonify, traceback
+from flask import request, abort, make_response, after_this_request
+from werkzeug.exceptions import HTTPException, ServiceUnavailable
+from werkzeug.wrappers import Response
+from nmoscommon.webapi import route, on_json, jsonify, traceback, IppResponse
 
 from . import schema
 from ..modifier import RegModifier
+from ..validation import validate
+from ..jsoncodec import loads, dumps
+from ..metadata import strip_metadata, attach_metadata, split_metadata
+from ..greenlets import spawn, result, failed
+from ..availability import RETRY_AFTER
+from ..mergepatch import merge_patch, MIMETYPE as MERGE_PATCH_MIMETYPE
 
 VALID_TYPES = ['node', 'source', 'flow', 'device', "receiver", "sender"]
 REGISTRY_PORT = 2379
 NODE_SEEN_TTL = 12  # seconds until a node considered "dead".
+STALENESS_HEADER = "X-Registry-Staleness"  # seconds for which a mirrored response may be out of date
+BULK_LIMIT = 1000  # maximum number of resources in a bulk registration
+BULK_CONCURRENCY = 8  # registry writes in flight for a bulk registration
+LISTING_CHUNK = 1000  # IDs encoded at a time when streaming a listing
+PATCH_ATTEMPTS = 3  # times a patch is applied before giving up on a resource which keeps changing
+PARENTS = {
+    'device': ('nodes', 'node_id'),
+    'source': ('devices', 'device_id'),
+    'sender': ('devices', 'device_id'),
+    'receiver': ('devices', 'device_id'),
+    'flow': ('sources', 'source_id'),
+}
+
+
+def _stream_ids(ids):
+    """Encode a list of IDs as a JSON array, a chunk at a time"""
+    yield "["
+    for start in range(0, len(ids), LISTING_CHUNK):
+        yield ("," if start > 0 else "") + dumps(ids[start:start + LISTING_CHUNK])[1:-1]
+    yield "]"
 
 
 class RoutesCommon(object):
 
-    def __init__(self, logger, registry, api_version="v1.0", api_schema=schema):
+    def __init__(self, logger, registry, api_version="v1.0", api_schema=schema, liveness=None, existence=None,
+                 mirror=None, availability=None, write_buffer=None, coalescer=None,
+                 singleflight=None, id_index=None):
         self.logger = logger
         self.registry = registry
+        self.liveness = liveness
+        self.existence = existence
+        self.mirror = mirror
+        self.availability = availability
+        self.write_buffer = write_buffer
+        self.coalescer = coalescer
+        self.singleflight = singleflight
+        self.id_index = id_index
         self.modifier = RegModifier(logger=self.logger)
         self.api_version = api_version
         self.api_schema = api_schema
 
+    def _read(self, method, *args):
+        """
+        Answer a read from the mirror while it is in step with the registry,
+        and otherwise from the registry. While the registry is unavailable,
+        reads are answered from the mirror's last known state if it has one.
+        Responses answered from the mirror are marked with its staleness.
+        """
+        if self.mirror is not None and self.mirror.synced:
+            return self._read_mirror(method, *args)
+
+        if self.availability is None or self.availability.available():
+            try:
+                return self._flight(("read", method) + args, getattr(self.registry, method), *args)
+            except self.registry.RegistryUnavailable:
+                self.logger.writeWarning("Registry unavailable.")
+                if self.availability is not None:
+                    self.availability.failed()
+
+        if self.mirror is not None and self.mirror.staleness() is not None:
+            return self._read_mirror(method, *args)
+        self._unavailable()
+
+    def _flight(self, key, f, *args):
+        """Call F(*ARGS), sharing the call with any identical ones in flight"""
+        if self.singleflight is None:
+            return f(*args)
+        return self.singleflight.do(key, f, *args)
+
+    def _read_mirror(self, method, *args):
+        staleness = self.mirror.staleness()
+
+        @after_this_request
+        def mark_staleness(response):
+            response.headers[STALENESS_HEADER] = "{:.3f}".format(staleness)
+            return response
+
+        return getattr(self.mirror, method)(*args)
+
+    def _registry_available(self):
+        return self.availability is None or self.availability.available()
+
+    def _not_modified(self, index):
+        """Test whether the client holds the version written at etcd index INDEX, according to If-None-Match"""
+        # If-None-Match uses the weak comparison, so W/"<index>" matches too
+        return index is not None and request.if_none_match.contains_weak(str(index))
+
+    def _tagged(self, response, index):
+        """Mark a response with the etcd index at which its content was written, as a strong ETag"""
+        if index is not None:
+            response.set_etag(str(index))
+        return response
+
+    def _check_available(self):
+        """
+        Turn away a request which needs the registry while it is known to be
+        unavailable, unless its writes can be held until it is available again
+        """
+        if not self._registry_available() and self.write_buffer is None:
+            self._unavailable()
+
+    def _buffering(self, *keys):
+        """
+        Test whether a write to KEYS should be held: while the registry is
+        unavailable, and after that while a write to any of them is held, so
+        that it cannot overtake the write held. Writes to other keys are made
+        straight away, so the writes held only dwindle as they are replayed.
+        """
+        if self.write_buffer is None:
+            return False
+        return not self._registry_available() or any(key in self.write_buffer for key in keys)
+
+    def _resource_keys(self, resource_type, resource_data):
+        """The buffer keys a write of a resource must not overtake: its own, and its parent's"""
+        keys = [("resource", resource_type + "s", resource_data['id'])]
+        if resource_type == "node":
+            keys.append(("health", resource_data['id']))
+        if resource_type in PARENTS:
+            parent_type, parent_key = PARENTS[resource_type]
+            keys.append(("resource", parent_type, resource_data.get(parent_key)))
+        return keys
+
+    def _held(self, location=None):
+        """Acknowledge a write which has been held, but not yet made"""
+        response = Response(status=202)
+        if location is not None:
+            response.autocorrect_location_header = False
+            response.headers["Location"] = location
+        return response
+
+    def _hold_failed(self):
+        self.logger.writeWarning("Registry unavailable.")
+        if self.availability is not None:
+            self.availability.failed()
+
+    def _unavailable(self):
+        error = ServiceUnavailable("Registry unavailable")
+        # Passed on by the error handler
+        error.headers = {"Retry-After": str(self.availability.retry_after if self.availability else RETRY_AFTER)}
+        raise error
+
+    def _registry_failed(self, message):
+        self.logger.writeWarning(message)
+        if self.availability is not None:
+            self.availability.failed()
+        abort(500, "Registry unavailable")
+
+    def _resource_exists(self, resource_type, resource_id):
+        if self.write_buffer is not None:
+            held = self.write_buffer.holds(resource_type, resource_id)
+            if held is not None:
+                return held
+            if not self._registry_available():
+                # Cannot be checked until the registry is available again;
+                # any orphans will be garbage collected once it is
+                return True
+        if self.mirror is not None and self.mirror.synced:
+            return self.mirror.resource_exists(resource_type, resource_id)
+        if self.existence is not None:
+            return self.existence.exists(resource_type, resource_id)
+        return self.registry.resource_exists(resource_type, resource_id)
+
     def _ensure_parents(self, resource_type, resource):
-        if resource_type == "device":
-            if not self.registry.resource_exists("nodes", resource["node_id"]):
-                return False, "Node {} does not exist".format(resource["node_id"])
-        elif resource_type in ["receiver", "sender", "source"]:
-            if not self.registry.resource_exists("devices", resource["device_id"]):
-                return False, "Device {} does not exist".format(resource["device_id"])
-        elif resource_type == "flow":
-            if not self.registry.resource_exists("sources", resource["source_id"]):
-                return False, "Source {} does not exist".format(resource["source_id"])
+        # This may run before validation, so parent IDs may be missing
+        if resource_type in PARENTS:
+            parent_type, parent_key = PARENTS[resource_type]
+            parent_id = resource.get(parent_key)
+            if not self._resource_exists(parent_type, parent_id):
+                return False, "{} {} does not exist".format(parent_type[:-1].capitalize(), parent_id)
         return True, ""
 
-    def _add_resource(self, body):
-        """Register a resource."""
-        jobj = json.loads(body)
+    def _write(self, key, method, *args, **kwargs):
+        """
+        Make a registry write. KEY identifies what is written, so that
+        resource writes to it in quick succession may be coalesced.
+        """
+        write = getattr(self.registry, method)
+        if self.coalescer is not None:
+            # Conditional writes are made as they are, rather than being coalesced
+            if method == "put" and "prev_index" not in kwargs:
+                return self.coalescer.submit(key, write, *args, **kwargs)
+            self.coalescer.flush(key)
+        return write(*args, **kwargs)
+
+    def _put_node(self, node_id, value):
+        """
+        Write a node and its initial heartbeat concurrently. If the node
+        could not be written, any heartbeat written is removed again.
+        Returns: (registry response, heartbeat response)
+        """
+        put = spawn(self._write, ("resource", "nodes", node_id), "put", "nodes", node_id, value, port=REGISTRY_PORT)
+        hb = spawn(self._write, ("health", node_id), "put_health",
+                   node_id, int(time.time()), ttl=NODE_SEEN_TTL, port=REGISTRY_PORT)
+        gevent.joinall([put, hb])
 
-        # Put resource to registry, return HTTP response
-        try:
-            for key in ['type', 'data']:
-                if key not in jobj:
-                    abort(400, 'Attribute "{}" is mandatory for "resource" type'.format(key))
+        if failed(put) or result(put).status_code // 100 != 2:
+            if not failed(hb) and result(hb).status_code in [204, 201, 200]:
+                try:
+                    self._write(("health", node_id), "delete_health", node_id, port=REGISTRY_PORT)
+                except Exception as e:
+                    self.logger.writeWarning("could not remove initial heartbeat: {}".format(e))
 
-            # 'id' is always mandatory
-            if 'id' not in jobj['data']:
-                abort(400, 'Attribute "id" is mandatory for "node" type')
+        return result(put), result(hb)
 
-            modified = self.modifier.modify(jobj)
-            resource_type = modified['type']
-            resource_data = modified['data']
+    def _prepare_resource(self, jobj):
+        """
+        Check the mandatory attributes of a decoded registration request and
+        apply any modifications.
+        Returns: (resource type, resource data)
+        """
+        for key in ['type', 'data']:
+            if key not in jobj:
+                abort(400, 'Attribute "{}" is mandatory for "resource" type'.format(key))
 
-            if resource_type not in VALID_TYPES:
-                abort(400, 'resource: "type" attribute is malformed, expected one of {}'.format(VALID_TYPES))
+        # 'id' is always mandatory
+        if 'id' not in jobj['data']:
+            abort(400, 'Attribute "id" is mandatory for "node" type')
 
-            resource_id = resource_data['id']
-            resource_type_plural = resource_type + "s"
+        modified = self.modifier.modify(jobj)
+        resource_type = modified['type']
+        resource_data = modified['data']
 
-            # Validate against the schema
-            checker = jsonschema.FormatChecker(["ipv4", "ipv6"])
-            jsonschema.validate(resource_data, self.api_schema.SCHEMA[resource_type], format_checker=checker)
+        if resource_type not in VALID_TYPES:
+            abort(400, 'resource: "type" attribute is malformed, expected one of {}'.format(VALID_TYPES))
 
-            # Ensure any parents are present
-            ok, message = self._ensure_parents(resource_type, resource_data)
-            if not ok:
-                abort(400, message)
+        return resource_type, resource_data
+
+    def _store_resource(self, resource_type, resource_data, prev_index=None):
+        """
+        Write a validated resource to the registry. Given PREV_INDEX, the
+        resource is only written if it is unchanged since that etcd index.
+        Returns: (registry response, serialised client representation)
+        """
+        resource_id = resource_data['id']
+        resource_type_plural = resource_type + "s"
 
-            # Add in the API version we are registering with
-            resource_data['@_apiversion'] = self.api_version
+        # "@_" attributes are reserved for registry metadata, which is
+        # kept apart from the representation returned to clients
+        strip_metadata(resource_data)
+        representation = dumps(resource_data)
 
-            reg_response = self.registry.put(
-                resource_type_plural, resource_id, json.dumps(resource_data), port=REGISTRY_PORT
-            )
-            reg_response.autocorrect_location_header = False
-            reg_response.headers["Location"] = "/x-nmos/registration/{}/resource/{}/{}/".format(
-                self.api_version, resource_type_plural, resource_id
-            )
+        # Add in the API version we are registering with
+        metadata = {'@_apiversion': self.api_version}
+
+        value = attach_metadata(representation, metadata)
+
+        location = "/x-nmos/registration/{}/resource/{}/{}/".format(
+            self.api_version, resource_type_plural, resource_id
+        )
+
+        # Conditional writes cannot be held, as the condition may no longer hold
+        if prev_index is None and self._buffering(*self._resource_keys(resource_type, resource_data)):
+            return self._hold_resource(resource_type_plural, resource_id, value, location), representation
 
-            self.logger.writeInfo("register {} {}: {}".format(resource_type, resource_id, reg_response.status_code))
+        # Nodes have an initial heartbeat added alongside
+        hb_r = None
+        try:
+            if resource_type == 'node' and prev_index is None:
+                reg_response, hb_r = self._put_node(resource_id, value)
+            else:
+                kwargs = {"port": REGISTRY_PORT}
+                if prev_index is not None:
+                    kwargs["prev_index"] = prev_index
+                reg_response = self._write(("resource", resource_type_plural, resource_id), "put",
+                                           resource_type_plural, resource_id, value, **kwargs)
+        except self.registry.RegistryUnavailable:
+            if self.write_buffer is None or prev_index is not None:
+                raise
+            self._hold_failed()
+            return self._hold_resource(resource_type_plural, resource_id, value, location), representation
+
+        reg_response.autocorrect_location_header = False
+        reg_response.headers["Location"] = location
+
+        self.logger.writeInfo("register {} {}: {}".format(resource_type, resource_id, reg_response.status_code))
+
+        if self.existence is not None and reg_response.status_code // 100 == 2:
+            self.existence.added(resource_type_plural, resource_id)
+        if self.id_index is not None and reg_response.status_code // 100 == 2:
+            self.id_index.added(resource_type_plural, resource_id)
+        if self.mirror is not None and reg_response.status_code // 100 == 2:
+            self.mirror.resource_written(resource_type_plural, resource_id, reg_response)
+            if hb_r is not None and hb_r.status_code // 100 == 2:
+                self.mirror.health_written(resource_id, hb_r)
+
+        if hb_r is not None and hb_r.status_code not in [204, 201, 200]:
+            self.logger.writeWarning("could not add initial heartbeat: {}".format(hb_r))
+            return hb_r, representation
+
+        return reg_response, representation
+
+    def _hold_resource(self, resource_type, resource_id, value, location):
+        """Hold a registration until the registry is available again"""
+        if not self.write_buffer.put(resource_type, resource_id, value):
+            self._unavailable()
+        if resource_type == "nodes":
+            self.write_buffer.put_health(resource_id, int(time.time()), NODE_SEEN_TTL)
+        self.logger.writeInfo("register {} {}: held".format(resource_type[:-1], resource_id))
+        return self._held(location)
 
-            # Add an initial heartbeat if this is a node resource
-            if resource_type == 'node':
-                hb_r = self.registry.put_health(resource_id, int(time.time()), ttl=NODE_SEEN_TTL, port=REGISTRY_PORT)
-                if hb_r.status_code not in [204, 201, 200]:
-                    self.logger.writeWarning("could not add initial heartbeat: {}".format(hb_r))
-                    return hb_r
+    def _add_resource(self, body):
+        """
+        Register a resource.
+        Returns: (registry response, serialised client representation)
+        """
+        self._check_available()
+        jobj = loads(body)
 
-            return reg_response
+        # Put resource to registry, return HTTP response
+        try:
+            resource_type, resource_data = self._prepare_resource(jobj)
+
+            # Ensure any parents are present, checking while validating against the schema
+            parents = spawn(self._ensure_parents, resource_type, resource_data)
+            try:
+                validate(resource_data, self.api_schema, resource_type)
+            except jsonschema.ValidationError:
+                parents.kill()
+                raise
+
+            ok, message = result(parents)
+            if not ok:
+                abort(400, message)
+
+            return self._store_resource(resource_type, resource_data)
 
         except jsonschema.ValidationError as ex:
             self.logger.writeWarning("Validation error: {}, in {}".format(ex.message, jobj))
             abort(400, ex.message)
 
         except self.registry.RegistryUnavailable:
-            self.logger.writeWarning("Could not put resource to registry.")
-            abort(500, "Registry unavailable")
+            self._registry_failed("Could not put resource to registry.")
 
-    def _health(self, node_id):
+    def _get_resources(self, body):
         """
-        Perform health check for particular resource
+        Fetch a list of resources, each given by its type and ID, reading
+        each type requested once.
+        Returns: list of per-item results
+        """
+        items = loads(body)
+        if type(items) is not list:
+            abort(400, 'Expected a list of resources')
+        if len(items) > BULK_LIMIT:
+            abort(413, 'At most {} resources may be fetched at once'.format(BULK_LIMIT))
+        for item in items:
+            if type(item) is not dict or not isinstance(item.get('type'), six.string_types) or \
+                    not isinstance(item.get('id'), six.string_types):
+                abort(400, 'Expected a list of objects with a "type" and an "id"')
+
+        wanted = {}
+        for item in items:
+            wanted.setdefault(item['type'], []).append(item['id'])
+
+        values = {}
+        for resource_type, resource_ids in wanted.items():
+            if resource_type[:-1] in VALID_TYPES:
+                values[resource_type] = self._read("get_values", resource_type, tuple(sorted(set(resource_ids))))
+
+        results = []
+        for item in items:
+            result = {'type': item['type'], 'id': item['id']}
+            value = values.get(item['type'], {}).get(item['id'])
+            if value is None:
+                result['code'] = 404
+            else:
+                representation, _ = split_metadata(value)
+                result['code'] = 200
+                result['resource'] = loads(representation)
+            results.append(result)
+        return results
+
+    def _list(self, resource_type):
+        """
+        List the IDs of the resources of a type, in pages if a "limit" is
+        given, each starting after the ID given as "after". The response is
+        streamed, and links to the next page if there is one.
         """
+        after = request.args.get('after')
+        limit = request.args.get('limit')
+        if limit is not None:
+            try:
+                limit = int(limit)
+            except ValueError:
+                limit = 0
+            if limit < 1:
+                abort(400, '"limit" must be a positive integer')
+
+        # One more than a page is read, to find whether there is a next page
+        wanted = None if limit is None else limit + 1
+        if self.id_index is not None and self.id_index.synced:
+            ids = self.id_index.ids(resource_type, after, wanted)
+        else:
+            ids = self._read("getresources", resource_type)
+            if limit is not None or after is not None:
+                ids = sorted(ids)
+                if after is not None:
+                    ids = ids[bisect.bisect_right(ids, after):]
+                ids = ids[:wanted]
+
+        if request.accept_mimetypes.best_match(['application/json', 'text/html']) == 'text/html':
+            return ids[:limit]
+
+        response = IppResponse(_stream_ids(ids[:limit]), mimetype='application/json')
+        if limit is not None and len(ids) > limit:
+            response.headers["Link"] = '<{}?{}>; rel="next"'.format(
+                request.path, urlencode([('limit', limit), ('after', ids[limit - 1])])
+            )
+        return response
+
+    def _patch_resource(self, resource_type, resource_id, body):
+        """
+        Apply a JSON merge patch to a registered resource. The result is
+        validated and written only if the resource has not changed since it
+        was read; if it has, the patch is applied again to the new version.
+        Returns: (registry response, serialised client representation)
+        """
+        if request.mimetype != MERGE_PATCH_MIMETYPE:
+            abort(415, 'Expected Content-Type {}'.format(MERGE_PATCH_MIMETYPE))
+        # The patch applies to the registered resource, which is not known
+        # while the registry is unavailable or writes to it are held
+        if not self._registry_available() or self._buffering(("resource", resource_type, resource_id)):
+            self._unavailable()
+        if resource_type[:-1] not in VALID_TYPES:
+            abort(404)
+        patch = loads(body)
+        if type(patch) is not dict:
+            abort(400, 'Expected a JSON merge patch object')
 
-        # check node is registered
         try:
-            check_r = self.registry.get("nodes", node_id, port=REGISTRY_PORT)
+            for _ in range(PATCH_ATTEMPTS):
+                value, index = self.registry.get_value_index(resource_type, resource_id, port=REGISTRY_PORT)
+                if value is None:
+                    abort(404)
+                representation, _ = split_metadata(value)
+                existing = loads(representation)
+                patched = merge_patch(existing, patch)
+                if patched.get('id') != existing.get('id'):
+                    abort(400, 'Attribute "id" cannot be changed')
+
+                patched_type, patched_data = self._prepare_resource({'type': resource_type[:-1], 'data': patched})
+                validate(patched_data, self.api_schema, patched_type)
+                if patched_type in PARENTS and PARENTS[patched_type][1] in patch:
+                    ok, message = self._ensure_parents(patched_type, patched_data)
+                    if not ok:
+                        abort(400, message)
+
+                r, representation = self._store_resource(patched_type, patched_data, prev_index=index)
+                if r.status_code != 412:
+                    return r, representation
+                self.logger.writeDebug("patch {} {}: changed since read".format(resource_type, resource_id))
+
+            abort(409, 'Resource changed while being patched')
+
+        except jsonschema.ValidationError as ex:
+            self.logger.writeWarning("Validation error: {}, in patched {}".format(ex.message, resource_id))
+            abort(400, ex.message)
+
         except self.registry.RegistryUnavailable:
-            self.logger.writeWarning("Registry unavailable.")
-            abort(500, "Registry unavailable")
+            self._registry_failed("Could not patch resource in registry.")
+
+    def _add_resources(self, body):
+        """
+        Register an ordered list of resources, such as a node and everything
+        below it. Parents may be registered earlier in the same list.
+        Returns: list of per-item results
+        """
+        self._check_available()
+        items = loads(body)
+        if type(items) is not list:
+            abort(400, 'Expected a list of resources')
+        if len(items) > BULK_LIMIT:
+            abort(413, 'At most {} resources may be registered at once'.format(BULK_LIMIT))
+
+        results = [None] * len(items)
+        prepared = []
+        batch = {}
+
+        for index, jobj in enumerate(items):
+            try:
+                if type(jobj) is not dict:
+                    abort(400, 'Expected a resource object')
+                resource_type, resource_data = self._prepare_resource(jobj)
+                validate(resource_data, self.api_schema, resource_type)
+            except HTTPException as e:
+                results[index] = {'code': e.code, 'error': e.description}
+                continue
+            except jsonschema.ValidationError as ex:
+                self.logger.writeWarning("Validation error: {}, in {}".format(ex.message, jobj))
+                results[index] = {'code': 400, 'error': ex.message}
+                continue
+
+            # Parents registered earlier in the batch are written first;
+            # any others must already be registered
+            depth = 0
+            parent = None
+            if resource_type in PARENTS:
+                parent_type, parent_key = PARENTS[resource_type]
+                parent = batch.get((parent_type, resource_data.get(parent_key)))
+                if parent is not None:
+                    depth = parent[1] + 1
+            entry = (index, depth, resource_type, resource_data, parent)
+            prepared.append(entry)
+            batch[(resource_type + "s", resource_data['id'])] = entry
+
+        pool = Pool(BULK_CONCURRENCY)
+
+        def check(entry):
+            index, _, resource_type, resource_data, _ = entry
+            try:
+                ok, message = self._ensure_parents(resource_type, resource_data)
+            except self.registry.RegistryUnavailable:
+                if self.availability is not None:
+                    self.availability.failed()
+                ok, message = False, "Registry unavailable"
+            if not ok:
+                results[index] = {'code': 400, 'error': message}
+
+        def store(entry):
+            index, _, resource_type, resource_data, parent = entry
+            if parent is not None and results[parent[0]]['code'] // 100 != 2:
+                results[index] = {'code': 400, 'error': "{} {} was not registered".format(
+                    PARENTS[resource_type][0][:-1].capitalize(), parent[3]['id'])}
+                return
+            try:
+                r, representation = self._store_resource(resource_type, resource_data)
+            except self.registry.RegistryUnavailable:
+                self.logger.writeWarning("Could not put resource to registry.")
+                if self.availability is not None:
+                    self.availability.failed()
+                results[index] = {'code': 500, 'error': "Registry unavailable"}
+                return
+            except HTTPException as e:
+                results[index] = {'code': e.code, 'error': e.description}
+                return
+            if r.status_code // 100 == 2:
+                results[index] = {'code': r.status_code, 'location': r.headers.get("Location", "")}
+            else:
+                results[index] = {'code': r.status_code}
+
+        pool.map(check, [entry for entry in prepared if entry[4] is None])
+
+        # Write level by level, so that no child is written before its parent
+        for depth in sorted(set(entry[1] for entry in prepared)):
+            pool.map(store, [entry for entry in prepared if entry[1] == depth and results[entry[0]] is None])
 
-        if check_r is None:
+        return results
+
+    def _health(self, node_id):
+        """
+        Perform health check for particular resource
+        Returns: (status, health)
+        """
+        self._check_available()
+        now = int(time.time())
+
+        # Heartbeats from nodes known not to be registered are answered from memory
+        if self.existence is not None and not self.existence.might_exist("nodes", node_id):
             self.logger.writeDebug("heartbeat: node '{}' not registered".format(node_id))
-            return 404
+            return 404, None
+
+        if self._buffering(("health", node_id), ("resource", "nodes", node_id)):
+            return self._hold_health(node_id, now)
 
         try:
-            r = self.registry.put_health(node_id, int(time.time()), ttl=NODE_SEEN_TTL, port=REGISTRY_PORT)
-        except self.registry.RegistryUnavailable:
-            self.logger.writeWarning("Registry unavailable.")
-            abort(500, "Registry unavailable")
+            if self.liveness is not None:
+                health = self.liveness.heartbeat(node_id, now)
+                if health is not None:
+                    return 204, health
+
+            # A node which is registered and alive has a health key, so in the
+            # common case a single conditional write does the whole job
+            r = self._write(("health", node_id), "put_health",
+                            node_id, now, ttl=NODE_SEEN_TTL, prev_exist=True, port=REGISTRY_PORT)
+
+            if r.status_code == 404:
+                # Health has expired, but the node may not have been garbage
+                # collected yet
+                if not self._resource_exists("nodes", node_id):
+                    self.logger.writeDebug("heartbeat: node '{}' not registered".format(node_id))
+                    return 404, None
+                r = self._write(("health", node_id), "put_health", node_id, now, ttl=NODE_SEEN_TTL, port=REGISTRY_PORT)
 
-        if r.status_code == 404:
-            data = json.loads(r.data)
-            if 'errorCode' in data:
-                if int(data['errorCode']) == 100:  # key does not exist, so node has been culled
-                    self.logger.writeDebug("heartbeat: node '{}' did not exist".format(node_id))
-                    return 404
+        except self.registry.RegistryUnavailable:
+            if self.write_buffer is None:
+                self._registry_failed("Registry unavailable.")
+            self._hold_failed()
+            return self._hold_health(node_id, now)
 
-        elif r.status_code not in [201, 200]:
+        if r.status_code not in [201, 200]:
             self.logger.writeWarning("couldn't register heartbeat ({}: {})".format(r.status_code, r.reason))
-            return 404
+            return 404, None
+
+        if self.mirror is not None:
+            self.mirror.health_written(node_id, r)
+
+        return 204, loads(r.content).get("node", {}).get("value", str(now))
 
-        return 204
+    def _hold_health(self, node_id, now):
+        """Hold a heartbeat until the registry is available again, if its node is known to be registered"""
+        if not self._node_known(node_id):
+            self.logger.writeDebug("heartbeat: node '{}' not known to be registered".format(node_id))
+            return 404, None
+        if not self.write_buffer.put_health(node_id, now, NODE_SEEN_TTL):
+            self._unavailable()
+        return 204, str(now)
+
+    def _node_known(self, node_id):
+        """
+        Test whether a node is registered while writes are held, from the
+        writes held, the mirror's last known state, or the registry if it is
+        available. A node which cannot be found is not known, so that it
+        registers again rather than having health held without a node.
+        """
+        held = self.write_buffer.holds("nodes", node_id)
+        if held is not None:
+            return held
+        if self.mirror is not None and self.mirror.staleness() is not None:
+            return self.mirror.resource_exists("nodes", node_id)
+        if self._registry_available():
+            try:
+                if self.existence is not None:
+                    return self.existence.exists("nodes", node_id)
+                return self.registry.resource_exists("nodes", node_id)
+            except self.registry.RegistryUnavailable:
+                self._hold_failed()
+        return False
+
+    def _health_result(self, node_id):
+        """
+        Perform health check for particular resource
+        Returns: result for the node, as reported by the bulk and websocket endpoints
+        """
+        try:
+            status, health = self._health(node_id)
+        except HTTPException as e:
+            return {'id': node_id, 'code': e.code, 'error': e.description}
+        if status != 204:
+            return {'id': node_id, 'code': status}
+        return {'id': node_id, 'code': status, 'health': health}
+
+    def _healths(self, body):
+        """
+        Perform health checks for a list of nodes
+        Returns: list of per-node results
+        """
+        self._check_available()
+        node_ids = loads(body)
+        if type(node_ids) is not list or not all(isinstance(x, six.string_types) for x in node_ids):
+            abort(400, 'Expected a list of node IDs')
+        if len(node_ids) > BULK_LIMIT:
+            abort(413, 'At most {} heartbeats may be sent at once'.format(BULK_LIMIT))
+
+        return list(Pool(BULK_CONCURRENCY).imap(self._health_result, node_ids))
 
     def _delete(self, resource_type, resource_id):
         """
         Delete a particular resource from the registry
         """
+        self._check_available()
         # TODO: there is an issue here; when a node is deleted, do we
         # tidy up it's resources?  Assume for now: (1) the facade has
         # cleaned up any resources it registered (in a clean shutdown)
@@ -157,13 +704,56 @@ class RoutesCommon(object):
         # the node health check and act accordingly.
         # Stale data will still need to be cleaned up eventually.
         self.logger.writeInfo("unregister {} {}".format(resource_type, resource_id))
+        if self._buffering(("resource", resource_type, resource_id), ("health", resource_id)):
+            return self._hold_delete(resource_type, resource_id)
         try:
-            r = self.registry.delete(resource_type, resource_id, port=REGISTRY_PORT)
+            r = self._write(("resource", resource_type, resource_id), "delete",
+                            resource_type, resource_id, port=REGISTRY_PORT)
+            if self.existence is not None:
+                self.existence.removed(resource_type, resource_id)
+            if self.mirror is not None and r.status_code // 100 == 2:
+                self.mirror.resource_deleted(resource_type, resource_id, r)
+            if self.id_index is not None and r.status_code // 100 == 2:
+                self.id_index.removed(resource_type, resource_id)
+            if resource_type == "nodes" and r.status_code // 100 == 2:
+                # Heartbeats rely on the health key only existing for registered nodes
+                if self.liveness is not None:
+                    self.liveness.forget(resource_id)
+                self._write(("health", resource_id), "delete_health", resource_id, port=REGISTRY_PORT)
         except self.registry.RegistryUnavailable:
-            self.logger.writeWarning("Couldn't delete resource. Registry unavailable.")
-            abort(500, "Registry unavailable")
+            if self.write_buffer is None:
+                self._registry_failed("Couldn't delete resource. Registry unavailable.")
+            self._hold_failed()
+            return self._hold_delete(resource_type, resource_id)
         return r
 
+    def _hold_delete(self, resource_type, resource_id):
+        """Hold a removal until the registry is available again"""
+        if not self.write_buffer.delete(resource_type, resource_id):
+            self._unavailable()
+        if self.existence is not None:
+            self.existence.removed(resource_type, resource_id)
+        return self._held()
+
+    def on_websocket_connect(self, func):
+        """
+        Wrap the handler for messages on a websocket, keeping the connection
+        open when a message is malformed.
+        """
+        def handler(ws, **kwargs):
+            while True:
+                try:
+                    message = ws.receive()
+                except Exception:
+                    message = None
+                if message is None:
+                    break
+                try:
+                    func(ws, message, **kwargs)
+                except ValueError:
+                    ws.send(dumps({'code': 400, 'error': 'Malformed message'}))
+        return handler
+
     @route('/')
     def __versionroot(self):
         return ['resource/', 'health/']
@@ -171,17 +761,13 @@ class RoutesCommon(object):
     @route('/resource', methods=['GET', 'POST'], auto_json=False)
     def __resource(self):
         if request.method == 'POST':
-            req_data = request.get_data()
-            if type(req_data) is not str:
-                req_data = req_data.decode('utf-8')
-            r = self._add_resource(req_data)
+            body = request.get_data()
+            # Retries of a registration still in flight share its result; the
+            # same body registered through another API version is stored differently
+            r, representation = self._flight(("POST", "resource", self.api_version, hashlib.sha1(body).hexdigest()),
+                                             self._add_resource, body)
             if r.status_code // 100 == 2:
-                representation = json.loads(r.json()["node"]["value"])
-                # strip out any metadata
-                remove_keys = (x for x in list(representation) if x.startswith("@_"))
-                for k in remove_keys:
-                    del representation[k]
-                response = make_response(jsonify(representation), r.status_code)
+                response = IppResponse(representation, status=r.status_code, mimetype='application/json')
                 response.autocorrect_location_header = False
                 response.headers["Location"] = r.headers.get("Location", "")
                 return response
@@ -192,54 +778,99 @@ class RoutesCommon(object):
         else:
             return make_response(jsonify(["{}s/".format(x) for x in VALID_TYPES]), 200)
 
+    @route('/bulk/resource', methods=['POST'])
+    def __bulk_resource(self):
+        return self._add_resources(request.get_data())
+
+    @route('/bulk/get', methods=['POST'])
+    def __bulk_get(self):
+        return self._get_resources(request.get_data())
+
+    @route('/bulk/health/nodes', methods=['POST'])
+    def __bulk_health(self):
+        return self._healths(request.get_data())
+
     @route('/resource/<resource_type>')
     def __resource_type(self, resource_type):
         try:
-            r = self.registry.getresources(resource_type)
+            return self._list(resource_type)
+        except HTTPException:
+            raise
         except Exception:
             traceback.print_exc()
             raise
-        return r
 
-    @route('/resource/<resource_type>/<rname>', methods=['GET', 'DELETE'])
+    @route('/resource/<resource_type>/<rname>', methods=['GET', 'DELETE', 'PATCH'])
     def __resource_type_name(self, resource_type, rname):
-        if request.method == 'DELETE':
+        if request.method == 'PATCH':
+            r, representation = self._patch_resource(resource_type, rname, request.get_data())
+            if r.status_code // 100 == 2:
+                return IppResponse(representation, mimetype='application/json')
+            abort(r.status_code)
+        elif request.method == 'DELETE':
             r = self._delete(resource_type, rname)
+            if r.status_code == 202:
+                # Held until the registry is available again
+                return (202, '')
             if r.status_code // 100 == 2:
                 return (204, '')
             abort(r.status_code)
         else:
             try:
-                r = self.registry.get(resource_type, rname)
+                value, index = self._read("get_value_index", resource_type, rname)
+            except HTTPException:
+                raise
             except Exception:
                 traceback.print_exc()
                 raise
 
-            if r is None:
+            if value is None:
                 abort(404)
-            return r
+
+            # Pass the stored representation straight through unless the
+            # client wants the HTML rendering
+            representation, _ = split_metadata(value)
+            if request.accept_mimetypes.best_match(['application/json', 'text/html']) == 'text/html':
+                return loads(representation)
+            if self._not_modified(index):
+                return self._tagged(IppResponse(status=304), index)
+            return self._tagged(IppResponse(representation, mimetype='application/json'), index)
 
     @route('/health/')
     def __health(self):
         return ['nodes/', ]
 
+    @on_json('/health/socket')
+    def __health_socket(self, ws, message):
+        # Each message is a node ID, or a list of them, to heartbeat
+        node_ids = message if type(message) is list else [message]
+        for node_id in node_ids:
+            if not isinstance(node_id, six.string_types):
+                raise ValueError(node_id)
+        for node_id in node_ids:
+            ws.send(dumps(self._health_result(node_id)))
+
     @route('/health/nodes/')
     def __health_type(self):
-        return self.registry.getresources('nodes')
+        return self._list("nodes")
 
     @route('/health/nodes/<k>', methods=['GET', 'POST'])
     def __health_type_name(self, k):
         if request.method == 'POST':
-            r = self._health(k)
-            if r != 204:
+            status, health = self._health(k)
+            if status != 204:
                 abort(404)
+            return {'health': health}
 
-        try:
-            health = self.registry.get_health(k, port=REGISTRY_PORT)
-        except self.registry.RegistryUnavailable:
-            abort(500, "Registry unavailable")
+        if self.liveness is not None:
+            health = self.liveness.get_health(k)
+            if health is not None:
+                return {'health': health}
+
+        health, index = self._read("get_health_value_index", k)
 
         if health is None:
             abort(404)
-        else:
-            return {'health': health}
+        if self._not_modified(index):
+            return self._tagged(IppResponse(status=304), index)
+        return self._tagged(make_response(jsonify({'health': health}), 200), index)
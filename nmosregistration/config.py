@@ -26,7 +26,20 @@ CONFIG_DEFAULTS = {
     "priority": 100,
     "https_mode": "disabled",
     "enable_mdns": True,
-    "oauth_mode": False
+    "oauth_mode": False,
+    "heartbeat_refresh_factor": 1,
+    "heartbeat_refresh_workers": 4,
+    "existence_cache": True,
+    "udp_heartbeat_port": None,
+    "udp_heartbeat_key": None,
+    "registry_mirror": False,
+    "unavailable_threshold": 3,
+    "unavailable_window": 5,
+    "write_buffer_size": 0,
+    "write_buffer_file": None,
+    "coalesce_window": 0,
+    "singleflight": False,
+    "id_index": False
 }
 
 config = {}
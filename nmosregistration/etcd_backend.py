@@ -19,11 +19,12 @@ monkey.patch_all()
 
 import requests # noqa E402
 from requests.adapters import TimeoutSauce # noqa E402
-import json # noqa E402
+from requests.packages.urllib3.exceptions import ReadTimeoutError # noqa E402
 import gevent # noqa E402
 from six.moves.urllib.parse import urlencode # noqa E402
 
 from .etcd_util import etcd_unpack # noqa E402
+from .jsoncodec import loads # noqa E402
 
 
 # Set global timeout
@@ -36,6 +37,8 @@ class MyTimeout(TimeoutSauce):
 
 requests.adapters.TimeoutSauce = MyTimeout
 
+WATCH_TIMEOUT = 60  # seconds to wait for a change before re-issuing a watch
+
 
 def _prune_empty_branches(key, port=2379):
     """
@@ -49,7 +52,7 @@ def _prune_empty_branches(key, port=2379):
         url = "http://localhost:{}/v2/keys/{}".format(port, k)
         r = requests.get(url, proxies={'http': ''})
         if r.status_code == 200:
-            obj = r.json().get("node", {})
+            obj = loads(r.content).get("node", {})
             if obj.get("dir", False):
                 if "nodes" not in obj or len(obj["nodes"]) == 0:
                     requests.delete("{}?dir=true".format(url), proxies={'http': ''})
@@ -62,11 +65,13 @@ class EtcdInterface(object):
 
     # TODO: there is a lot of generality in the below...
 
-    def put(self, rtype, rkey, value, ttl=None, port=2379):
+    def put(self, rtype, rkey, value, ttl=None, prev_index=None, port=2379):
         assert(rtype.endswith('s'))   # ensure that type is pluralised
         data = {"value": value}
         if ttl:
             data['ttl'] = ttl
+        if prev_index is not None:
+            data['prevIndex'] = prev_index
         headers = {"content-type": "application/x-www-form-urlencoded"}
         url = "http://localhost:{}/v2/keys/resource/{}/{}".format(port, rtype, rkey)
         try:
@@ -88,41 +93,83 @@ class EtcdInterface(object):
         assert(rtype.endswith('s'))   # ensure that type is pluralised
         url = "http://localhost:{}/v2/keys/resource/{}".format(port, rtype)
         try:
-            etcd_nodes = requests.get(url, proxies={'http': ''}).json().get('node', {'nodes': []}).get('nodes', [])
+            r = requests.get(url, proxies={'http': ''})
+            etcd_nodes = loads(r.content).get('node', {'nodes': []}).get('nodes', [])
             keys = [x['key'].split('/')[-1] for x in etcd_nodes if 'key' in x]
         except (requests.ConnectionError, requests.HTTPError, requests.Timeout):
             raise self.RegistryUnavailable
         return keys
 
     def get(self, rtype, rkey, port=2379):
+        value = self.get_value(rtype, rkey, port=port)
+        if value is None:
+            return
+        else:
+            return loads(value)
+
+    def get_value(self, rtype, rkey, port=2379):
+        """Return the stored value of a resource without decoding it, or None if it does not exist"""
         assert(rtype.endswith('s'))   # ensure that type is pluralised
         url = "http://localhost:{}/v2/keys/resource/{}/{}?recursive=true".format(port, rtype, rkey)
         try:
-            r = requests.get(url, proxies={'http': ''}).json().get('node', {'value': None}).get('value', None)
+            r = requests.get(url, proxies={'http': ''})
         except (requests.ConnectionError, requests.HTTPError, requests.Timeout):
             raise self.RegistryUnavailable
-        if r is None:
-            return
-        else:
-            return json.loads(r)
+        return loads(r.content).get('node', {'value': None}).get('value', None)
+
+    def get_value_index(self, rtype, rkey, port=2379):
+        """Return the stored value of a resource and its modifiedIndex, or (None, None) if it does not exist"""
+        assert(rtype.endswith('s'))   # ensure that type is pluralised
+        url = "http://localhost:{}/v2/keys/resource/{}/{}".format(port, rtype, rkey)
+        try:
+            r = requests.get(url, proxies={'http': ''})
+        except (requests.ConnectionError, requests.HTTPError, requests.Timeout):
+            raise self.RegistryUnavailable
+
+        if r.status_code != 200:
+            return None, None
+        node = loads(r.content).get("node", {})
+        return node.get("value", None), node.get("modifiedIndex", None)
+
+    def get_values(self, rtype, rkeys, port=2379):
+        """
+        Return the stored values of those resources of a type in RKEYS which
+        exist, as a dict, from a single read of the type
+        """
+        assert(rtype.endswith('s'))   # ensure that type is pluralised
+        url = "http://localhost:{}/v2/keys/resource/{}?recursive=true".format(port, rtype)
+        try:
+            r = requests.get(url, proxies={'http': ''})
+        except (requests.ConnectionError, requests.HTTPError, requests.Timeout):
+            raise self.RegistryUnavailable
+
+        wanted = set(rkeys)
+        values = {}
+        for node in loads(r.content).get('node', {}).get('nodes', []):
+            rkey = node.get('key', '').split('/')[-1]
+            if rkey in wanted and 'value' in node:
+                values[rkey] = node['value']
+        return values
 
     def get_all(self, rtype, port=2379):
         try:
             assert(rtype.endswith('s'))   # ensure that type is pluralised
             url = "http://localhost:{}/v2/keys/resource/{}/?recursive=true".format(port, rtype)
-            r = requests.get(url, proxies={'http': ''}).json()
+            r = loads(requests.get(url, proxies={'http': ''}).content)
             resources = r.get('node', {}).get('nodes', [])
-            return [json.loads(x.get('value')) for x in resources]
+            return [loads(x.get('value')) for x in resources]
 
         except (requests.ConnectionError, requests.HTTPError, requests.Timeout):
             raise self.RegistryUnavailable
 
     # Health
 
-    def put_health(self, rkey, value, ttl=None, port=2379):
+    def put_health(self, rkey, value, ttl=None, prev_exist=None, port=2379):
         data = {"value": value}
         if ttl:
             data['ttl'] = ttl
+        if prev_exist is not None:
+            data['prevExist'] = "true" if prev_exist else "false"
         headers = {"content-type": "application/x-www-form-urlencoded"}
         url = "http://localhost:{}/v2/keys/health/{}".format(port, rkey)
         try:
@@ -131,11 +178,34 @@ class EtcdInterface(object):
             raise self.RegistryUnavailable
         return r
 
+    def refresh_health(self, rkey, ttl, prev_index=None, port=2379):
+        """Extend the TTL of an existing health key without changing its value"""
+        data = {"ttl": ttl, "refresh": "true", "prevExist": "true"}
+        if prev_index is not None:
+            data['prevIndex'] = prev_index
+        headers = {"content-type": "application/x-www-form-urlencoded"}
+        url = "http://localhost:{}/v2/keys/health/{}".format(port, rkey)
+        try:
+            r = requests.put(url, urlencode(data), headers=headers, proxies={'http': ''})
+        except (requests.ConnectionError, requests.HTTPError, requests.Timeout):
+            raise self.RegistryUnavailable
+        return r
+
+    def delete_health(self, rkey, prev_index=None, port=2379):
+        url = "http://localhost:{}/v2/keys/health/{}".format(port, rkey)
+        if prev_index is not None:
+            url += "?prevIndex={}".format(prev_index)
+        try:
+            r = requests.delete(url, proxies={'http': ''})
+        except (requests.ConnectionError, requests.HTTPError, requests.Timeout):
+            raise self.RegistryUnavailable
+        return r
+
     def get_healths(self, port=2379):
         url = "http://localhost:{}/v2/keys/health/?recursive=true".format(port)
         try:
             r = requests.get(url, proxies={'http': ''})
-            return etcd_unpack(r.json())
+            return etcd_unpack(loads(r.content))
         except (requests.ConnectionError, requests.HTTPError, requests.Timeout):
             raise self.RegistryUnavailable
 
@@ -148,7 +218,20 @@ class EtcdInterface(object):
 
         if r is None:
             return None
-        return r.json().get("node", {}).get("value", None)
+        return loads(r.content).get("node", {}).get("value", None)
+
+    def get_health_value_index(self, rkey, port=2379):
+        """Return the value of a health key and its modifiedIndex, or (None, None) if it does not exist"""
+        url = "http://localhost:{}/v2/keys/health/{}".format(port, rkey)
+        try:
+            r = requests.get(url, proxies={'http': ''})
+        except (requests.ConnectionError, requests.HTTPError, requests.Timeout):
+            raise self.RegistryUnavailable
+
+        if r.status_code != 200:
+            return None, None
+        node = loads(r.content).get("node", {})
+        return node.get("value", None), node.get("modifiedIndex", None)
 
     def put_garbage_collection_flag(self, host, ttl, port=2379):
         # See https://github.com/coreos/etcd/blob/master/Documentation/api.md#atomic-compare-and-swap
@@ -189,6 +272,36 @@ class EtcdInterface(object):
         except (requests.ConnectionError, requests.HTTPError, requests.Timeout):
             raise self.RegistryUnavailable
 
+    def watch(self, rkey, wait_index=None, timeout=WATCH_TIMEOUT, port=2379):
+        """
+        Wait for the next change at or below RKEY.
+        Returns: (index, response), where RESPONSE is None if nothing changed
+        within TIMEOUT seconds. INDEX is the etcd index when the watch began,
+        from the headers etcd sends straight away, so that if nothing changed,
+        the next watch can wait from there rather than from an index which
+        etcd may since have forgotten. It is None if it is not known.
+        """
+        url = "http://localhost:{}/v2/keys/{}?wait=true&recursive=true".format(port, rkey)
+        if wait_index is not None:
+            url += "&waitIndex={}".format(wait_index)
+        try:
+            r = requests.get(url, proxies={'http': ''}, timeout=(0.5, timeout), stream=True)
+        except requests.ReadTimeout:
+            return None, None
+        except (requests.ConnectionError, requests.HTTPError, requests.Timeout):
+            raise self.RegistryUnavailable
+
+        index = r.headers.get("X-Etcd-Index")
+        index = int(index) if index is not None else None
+        try:
+            r.content
+        except requests.ConnectionError as e:
+            r.close()
+            if len(e.args) > 0 and isinstance(e.args[0], ReadTimeoutError):
+                return index, None
+            raise self.RegistryUnavailable
+        return index, r
+
     def resource_exists(self, resource_type, resource_id, port=2379):
         """Test if a resource exists in the datastore"""
         url = "http://localhost:{}/v2/keys/resource/{}/{}".format(port, resource_type, resource_id)
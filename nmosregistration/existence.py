@@ -0,0 +1,167 @@
+# Copyright 2019 British Broadcasting Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Cache of which parent resources (nodes, devices and sources) exist, used for
+parent checks and heartbeats.
+
+Entries are filled on demand and by local writes, and invalidated by a watch
+on the registry so that changes made by other aggregators, or by the garbage
+collector, are seen. While the watch is not in step with the registry the
+cache is bypassed.
+
+Registered node IDs are also held in a Bloom filter, loaded from the registry
+whenever the watch starts following it and added to on every new registration
+seen, so that heartbeats from nodes which are not registered can be turned
+away without a registry request.
+"""
+
+import time
+import gevent
+from collections import OrderedDict
+
+from .bloom import BloomFilter
+
+PARENT_TYPES = ["nodes", "devices", "sources"]
+NEGATIVE_CACHE_SIZE = 10000
+NEGATIVE_TTL = 5  # seconds for which a missing parent is remembered
+NODE_FILTER_CAPACITY = 100000  # minimum number of node IDs the filter is sized for
+
+
+class ExistenceCache(object):
+
+    def __init__(self, registry, watcher, negative_size=NEGATIVE_CACHE_SIZE, negative_ttl=NEGATIVE_TTL):
+        self.registry = registry
+        self.watcher = watcher
+        self.negative_size = negative_size
+        self.negative_ttl = negative_ttl
+        self._present = {rtype: set() for rtype in PARENT_TYPES}
+        self._absent = OrderedDict()
+        self._generation = 0
+        self._nodes = None
+        self._nodes_loading = None
+        self._loads = 0
+        watcher.subscribe(self._on_event, self._on_reset)
+
+    def might_exist(self, rtype, rid):
+        """
+        Test, from memory alone, whether a resource could exist. False means
+        it certainly does not; True means it must be looked up.
+        """
+        if rtype not in self._present or not self.watcher.synced:
+            return True
+
+        if rid in self._present[rtype]:
+            return True
+
+        expiry = self._absent.get((rtype, rid))
+        if expiry is not None and expiry > time.time():
+            return False
+
+        if rtype == "nodes" and self._nodes is not None:
+            return rid in self._nodes
+        return True
+
+    def exists(self, rtype, rid):
+        """Test if a resource exists, consulting the registry only on a cache miss"""
+        if rtype not in self._present or not self.watcher.synced:
+            return self.registry.resource_exists(rtype, rid)
+
+        if rid in self._present[rtype]:
+            return True
+
+        expiry = self._absent.get((rtype, rid))
+        if expiry is not None:
+            if expiry > time.time():
+                return False
+            del self._absent[(rtype, rid)]
+
+        # Only trust the answer if nothing was removed while it was fetched
+        generation = self._generation
+        found = self.registry.resource_exists(rtype, rid)
+        if generation == self._generation and self.watcher.synced:
+            if found:
+                self._present[rtype].add(rid)
+            else:
+                self._absent[(rtype, rid)] = time.time() + self.negative_ttl
+                while len(self._absent) > self.negative_size:
+                    self._absent.popitem(last=False)
+        return found
+
+    def added(self, rtype, rid):
+        if rtype in self._present:
+            self._absent.pop((rtype, rid), None)
+            if self.watcher.synced:
+                self._present[rtype].add(rid)
+        if rtype == "nodes":
+            if self._nodes_loading is not None:
+                self._nodes_loading.append(rid)
+            if self._nodes is not None and rid not in self._nodes:
+                # Only IDs new to the filter count towards its capacity: a local
+                # write is seen again from the watch, and nodes re-register
+                self._nodes.add(rid)
+                if self._nodes.count > self._nodes.capacity and self._nodes_loading is None:
+                    # The false positive rate is climbing, so start again with a larger filter
+                    self._load_nodes()
+
+    def removed(self, rtype, rid):
+        if rtype in self._present:
+            self._generation += 1
+            self._present[rtype].discard(rid)
+
+    def _on_event(self, action, key, node, prev_node):
+        if len(key) == 0 or key[0] not in self._present:
+            return
+        if action in ["delete", "expire", "compareAndDelete"]:
+            if len(key) == 1:
+                # The whole type has gone
+                self._generation += 1
+                self._present[key[0]].clear()
+            else:
+                self.removed(key[0], key[1])
+        elif len(key) == 2:
+            self.added(key[0], key[1])
+
+    def _on_reset(self, index, root=None):
+        self._generation += 1
+        for present in self._present.values():
+            present.clear()
+        self._absent.clear()
+        self._nodes = None
+        self._nodes_loading = None
+        self._loads += 1
+        if index is not None:
+            self._load_nodes()
+
+    def _load_nodes(self):
+        """Build a new filter of node IDs from the registry, in the background"""
+        self._loads += 1
+        self._nodes_loading = []
+        gevent.spawn(self._fill_nodes, self._loads)
+
+    def _fill_nodes(self, load):
+        try:
+            node_ids = self.registry.getresources("nodes")
+        except self.registry.RegistryUnavailable:
+            node_ids = None
+        if load != self._loads or node_ids is None:
+            # Reset while loading, or the watch will reset shortly anyway
+            return
+
+        node_ids.extend(self._nodes_loading)
+        nodes = BloomFilter(max(NODE_FILTER_CAPACITY, 2 * len(node_ids)))
+        for rid in node_ids:
+            nodes.add(rid)
+        self._nodes = nodes
+        self._nodes_loading = None
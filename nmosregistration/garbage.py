@@ -75,6 +75,22 @@ class GarbageCollect(object):
             gevent.spawn_later(INTERVAL, self.garbage_collect)
             self.logger.writeDebug("scheduled...")
 
+    def node_expired(self, node_id):
+        """
+        Remove a node as soon as its health has expired, rather than waiting
+        for the next collection. Its resources are removed by that collection.
+        The node is kept if it has health again, written by another instance.
+        """
+        try:
+            health, _ = self.registry.get_health_value_index(node_id)
+            if health is not None:
+                self.logger.writeDebug("expired node {} has been heard from since".format(node_id))
+                return
+            self.logger.writeInfo("removing expired node: {}".format(node_id))
+            self.registry.delete("nodes", node_id)
+        except self.registry.RegistryUnavailable:
+            self.logger.writeWarning("registry unavailable, node {} left for collection".format(node_id))
+
     def _collect(self):
         try:
             self.logger.writeDebug("Collecting: {}".format(self.identifier))
@@ -104,6 +120,11 @@ class GarbageCollect(object):
             # TODO: already have this above...
             kill_q = [('nodes', node_id) for node_id in nodes if node_id not in alive_nodes]
 
+            # Heartbeats are only answered while a node has a health key, so any
+            # health key left behind by a node's removal must go too
+            registered = set(nodes)
+            orphaned_healths = [node_id for node_id in alive_nodes if node_id not in registered]
+
             # Create a list of (type, id) pairs of resources that should be removed.
             to_kill = []
 
@@ -128,6 +149,10 @@ class GarbageCollect(object):
                 self.logger.writeInfo("removing resource: {}/{}".format(resource_type, resource_id))
                 self.registry.delete(resource_type, resource_id)
 
+            for node_id in orphaned_healths:
+                self.logger.writeInfo("removing health of unregistered node: {}".format(node_id))
+                self.registry.delete_health(node_id)
+
         except self.registry.RegistryUnavailable:
             self.logger.writeWarning("registry unavailable")
 
@@ -0,0 +1,48 @@
+# Copyright 2019 British Broadcasting Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Helpers for running independent backend operations concurrently. Failures are
+captured in the greenlet and re-raised in whoever collects the result, rather
+than being reported by the gevent hub.
+"""
+
+import gevent
+
+
+def _capture(f, args, kwargs):
+    try:
+        return f(*args, **kwargs), None
+    except Exception as e:
+        return None, e
+
+
+def spawn(f, *args, **kwargs):
+    """Start F(*ARGS, **KWARGS) in a new greenlet and let it run until it blocks"""
+    greenlet = gevent.spawn(_capture, f, args, kwargs)
+    gevent.sleep(0)
+    return greenlet
+
+
+def result(greenlet):
+    """Wait for a greenlet started by spawn(), returning its result or raising its exception"""
+    value, error = greenlet.get()
+    if error is not None:
+        raise error
+    return value
+
+
+def failed(greenlet):
+    """Test if a finished greenlet started by spawn() raised an exception"""
+    return greenlet.value[1] is not None
@@ -0,0 +1,122 @@
+# Copyright 2019 British Broadcasting Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+An index of the IDs of the registered resources of each type, kept in sorted
+order so that listings can be answered a page at a time without reading any
+resource bodies.
+
+The index is loaded from the registry whenever the watcher (re)starts following
+it, and kept up to date from the watch after that, and from writes made by this
+instance as they are made, so that a resource can be listed as soon as it has
+been registered. Changes seen while it is loading are applied once it has
+loaded. While the watcher is not in step with the registry, the index is not
+used.
+"""
+
+import bisect
+import gevent
+
+RESOURCE_TYPES = ["nodes", "devices", "sources", "flows", "senders", "receivers"]
+REMOVALS = ["delete", "expire", "compareAndDelete"]
+
+
+class IdIndex(object):
+
+    def __init__(self, registry, watcher, types=RESOURCE_TYPES):
+        self.registry = registry
+        self.watcher = watcher
+        self.types = types
+        self._ids = None
+        self._pending = None
+        self._loads = 0
+        watcher.subscribe(self._on_event, self._on_reset)
+
+    @property
+    def synced(self):
+        return self._ids is not None and self.watcher.synced
+
+    def ids(self, rtype, after=None, limit=None):
+        """Return the IDs of a type in order, starting after the ID AFTER, and at most LIMIT of them"""
+        ids = self._ids.get(rtype, [])
+        start = 0 if after is None else bisect.bisect_right(ids, after)
+        end = len(ids) if limit is None else start + limit
+        return ids[start:end]
+
+    def added(self, rtype, rid):
+        """Apply a registration made by this instance straight away, before the watch reports it"""
+        self._on_event("set", [rtype, rid], {}, None)
+
+    def removed(self, rtype, rid):
+        self._on_event("delete", [rtype, rid], {}, None)
+
+    def _on_event(self, action, key, node, prev_node):
+        if self._pending is not None:
+            self._pending.append((action, key))
+        elif self._ids is not None:
+            self._apply(action, key)
+
+    def _apply(self, action, key):
+        if len(key) == 0:
+            if action in REMOVALS:
+                self._ids = {rtype: [] for rtype in self.types}
+        elif key[0] not in self._ids:
+            return
+        elif len(key) == 1:
+            if action in REMOVALS:
+                self._ids[key[0]] = []
+        elif len(key) == 2:
+            ids = self._ids[key[0]]
+            position = bisect.bisect_left(ids, key[1])
+            present = position < len(ids) and ids[position] == key[1]
+            if action in REMOVALS:
+                if present:
+                    del ids[position]
+            elif not present:
+                ids.insert(position, key[1])
+
+    def _on_reset(self, index, root=None):
+        self._ids = None
+        self._pending = None
+        self._loads += 1
+        if index is None:
+            return
+        if root is not None:
+            # The watcher has read the whole keyspace already
+            ids = {rtype: [] for rtype in self.types}
+            for type_node in root.get("nodes", []):
+                rtype = type_node["key"].split("/")[-1]
+                if rtype in ids:
+                    ids[rtype] = sorted(node["key"].split("/")[-1] for node in type_node.get("nodes", []))
+            self._ids = ids
+        else:
+            self._pending = []
+            gevent.spawn(self._load, self._loads)
+
+    def _load(self, load):
+        ids = {}
+        try:
+            for rtype in self.types:
+                ids[rtype] = sorted(self.registry.getresources(rtype))
+        except self.registry.RegistryUnavailable:
+            # The watch will reset shortly anyway
+            return
+        if load != self._loads:
+            return
+
+        pending = self._pending
+        self._ids = ids
+        self._pending = None
+        for action, key in pending:
+            self._apply(action, key)
@@ -0,0 +1,57 @@
+# Copyright 2019 British Broadcasting Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+JSON encoding and decoding for request bodies and etcd values. Uses orjson or
+ujson where installed, falling back to the standard library json module.
+
+loads() accepts str or bytes. dumps() returns str.
+"""
+
+# Handle if neither of the faster JSON libraries is installed
+try:
+    import orjson
+
+    CODEC = "orjson"
+
+    def loads(s):
+        return orjson.loads(s)
+
+    def dumps(obj):
+        return orjson.dumps(obj).decode('utf-8')
+
+except ImportError:
+    try:
+        import ujson
+
+        CODEC = "ujson"
+
+        def loads(s):
+            return ujson.loads(s)
+
+        def dumps(obj):
+            return ujson.dumps(obj, escape_forward_slashes=False)
+
+    except ImportError:
+        import json
+
+        CODEC = "json"
+
+        def loads(s):
+            if type(s) is bytes:
+                s = s.decode('utf-8')
+            return json.loads(s)
+
+        def dumps(obj):
+            return json.dumps(obj)
@@ -0,0 +1,258 @@
+# Copyright 2019 British Broadcasting Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+In-process absorption of node heartbeats.
+
+Without this, every heartbeat rewrites the node's health key with a short TTL,
+costing a raft commit per heartbeat. Here the health key is written with a TTL
+of several heartbeat periods (the "hold") and heartbeats are recorded in
+memory. The key's TTL is refreshed only as it nears expiry, and when a node
+stops heartbeating the key is removed once the usual TTL has passed since its
+last heartbeat, so other readers see the same expiry as before.
+
+An instance only absorbs heartbeats for health keys it holds, i.e. those whose
+etcd modifiedIndex is the one it last wrote. Absorbing a heartbeat makes no
+request to the registry: writes to the health keys by other instances are
+followed from a watch, and a key another instance has written or removed is
+no longer held, so the node's next heartbeat is written through. While the
+watch is out of step, heartbeats are written through too, and once it is back
+in step the held keys are reconciled with the registry. Refreshes and removals
+are conditional on the held index, so instances sharing a cluster never
+shorten or remove a key another instance has since taken over, even if the
+watch has yet to report it. If an instance dies, the keys it held linger for
+up to the hold time.
+
+Each held key is kept in a timing wheel under the time of its next refresh or
+expiry, so each check only visits the keys which are due. Heartbeats do not
+move a key in the wheel; when it comes due it is filed again if its node has
+been heard from since. On startup, the keys already in the registry are
+adopted, but keys whose nodes have not been heard from by this instance are
+left to lapse rather than being refreshed or removed. Another instance may
+still hold an adopted key, so the first heartbeat for one is written, taking
+the key over, before later ones are absorbed; otherwise the other instance
+would see the node as silent and remove the key of a node which is alive.
+"""
+
+import time
+import gevent
+from gevent.pool import Pool
+
+from nmoscommon.logger import Logger
+
+from .jsoncodec import loads
+from .timingwheel import TimingWheel
+
+INTERVAL = 1  # seconds between checks for due refreshes and expiries
+REFRESH_MARGIN = 3  # seconds before the etcd TTL runs out that a key is refreshed
+WORKERS = 4
+REMOVALS = ["delete", "expire", "compareAndDelete"]
+
+
+class _Holding(object):
+    """A health key written by this instance"""
+
+    def __init__(self, last_seen, index, expiry, adopted=False):
+        self.last_seen = last_seen
+        self.index = index
+        self.expiry = expiry
+        self.adopted = adopted
+
+
+class HeartbeatAbsorber(object):
+
+    def __init__(self, registry, ttl, factor, workers=WORKERS, logger=None, interval=INTERVAL, watcher=None):
+        """
+        ttl
+            Seconds after its last heartbeat that a node is considered dead.
+        factor
+            Health keys are held for FACTOR * TTL seconds between refreshes.
+        interval
+            Number of seconds between checks for due refreshes and expiries.
+            An interval of '0' means 'never check'.
+        watcher
+            Watcher following the health keys, from which takeovers by other
+            instances are noticed. Without one, a takeover is only noticed
+            when the key is next refreshed.
+        """
+        self.registry = registry
+        self.logger = Logger("liveness", logger)
+        self.ttl = ttl
+        self.hold = ttl * factor
+        self.interval = interval
+        self._holdings = {}
+        self._wheel = TimingWheel(time.time())
+        self._listeners = []
+        self._pool = Pool(workers)
+        self._writing = set()
+        self.watcher = watcher
+        if watcher is not None:
+            watcher.subscribe(self._on_event, self._on_reset)
+        if interval > 0:
+            gevent.spawn(self.rebuild)
+            gevent.spawn_later(interval, self.flush)
+
+    def subscribe(self, on_expire):
+        """on_expire(node_id) is called whenever this instance removes a node's health key"""
+        self._listeners.append(on_expire)
+
+    def rebuild(self):
+        """
+        Adopt the health keys already in the registry, and stop holding any
+        which have been removed or written by another instance
+        """
+        try:
+            r = self.registry.get_raw("health", recurse=True)
+        except self.registry.RegistryUnavailable:
+            self.logger.writeWarning("registry unavailable, not adopting health keys")
+            return
+
+        now = time.time()
+        nodes = loads(r.content).get("node", {}).get("nodes", [])
+        indexes = {node["key"].split("/")[-1]: node.get("modifiedIndex") for node in nodes}
+        for node_id, holding in list(self._holdings.items()):
+            if indexes.get(node_id) != holding.index and node_id not in self._writing:
+                self.forget(node_id)
+
+        for node in nodes:
+            node_id = node["key"].split("/")[-1]
+            if node_id in self._holdings or "ttl" not in node:
+                continue
+            try:
+                last_seen = int(float(node.get("value")))
+            except (TypeError, ValueError):
+                last_seen = now
+            self._hold(node_id, _Holding(last_seen, node.get("modifiedIndex"), now + node["ttl"], adopted=True))
+
+    def _hold(self, node_id, holding):
+        self._holdings[node_id] = holding
+        self._wheel.schedule(node_id, min(holding.last_seen + self.ttl, holding.expiry - REFRESH_MARGIN))
+
+    def heartbeat(self, node_id, now):
+        """
+        Record a heartbeat for NODE_ID, writing to the registry only if this
+        instance does not already hold its health key.
+        Returns: the health value, or None if the node has no health key
+        """
+        holding = self._holdings.get(node_id)
+        if (holding is not None and not holding.adopted and
+                holding.expiry - now >= REFRESH_MARGIN and self._following()):
+            holding.last_seen = now
+            return str(now)
+
+        self._writing.add(node_id)
+        try:
+            r = self.registry.put_health(node_id, now, ttl=self.hold, prev_exist=True)
+        finally:
+            self._writing.discard(node_id)
+        if r.status_code not in [200, 201]:
+            self.forget(node_id)
+            return None
+        node = loads(r.content).get("node", {})
+        self._hold(node_id, _Holding(now, node.get("modifiedIndex"), now + self.hold))
+        return node.get("value", str(now))
+
+    def _following(self):
+        return self.watcher is None or self.watcher.synced
+
+    def _on_event(self, action, key, node, prev_node):
+        if len(key) != 1 or key[0] in self._writing:
+            # Changes made by this instance are reported again when its write returns
+            return
+        holding = self._holdings.get(key[0])
+        if holding is None:
+            return
+        if action in REMOVALS or node.get("modifiedIndex") != holding.index:
+            self.forget(key[0])
+
+    def _on_reset(self, index, root=None):
+        if index is not None:
+            # Takeovers may have been missed while out of step
+            gevent.spawn(self.rebuild)
+
+    def get_health(self, node_id):
+        """Return the time of the last heartbeat absorbed for NODE_ID, or None"""
+        holding = self._holdings.get(node_id)
+        if holding is None:
+            return None
+        return str(holding.last_seen)
+
+    def forget(self, node_id):
+        self._holdings.pop(node_id, None)
+        self._wheel.cancel(node_id)
+
+    def flush(self):
+        try:
+            now = time.time()
+            expired = []
+            due = []
+            for node_id in self._wheel.advance(now):
+                holding = self._holdings.get(node_id)
+                if holding is None:
+                    continue
+                if holding.last_seen + self.ttl <= now or (holding.adopted and holding.expiry - now < REFRESH_MARGIN):
+                    del self._holdings[node_id]
+                    if not holding.adopted:
+                        expired.append((node_id, holding))
+                elif holding.expiry - now < REFRESH_MARGIN:
+                    due.append((node_id, holding))
+                else:
+                    # Heard from since it was filed
+                    self._hold(node_id, holding)
+
+            self._pool.map(self._expire, expired)
+            self._pool.map(self._refresh, due)
+
+        except Exception as e:
+            self.logger.writeError("unhandled exception: {}".format(e))
+
+        finally:
+            gevent.spawn_later(self.interval, self.flush)
+
+    def _expire(self, item):
+        node_id, holding = item
+        try:
+            r = self.registry.delete_health(node_id, prev_index=holding.index)
+        except self.registry.RegistryUnavailable:
+            self.logger.writeWarning("registry unavailable, health of {} will lapse".format(node_id))
+            return
+
+        if r.status_code == 200:
+            for on_expire in self._listeners:
+                on_expire(node_id)
+
+    def _refresh(self, item):
+        node_id, holding = item
+        self._writing.add(node_id)
+        try:
+            r = self.registry.refresh_health(node_id, ttl=self.hold, prev_index=holding.index)
+        except self.registry.RegistryUnavailable:
+            self.logger.writeWarning("registry unavailable, could not refresh health of {}".format(node_id))
+            if self._holdings.get(node_id) is holding:
+                self._wheel.schedule(node_id, time.time() + self.interval)
+            return
+        finally:
+            self._writing.discard(node_id)
+
+        if self._holdings.get(node_id) is not holding:
+            # Forgotten or replaced while refreshing
+            return
+
+        if r.status_code in [200, 201]:
+            holding.index = loads(r.content).get("node", {}).get("modifiedIndex")
+            holding.expiry = time.time() + self.hold
+            self._hold(node_id, holding)
+        else:
+            # The key has gone, or another instance has taken it over
+            self.forget(node_id)
@@ -0,0 +1,87 @@
+# Copyright 2019 British Broadcasting Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Internal metadata ("@_" attributes) stored with registered resources.
+
+The stored value is the serialised client representation with the metadata
+attributes appended to the end of the object, so the representation is only
+encoded once and the metadata never has to be stripped out of a dict. Reading
+it back, the representation is recovered by slicing the stored text.
+"""
+
+from .jsoncodec import loads, dumps
+
+METADATA_PREFIX = "@_"
+
+
+def is_metadata(key):
+    return key.startswith(METADATA_PREFIX)
+
+
+def strip_metadata(resource):
+    """Remove any metadata attributes from the dict RESOURCE, in place."""
+    for k in [x for x in resource if is_metadata(x)]:
+        del resource[k]
+    return resource
+
+
+def attach_metadata(representation, metadata):
+    """
+    Append the attributes of the dict METADATA to the serialised JSON object
+    REPRESENTATION, returning the value to be stored.
+    """
+    if not metadata:
+        return representation
+    members = dumps(metadata)[1:]
+    if representation == "{}":
+        return "{" + members
+    return representation[:-1] + "," + members
+
+
+def split_metadata(value):
+    """
+    Split a stored VALUE into the serialised client representation and a dict
+    of its metadata. Values whose metadata is not at the end of the object
+    (as written by older versions) are decoded and re-encoded instead.
+    """
+    start = len(value)
+    metadata = {}
+    index = value.rfind('"' + METADATA_PREFIX)
+    while index > 0:
+        preceding = value[:index].rstrip()[-1:]
+        if preceding not in (",", "{"):
+            break
+        try:
+            trailing = loads("{" + value[index:])
+        except ValueError:
+            break
+        if not all(is_metadata(k) for k in trailing):
+            break
+        start, metadata = index, trailing
+        index = value.rfind('"' + METADATA_PREFIX, 0, index)
+
+    if start == len(value):
+        representation = value
+    else:
+        representation = value[:start].rstrip()[:-1].rstrip()
+        representation = representation + "}" if representation else "{}"
+
+    if '"' + METADATA_PREFIX in representation:
+        resource = loads(representation)
+        if any(is_metadata(k) for k in resource):
+            metadata.update((k, resource.pop(k)) for k in list(resource) if is_metadata(k))
+            representation = dumps(resource)
+
+    return representation, metadata
@@ -0,0 +1,182 @@
+# Copyright 2019 British Broadcasting Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+An in-memory copy of the registered resources and node health.
+
+Each part of the keyspace is read in full whenever its watcher (re)starts
+following the registry, and kept up to date from the watch after that. Reads
+are answered from the mirror while both watchers are in step; the staleness is
+the time since the registry last confirmed there was nothing more to apply.
+While the registry is unavailable the last known state is kept, so that reads
+can still be answered from it.
+
+Writes made by this instance are applied as soon as the registry accepts them.
+Each entry keeps the etcd index at which it was written, so that changes the
+watch reports late never replace newer ones.
+"""
+
+from .jsoncodec import loads
+
+MIRROR_WATCH_TIMEOUT = 5  # seconds between confirmations from an idle watch
+MAX_TOMBSTONES = 10000  # removals remembered until the watch has passed them
+
+REMOVALS = ["delete", "expire", "compareAndDelete"]
+
+
+class Mirror(object):
+
+    def __init__(self, resource_watcher, health_watcher):
+        self.resource_watcher = resource_watcher
+        self.health_watcher = health_watcher
+        self._resources = {}
+        self._healths = {}
+        self._tombstones = {}
+        self.stats = {'events': 0}
+        resource_watcher.subscribe(self._on_resource_event, self._on_resource_reset)
+        health_watcher.subscribe(self._on_health_event, self._on_health_reset)
+
+    @property
+    def synced(self):
+        return self.resource_watcher.synced and self.health_watcher.synced
+
+    def staleness(self):
+        """Seconds since the mirror was last known to be in step, or None if it never has been"""
+        staleness = [self.resource_watcher.staleness(), self.health_watcher.staleness()]
+        if None in staleness:
+            return None
+        return max(staleness)
+
+    def get_stats(self):
+        stats = dict(self.stats)
+        stats.update({
+            'synced': self.synced,
+            'staleness': self.staleness(),
+            'resyncs': self.resource_watcher.resets + self.health_watcher.resets,
+            'resources': sum(len(resources) for resources in self._resources.values()),
+            'healths': len(self._healths),
+        })
+        return stats
+
+    def get_value(self, rtype, rkey):
+        """Return the stored value of a resource, or None"""
+        return self._resources.get(rtype, {}).get(rkey, (None, None))[0]
+
+    def get_value_index(self, rtype, rkey):
+        """Return the stored value of a resource and the etcd index at which it was written, or (None, None)"""
+        return self._resources.get(rtype, {}).get(rkey, (None, None))
+
+    def get_values(self, rtype, rkeys):
+        resources = self._resources.get(rtype, {})
+        return {rkey: resources[rkey][0] for rkey in rkeys if rkey in resources}
+
+    def getresources(self, rtype):
+        return list(self._resources.get(rtype, {}))
+
+    def resource_exists(self, rtype, rkey):
+        return rkey in self._resources.get(rtype, {})
+
+    def get_health(self, rkey):
+        return self._healths.get(rkey, (None, None))[0]
+
+    def get_health_value_index(self, rkey):
+        return self._healths.get(rkey, (None, None))
+
+    def resource_written(self, rtype, rkey, response):
+        """
+        Apply a write made by this instance straight away, so that it can be
+        read back before the watch reports it.
+        """
+        node = loads(response.content).get("node", {})
+        self._set(self._resources.setdefault(rtype, {}), ("resource", rtype, rkey), rkey, node)
+
+    def resource_deleted(self, rtype, rkey, response):
+        node = loads(response.content).get("node", {})
+        self._remove(self._resources.get(rtype, {}), ("resource", rtype, rkey), rkey, node, local=True)
+
+    def health_written(self, rkey, response):
+        node = loads(response.content).get("node", {})
+        self._set(self._healths, ("health", rkey), rkey, node)
+
+    def _set(self, entries, path, rkey, node):
+        index = node.get("modifiedIndex")
+        if "value" not in node or index is None:
+            return
+        # Ignore changes older than what is already held, or than a removal
+        if index <= entries.get(rkey, (None, -1))[1] or index <= self._tombstones.get(path, -1):
+            return
+        self._tombstones.pop(path, None)
+        entries[rkey] = (node["value"], index)
+
+    def _remove(self, entries, path, rkey, node, local=False):
+        index = node.get("modifiedIndex")
+        if index is None or index < entries.get(rkey, (None, -1))[1]:
+            return
+        entries.pop(rkey, None)
+        if local:
+            # Remembered until the watch reports the removal, after which it
+            # has nothing older to report
+            if len(self._tombstones) < MAX_TOMBSTONES:
+                self._tombstones[path] = index
+        elif index >= self._tombstones.get(path, index + 1):
+            del self._tombstones[path]
+
+    def _on_resource_event(self, action, key, node, prev_node):
+        self.stats['events'] += 1
+        if len(key) == 0:
+            if action in REMOVALS:
+                self._resources = {}
+        elif len(key) == 1:
+            if action in REMOVALS:
+                self._resources.pop(key[0], None)
+        elif len(key) == 2:
+            entries = self._resources.setdefault(key[0], {})
+            if action in REMOVALS:
+                self._remove(entries, ("resource",) + tuple(key), key[1], node)
+            else:
+                self._set(entries, ("resource",) + tuple(key), key[1], node)
+
+    def _on_resource_reset(self, index, root):
+        if index is None:
+            # Registry unavailable; keep the last known state
+            return
+        self._tombstones = {k: v for k, v in self._tombstones.items() if k[0] != "resource"}
+        resources = {}
+        for type_node in (root or {}).get("nodes", []):
+            rtype = type_node["key"].split("/")[-1]
+            resources[rtype] = {
+                node["key"].split("/")[-1]: (node["value"], node.get("modifiedIndex"))
+                for node in type_node.get("nodes", []) if "value" in node
+            }
+        self._resources = resources
+
+    def _on_health_event(self, action, key, node, prev_node):
+        self.stats['events'] += 1
+        if len(key) == 0:
+            if action in REMOVALS:
+                self._healths = {}
+        elif len(key) == 1:
+            if action in REMOVALS:
+                self._remove(self._healths, ("health", key[0]), key[0], node)
+            else:
+                self._set(self._healths, ("health", key[0]), key[0], node)
+
+    def _on_health_reset(self, index, root):
+        if index is None:
+            return
+        self._tombstones = {k: v for k, v in self._tombstones.items() if k[0] != "health"}
+        self._healths = {
+            node["key"].split("/")[-1]: (node["value"], node.get("modifiedIndex"))
+            for node in (root or {}).get("nodes", []) if "value" in node
+        }
@@ -83,50 +83,79 @@ SCHEMA = {
 }
 
 
+EACH = object()  # Path segment standing for every element of a list
+
+
+def compile_schema(schema, path=()):
+    """
+    Flatten a modifier schema into a list of (path, modify) pairs, where path
+    is a tuple of keys (or EACH) leading to the attribute to be modified and
+    modify is the bound method of a single CustomModifier instance.
+    """
+    compiled = []
+    for k, vtype in schema.items():
+        if type(vtype) is list:
+            for child_schema in vtype:
+                if type(child_schema) is dict:
+                    # Dict describes a subresource which has a schema
+                    compiled += compile_schema(child_schema, path + (k, EACH))
+                elif (
+                        isinstance(child_schema, (type, class_types)) and
+                        issubclass(child_schema, CustomModifier) and
+                        len(vtype) == 1
+                ):
+                    # List of attributes, each with the same modifier
+                    compiled.append((path + (k, EACH), child_schema().modify))
+        elif isinstance(vtype, (type, class_types)) and issubclass(vtype, CustomModifier):
+            compiled.append((path + (k,), vtype().modify))
+        elif type(vtype) is dict:
+            compiled += compile_schema(vtype, path + (k,))
+        else:
+            raise Exception("Unrecognised schema check: {}".format(vtype))
+    return compiled
+
+
+def _apply(data, path, modify, depth=0):
+    last = len(path) - 1
+    while depth < last:
+        key = path[depth]
+        if key is EACH:
+            if type(data) is list:
+                for child_data in data:
+                    _apply(child_data, path, modify, depth + 1)
+            return
+        if type(data) is not dict or key not in data:
+            return
+        data = data[key]
+        depth += 1
+
+    key = path[last]
+    if key is EACH:
+        if type(data) is list:
+            for index, val in enumerate(data):
+                data[index] = modify(val)
+    elif type(data) is dict and key in data:
+        data[key] = modify(data[key])
+
+
 class RegModifier(object):
     def __init__(self, logger):
         self.logger = logger
+        general = compile_schema(GENERAL_SCHEMA)
+        self._compiled = {rtype: general + compile_schema(schema) for rtype, schema in SCHEMA.items()}
+        self._general = general
 
     def modify(self, data):
         """
         Check data against any applicable schema(s).
         Returns: Corrected data
         """
-        # Check against the general schema
-        resource = self._modify_against_schema(data, GENERAL_SCHEMA)
-
-        # Check specifics for object type
-        specific_schema = SCHEMA.get(data['type'], None)
-        if specific_schema is not None:
-            data = self._modify_against_schema(resource, specific_schema)
-        else:
+        compiled = self._compiled.get(data['type'], None)
+        if compiled is None:
             self.logger.writeInfo("No specific schema for validating resource of type {}".format(data['type']))
+            compiled = self._general
 
-        return data
+        for path, modify in compiled:
+            _apply(data, path, modify)
 
-    def _modify_against_schema(self, data, schema):
-        for k, vtype in schema.items():
-            if k in data.keys():
-                if type(vtype) is list:
-                    for child_schema in vtype:
-                        if type(child_schema) is dict:
-                            # Dict describes a subresource which has a schema
-                            for child_data in data[k]:
-                                data[k][child_data] = self._modify_against_schema(child_data, child_schema)
-                        elif (
-                                isinstance(child_schema, (type, class_types)) and
-                                issubclass(child_schema, CustomModifier) and
-                                len(vtype) == 1
-                        ):
-                            # List of attributes, each with the same modifier
-                            custom = child_schema()
-                            for index, val in enumerate(data[k]):
-                                data[k][index] = custom.modify(val)
-                elif isinstance(vtype, (type, class_types)) and issubclass(vtype, CustomModifier):
-                    custom = vtype()
-                    data[k] = custom.modify(data[k])
-                elif type(vtype) is dict:
-                    data[k] = self._modify_against_schema(data[k], schema[k])
-                else:
-                    raise Exception("Unrecognised schema check: {}".format(vtype))
         return data
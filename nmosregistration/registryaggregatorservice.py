@@ -19,6 +19,7 @@ monkey.patch_all()
 from nmoscommon.mdns import MDNSEngine # noqa E402
 from nmoscommon.utils import getLocalIP # noqa E402
 from nmosregistration.aggregation import AggregatorAPI, AGGREGATOR_APIVERSIONS # noqa E402
+from nmosregistration.udpheartbeat import HeartbeatListener # noqa E402
 from nmoscommon.httpserver import HttpServer # noqa E402
 from nmoscommon.logger import Logger # noqa E402
 from .config import config # noqa E402
@@ -48,6 +49,7 @@ class RegistryAggregatorService(object):
         self.config = config
         self.running = False
         self.httpServer = None
+        self.heartbeatListener = None
         self.interactive = interactive
         self.mdns = MDNSEngine()
         self.logger = Logger("aggregation", logger)
@@ -70,6 +72,19 @@ class RegistryAggregatorService(object):
 
         print("Running on port: {}".format(self.httpServer.port))
 
+        udp_heartbeat_port = self.config.get("udp_heartbeat_port")
+        if udp_heartbeat_port and self.config.get('oauth_mode', False) and not self.config.get("udp_heartbeat_key"):
+            # Unsigned heartbeats would let anyone keep nodes alive, bypassing the API's authorization
+            self.logger.writeError("udp_heartbeat_key must be set to receive UDP heartbeats in oauth_mode")
+            print("Not receiving heartbeats on UDP port: udp_heartbeat_key not set")
+        elif udp_heartbeat_port:
+            self.heartbeatListener = HeartbeatListener(
+                self.httpServer.api.heartbeat, int(udp_heartbeat_port),
+                key=self.config.get("udp_heartbeat_key"), logger=self.logger
+            )
+            self.heartbeatListener.start()
+            print("Receiving heartbeats on UDP port: {}".format(udp_heartbeat_port))
+
         self._advertise_mdns()
 
     def _advertise_mdns(self):
@@ -119,6 +134,8 @@ class RegistryAggregatorService(object):
 
     def _cleanup(self):
         self.mdns.close()
+        if self.heartbeatListener is not None:
+            self.heartbeatListener.stop()
         self.httpServer.stop()
         print("Stopped main()")
 
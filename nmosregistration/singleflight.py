@@ -0,0 +1,57 @@
+# Copyright 2019 British Broadcasting Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+De-duplication of concurrent identical operations: while an operation is in
+flight, callers asking for the same one wait for it and share its result,
+rather than starting their own.
+"""
+
+from gevent.event import AsyncResult
+
+
+class SingleFlight(object):
+
+    def __init__(self):
+        self.stats = {'calls': 0, 'shared': 0}
+        self._flights = {}
+
+    def get_stats(self):
+        stats = dict(self.stats)
+        stats['in_flight'] = len(self._flights)
+        return stats
+
+    def do(self, key, f, *args, **kwargs):
+        """
+        Call F(*ARGS, **KWARGS), unless a call for KEY is already in flight,
+        in which case wait for it instead.
+        Returns the result of the call, or raises its exception.
+        """
+        flight = self._flights.get(key)
+        if flight is not None:
+            self.stats['shared'] += 1
+            return flight.get()
+
+        flight = self._flights[key] = AsyncResult()
+        self.stats['calls'] += 1
+        try:
+            value = f(*args, **kwargs)
+        except BaseException as e:
+            # Including the caller being killed, which would otherwise leave the others waiting
+            del self._flights[key]
+            flight.set_exception(e)
+            raise
+        del self._flights[key]
+        flight.set(value)
+        return value
@@ -0,0 +1,105 @@
+# Copyright 2019 British Broadcasting Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+A hierarchical timing wheel: a set of keys, each with a deadline, from which
+the keys that have come due can be taken in batches.
+
+Deadlines are rounded up to whole ticks. Level 0 has a slot for each of the
+next SLOTS ticks; each higher level has a slot for each of the next SLOTS
+slots of the level below. A key is filed in the lowest level whose range
+covers its deadline, and moved down a level when the slot it is in comes
+round. Scheduling and cancelling keys are constant time, and each tick only
+touches the keys in the slots which come round.
+"""
+
+import math
+
+SLOTS = 64
+LEVELS = 3
+
+
+class TimingWheel(object):
+
+    def __init__(self, now, tick=1, slots=SLOTS, levels=LEVELS):
+        self.tick = tick
+        self.slots = slots
+        self.levels = levels
+        self._tick = int(math.floor(now / float(tick)))
+        self._wheels = [[set() for _ in range(slots)] for _ in range(levels)]
+        self._entries = {}
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def schedule(self, key, deadline):
+        """Schedule KEY to come due at DEADLINE, replacing any earlier schedule"""
+        self.cancel(key)
+        self._file(key, int(math.ceil(deadline / float(self.tick))), self._tick + 1)
+
+    def cancel(self, key):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            _, slot = entry
+            slot.discard(key)
+
+    def advance(self, now):
+        """Move the wheel on to NOW, returning the keys which have come due"""
+        due = []
+        target = int(math.floor(now / float(self.tick)))
+        while self._tick < target:
+            self._tick += 1
+
+            # Move keys down from any higher level slots which have come round
+            for level in range(self.levels - 1, 0, -1):
+                span = self.slots ** level
+                if self._tick % span == 0:
+                    slot = self._wheels[level][(self._tick // span) % self.slots]
+                    keys = list(slot)
+                    slot.clear()
+                    for key in keys:
+                        deadline, _ = self._entries.pop(key)
+                        self._file(key, deadline, self._tick)
+
+            slot = self._wheels[0][self._tick % self.slots]
+            keys = list(slot)
+            slot.clear()
+            for key in keys:
+                deadline, _ = self._entries.pop(key)
+                if deadline <= self._tick:
+                    due.append(key)
+                else:
+                    # Parked beyond the range of a single level wheel
+                    self._file(key, deadline, self._tick + 1)
+
+        return due
+
+    def _file(self, key, deadline, earliest):
+        # Keys already due are filed in the earliest slot yet to come round
+        filed = max(deadline, earliest)
+        for level in range(self.levels):
+            span = self.slots ** level
+            if filed // span - self._tick // span < self.slots:
+                break
+        else:
+            # Beyond the range of the wheel; park in the furthest slot, from
+            # which the key will be filed again when it comes round
+            filed = (self._tick // span + self.slots - 1) * span
+
+        slot = self._wheels[level][(filed // span) % self.slots]
+        slot.add(key)
+        self._entries[key] = (deadline, slot)
@@ -0,0 +1,135 @@
+# Copyright 2019 British Broadcasting Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Fire-and-forget node heartbeats over UDP.
+
+Each datagram holds one or more node IDs separated by spaces. When a key is
+configured, datagrams must instead be of the form
+
+    <unix time> <node id> [<node id> ...] <signature>
+
+where the signature is the hex HMAC-SHA256, under the key, of everything before
+the final space, and the time must be within REPLAY_WINDOW seconds of the
+registry's clock. Nothing is sent in reply.
+
+Node IDs received are collected and heartbeated in batches every
+BATCH_INTERVAL seconds, so that a node heartbeating more than once per batch
+costs a single update.
+"""
+
+import re
+import hmac
+import time
+import hashlib
+import gevent
+from gevent.pool import Pool
+from gevent.server import DatagramServer
+
+from nmoscommon.logger import Logger
+
+BATCH_INTERVAL = 0.2  # seconds between batches of heartbeats
+MAX_PENDING = 100000  # node IDs held awaiting a batch before datagrams are dropped
+REPLAY_WINDOW = 30  # seconds either side of the current time a signed datagram is accepted
+WORKERS = 8
+NODE_ID = re.compile(r'^[0-9a-f]{8}-[0-9a-f]{4}-[1-5][0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}$')
+
+
+class HeartbeatListener(DatagramServer):
+
+    def __init__(self, heartbeat, port, host='0.0.0.0', key=None, workers=WORKERS, logger=None,
+                 interval=BATCH_INTERVAL):
+        """
+        heartbeat
+            Called with each node ID to heartbeat, returning its result.
+        key
+            Shared secret with which datagrams must be signed, or None to
+            accept unsigned datagrams.
+        """
+        super(HeartbeatListener, self).__init__((host, port))
+        self.heartbeat = heartbeat
+        self.key = key.encode('utf-8') if key is not None else None
+        self.interval = interval
+        self.logger = Logger("udpheartbeat", logger)
+        self.stats = {'received': 0, 'rejected': 0, 'dropped': 0, 'alive': 0, 'unknown': 0}
+        self._pending = set()
+        self._pool = Pool(workers)
+        self._greenlet = None
+
+    def start(self):
+        super(HeartbeatListener, self).start()
+        if self._greenlet is None:
+            self._greenlet = gevent.spawn(self._run)
+
+    def stop(self, *args, **kwargs):
+        if self._greenlet is not None:
+            self._greenlet.kill()
+            self._greenlet = None
+        super(HeartbeatListener, self).stop(*args, **kwargs)
+
+    def handle(self, data, address):
+        self.stats['received'] += 1
+        node_ids = self.parse(data)
+        if node_ids is None:
+            self.stats['rejected'] += 1
+            return
+        if len(self._pending) + len(node_ids) > MAX_PENDING:
+            self.stats['dropped'] += 1
+            return
+        self._pending.update(node_ids)
+
+    def parse(self, data):
+        """
+        Return the node IDs in datagram DATA, or None if it is malformed or
+        not correctly signed.
+        """
+        try:
+            fields = data.decode('ascii').split()
+        except UnicodeDecodeError:
+            return None
+
+        if self.key is not None:
+            if len(fields) < 3:
+                return None
+            message = data[:data.rstrip().rfind(b' ')]
+            signature = hmac.new(self.key, message, hashlib.sha256).hexdigest()
+            if not hmac.compare_digest(signature, fields[-1]):
+                return None
+            try:
+                if abs(time.time() - float(fields[0])) > REPLAY_WINDOW:
+                    return None
+            except ValueError:
+                return None
+            fields = fields[1:-1]
+
+        if len(fields) == 0 or not all(NODE_ID.match(f) for f in fields):
+            return None
+        return fields
+
+    def flush(self):
+        """Heartbeat every node ID received since the last batch"""
+        pending, self._pending = self._pending, set()
+        for result in self._pool.imap_unordered(self.heartbeat, pending):
+            if result.get('code') == 204:
+                self.stats['alive'] += 1
+            else:
+                self.stats['unknown'] += 1
+
+    def _run(self):
+        while True:
+            gevent.sleep(self.interval)
+            try:
+                self.flush()
+            except Exception as e:
+                self.logger.writeError("unhandled exception: {}".format(e))
@@ -2,1340 +2,991 @@
 Defines mapping of resource types to schema
 Generated. Do not edit!
 """
-SCHEMA = {'device': {u'$schema': u'http://json-schema.org/draft-04/schema#',
-            u'allOf': [{u'$schema': u'http://json-schema.org/draft-04/schema#',
-                        u'description': u'Describes the foundations of all NMOS resources',
-                        u'properties': {u'description': {u'description': u'Detailed description of the resource',
-                                                         u'type': u'string'},
-                                        u'id': {u'description': u'Globally unique identifier for the resource',
-                                                u'pattern': u'^[0-9a-f]{8}-[0-9a-f]{4}-[1-5][0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}$',
-                                                u'type': u'string'},
-                                        u'label': {u'description': u'Freeform string label for the resource',
-                                                   u'type': u'string'},
-                                        u'tags': {u'description': u'Key value set of freeform string tags to aid in filtering resources. Values should be represented as an array of strings. Can be empty.',
-                                                  u'patternProperties': {u'': {u'items': {u'type': u'string'},
-                                                                               u'type': u'array'}},
-                                                  u'type': u'object'},
-                                        u'version': {u'description': u'String formatted TAI timestamp (<seconds>:<nanoseconds>) indicating precisely when an attribute of the resource last changed',
-                                                     u'pattern': u'^[0-9]+:[0-9]+$',
-                                                     u'type': u'string'}},
-                        u'required': [u'id',
-                                      u'version',
-                                      u'label',
-                                      u'description',
-                                      u'tags'],
-                        u'title': u'Base resource',
-                        u'type': u'object'},
-                       {u'properties': {u'controls': {u'description': u'Control endpoints exposed for the Device',
-                                                      u'items': {u'properties': {u'href': {u'description': u'URL to reach a control endpoint, whether http or otherwise',
-                                                                                           u'format': u'uri',
-                                                                                           u'type': u'string'},
-                                                                                 u'type': {u'description': u'URN identifying the control format',
-                                                                                           u'format': u'uri',
-                                                                                           u'type': u'string'}},
-                                                                 u'required': [u'href',
-                                                                               u'type'],
-                                                                 u'type': u'object'},
-                                                      u'type': u'array'},
-                                        u'node_id': {u'description': u'Globally unique identifier for the Node which initially created the Device. This attribute is used to ensure referential integrity by registry implementations.',
-                                                     u'pattern': u'^[0-9a-f]{8}-[0-9a-f]{4}-[1-5][0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}$',
-                                                     u'type': u'string'},
-                                        u'receivers': {u'description': u'UUIDs of Receivers attached to the Device (deprecated)',
-                                                       u'items': {u'pattern': u'^[0-9a-f]{8}-[0-9a-f]{4}-[1-5][0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}$',
-                                                                  u'type': u'string'},
-                                                       u'type': u'array'},
-                                        u'senders': {u'description': u'UUIDs of Senders attached to the Device (deprecated)',
-                                                     u'items': {u'pattern': u'^[0-9a-f]{8}-[0-9a-f]{4}-[1-5][0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}$',
-                                                                u'type': u'string'},
-                                                     u'type': u'array'},
-                                        u'type': {u'description': u'Device type URN',
-                                                  u'format': u'uri',
-                                                  u'oneOf': [{u'enum': [u'urn:x-nmos:device:generic',
-                                                                        u'urn:x-nmos:device:pipeline']},
-                                                             {u'not': {u'pattern': u'^urn:x-nmos:'}}],
-                                                  u'type': u'string'}},
-                        u'required': [u'type',
-                                      u'node_id',
-                                      u'senders',
-                                      u'receivers',
-                                      u'controls'],
-                        u'type': u'object'}],
-            u'description': u'Describes a Device',
-            u'title': u'Device resource',
-            u'type': u'object'},
- 'flow': {u'$schema': u'http://json-schema.org/draft-04/schema#',
-          u'anyOf': [{u'$schema': u'http://json-schema.org/draft-04/schema#',
-                      u'allOf': [{u'$schema': u'http://json-schema.org/draft-04/schema#',
-                                  u'allOf': [{u'$schema': u'http://json-schema.org/draft-04/schema#',
-                                              u'allOf': [{u'$schema': u'http://json-schema.org/draft-04/schema#',
-                                                          u'description': u'Describes the foundations of all NMOS resources',
-                                                          u'properties': {u'description': {u'description': u'Detailed description of the resource',
-                                                                                           u'type': u'string'},
-                                                                          u'id': {u'description': u'Globally unique identifier for the resource',
-                                                                                  u'pattern': u'^[0-9a-f]{8}-[0-9a-f]{4}-[1-5][0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}$',
-                                                                                  u'type': u'string'},
-                                                                          u'label': {u'description': u'Freeform string label for the resource',
-                                                                                     u'type': u'string'},
-                                                                          u'tags': {u'description': u'Key value set of freeform string tags to aid in filtering resources. Values should be represented as an array of strings. Can be empty.',
-                                                                                    u'patternProperties': {u'': {u'items': {u'type': u'string'},
-                                                                                                                 u'type': u'array'}},
-                                                                                    u'type': u'object'},
-                                                                          u'version': {u'description': u'String formatted TAI timestamp (<seconds>:<nanoseconds>) indicating precisely when an attribute of the resource last changed',
-                                                                                       u'pattern': u'^[0-9]+:[0-9]+$',
-                                                                                       u'type': u'string'}},
-                                                          u'required': [u'id',
-                                                                        u'version',
-                                                                        u'label',
-                                                                        u'description',
-                                                                        u'tags'],
-                                                          u'title': u'Base resource',
-                                                          u'type': u'object'},
-                                                         {u'properties': {u'device_id': {u'description': u'Globally unique identifier for the Device which initially created the Flow. This attribute is used to ensure referential integrity by registry implementations (v1.1 onwards).',
-                                                                                         u'pattern': u'^[0-9a-f]{8}-[0-9a-f]{4}-[1-5][0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}$',
-                                                                                         u'type': u'string'},
-                                                                          u'grain_rate': {u'description': u'Number of Grains per second for this Flow. Must be an integer division of, or equal to the Grain rate specified by the parent Source. Grain rate matches the frame rate for video (see NMOS Content Model). Specified for periodic Flows only.',
-                                                                                          u'properties': {u'denominator': {u'default': 1,
-                                                                                                                           u'description': u'Denominator',
-                                                                                                                           u'type': u'integer'},
-                                                                                                          u'numerator': {u'description': u'Numerator',
-                                                                                                                         u'type': u'integer'}},
-                                                                                          u'required': [u'numerator'],
-                                                                                          u'type': u'object'},
-                                                                          u'parents': {u'description': u'Array of UUIDs representing the Flow IDs of Grains which came together to generate this Flow (may change over the lifetime of this Flow)',
-                                                                                       u'items': {u'pattern': u'^[0-9a-f]{8}-[0-9a-f]{4}-[1-5][0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}$',
-                                                                                                  u'type': u'string'},
-                                                                                       u'type': u'array'},
-                                                                          u'source_id': {u'description': u'Globally unique identifier for the Source which initially created the Flow. This attribute is used to ensure referential integrity by registry implementations (v1.0 only).',
-                                                                                         u'pattern': u'^[0-9a-f]{8}-[0-9a-f]{4}-[1-5][0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}$',
-                                                                                         u'type': u'string'}},
-                                                          u'required': [u'source_id',
-                                                                        u'device_id',
-                                                                        u'parents'],
-                                                          u'type': u'object'}],
-                                              u'description': u'Describes a Flow',
-                                              u'title': u'Flow resource',
-                                              u'type': u'object'},
-                                             {u'properties': {u'colorspace': {u'description': u'Colorspace used for the video',
-                                                                              u'enum': [u'BT601',
-                                                                                        u'BT709',
-                                                                                        u'BT2020',
-                                                                                        u'BT2100'],
-                                                                              u'type': u'string'},
-                                                              u'format': {u'description': u'Format of the data coming from the Flow as a URN',
-                                                                          u'enum': [u'urn:x-nmos:format:video'],
-                                                                          u'format': u'uri',
-                                                                          u'type': u'string'},
-                                                              u'frame_height': {u'description': u'Height of the picture in pixels',
-                                                                                u'type': u'integer'},
-                                                              u'frame_width': {u'description': u'Width of the picture in pixels',
-                                                                               u'type': u'integer'},
-                                                              u'interlace_mode': {u'default': u'progressive',
-                                                                                  u'description': u'Interlaced video mode for frames in this Flow',
-                                                                                  u'enum': [u'progressive',
-                                                                                            u'interlaced_tff',
-                                                                                            u'interlaced_bff',
-                                                                                            u'interlaced_psf'],
-                                                                                  u'type': u'string'},
-                                                              u'transfer_characteristic': {u'default': u'SDR',
-                                                                                           u'description': u'Transfer characteristic',
-                                                                                           u'enum': [u'SDR',
-                                                                                                     u'HLG',
-                                                                                                     u'PQ'],
-                                                                                           u'type': u'string'}},
-                                              u'required': [u'format',
-                                                            u'frame_width',
-                                                            u'frame_height',
-                                                            u'colorspace'],
-                                              u'type': u'object'}],
-                                  u'description': u'Describes a Video Flow',
-                                  u'title': u'Video Flow resource',
-                                  u'type': u'object'},
-                                 {u'properties': {u'components': {u'description': u'Array of objects describing the components',
-                                                                  u'items': {u'properties': {u'bit_depth': {u'description': u'Number of bits used to describe each sample',
-                                                                                                            u'type': u'integer'},
-                                                                                             u'height': {u'description': u'Height of this component in pixels',
-                                                                                                         u'type': u'integer'},
-                                                                                             u'name': {u'description': u'Name of this component',
-                                                                                                       u'enum': [u'Y',
-                                                                                                                 u'Cb',
-                                                                                                                 u'Cr',
-                                                                                                                 u'I',
-                                                                                                                 u'Ct',
-                                                                                                                 u'Cp',
-                                                                                                                 u'A',
-                                                                                                                 u'R',
-                                                                                                                 u'G',
-                                                                                                                 u'B',
-                                                                                                                 u'DepthMap'],
-                                                                                                       u'type': u'string'},
-                                                                                             u'width': {u'description': u'Width of this component in pixels',
-                                                                                                        u'type': u'integer'}},
-                                                                             u'required': [u'name',
-                                                                                           u'width',
-                                                                                           u'height',
-                                                                                           u'bit_depth'],
-                                                                             u'title': u'component',
-                                                                             u'type': u'object'},
-                                                                  u'minItems': 1,
-                                                                  u'type': u'array'},
-                                                  u'media_type': {u'description': u'Subclassification of the format using IANA assigned media types',
-                                                                  u'enum': [u'video/raw'],
-                                                                  u'type': u'string'}},
-                                  u'required': [u'media_type',
-                                                u'components'],
-                                  u'type': u'object'}],
-                      u'description': u'Describes a raw Video Flow',
-                      u'title': u'Raw Video Flow resource',
-                      u'type': u'object'},
-                     {u'$schema': u'http://json-schema.org/draft-04/schema#',
-                      u'allOf': [{u'$schema': u'http://json-schema.org/draft-04/schema#',
-                                  u'allOf': [{u'$schema': u'http://json-schema.org/draft-04/schema#',
-                                              u'allOf': [{u'$schema': u'http://json-schema.org/draft-04/schema#',
-                                                          u'description': u'Describes the foundations of all NMOS resources',
-                                                          u'properties': {u'description': {u'description': u'Detailed description of the resource',
-                                                                                           u'type': u'string'},
-                                                                          u'id': {u'description': u'Globally unique identifier for the resource',
-                                                                                  u'pattern': u'^[0-9a-f]{8}-[0-9a-f]{4}-[1-5][0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}$',
-                                                                                  u'type': u'string'},
-                                                                          u'label': {u'description': u'Freeform string label for the resource',
-                                                                                     u'type': u'string'},
-                                                                          u'tags': {u'description': u'Key value set of freeform string tags to aid in filtering resources. Values should be represented as an array of strings. Can be empty.',
-                                                                                    u'patternProperties': {u'': {u'items': {u'type': u'string'},
-                                                                                                                 u'type': u'array'}},
-                                                                                    u'type': u'object'},
-                                                                          u'version': {u'description': u'String formatted TAI timestamp (<seconds>:<nanoseconds>) indicating precisely when an attribute of the resource last changed',
-                                                                                       u'pattern': u'^[0-9]+:[0-9]+$',
-                                                                                       u'type': u'string'}},
-                                                          u'required': [u'id',
-                                                                        u'version',
-                                                                        u'label',
-                                                                        u'description',
-                                                                        u'tags'],
-                                                          u'title': u'Base resource',
-                                                          u'type': u'object'},
-                                                         {u'properties': {u'device_id': {u'description': u'Globally unique identifier for the Device which initially created the Flow. This attribute is used to ensure referential integrity by registry implementations (v1.1 onwards).',
-                                                                                         u'pattern': u'^[0-9a-f]{8}-[0-9a-f]{4}-[1-5][0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}$',
-                                                                                         u'type': u'string'},
-                                                                          u'grain_rate': {u'description': u'Number of Grains per second for this Flow. Must be an integer division of, or equal to the Grain rate specified by the parent Source. Grain rate matches the frame rate for video (see NMOS Content Model). Specified for periodic Flows only.',
-                                                                                          u'properties': {u'denominator': {u'default': 1,
-                                                                                                                           u'description': u'Denominator',
-                                                                                                                           u'type': u'integer'},
-                                                                                                          u'numerator': {u'description': u'Numerator',
-                                                                                                                         u'type': u'integer'}},
-                                                                                          u'required': [u'numerator'],
-                                                                                          u'type': u'object'},
-                                                                          u'parents': {u'description': u'Array of UUIDs representing the Flow IDs of Grains which came together to generate this Flow (may change over the lifetime of this Flow)',
-                                                                                       u'items': {u'pattern': u'^[0-9a-f]{8}-[0-9a-f]{4}-[1-5][0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}$',
-                                                                                                  u'type': u'string'},
-                                                                                       u'type': u'array'},
-                                                                          u'source_id': {u'description': u'Globally unique identifier for the Source which initially created the Flow. This attribute is used to ensure referential integrity by registry implementations (v1.0 only).',
-                                                                                         u'pattern': u'^[0-9a-f]{8}-[0-9a-f]{4}-[1-5][0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}$',
-                                                                                         u'type': u'string'}},
-                                                          u'required': [u'source_id',
-                                                                        u'device_id',
-                                                                        u'parents'],
-                                                          u'type': u'object'}],
-                                              u'description': u'Describes a Flow',
-                                              u'title': u'Flow resource',
-                                              u'type': u'object'},
-                                             {u'properties': {u'colorspace': {u'description': u'Colorspace used for the video',
-                                                                              u'enum': [u'BT601',
-                                                                                        u'BT709',
-                                                                                        u'BT2020',
-                                                                                        u'BT2100'],
-                                                                              u'type': u'string'},
-                                                              u'format': {u'description': u'Format of the data coming from the Flow as a URN',
-                                                                          u'enum': [u'urn:x-nmos:format:video'],
-                                                                          u'format': u'uri',
-                                                                          u'type': u'string'},
-                                                              u'frame_height': {u'description': u'Height of the picture in pixels',
-                                                                                u'type': u'integer'},
-                                                              u'frame_width': {u'description': u'Width of the picture in pixels',
-                                                                               u'type': u'integer'},
-                                                              u'interlace_mode': {u'default': u'progressive',
-                                                                                  u'description': u'Interlaced video mode for frames in this Flow',
-                                                                                  u'enum': [u'progressive',
-                                                                                            u'interlaced_tff',
-                                                                                            u'interlaced_bff',
-                                                                                            u'interlaced_psf'],
-                                                                                  u'type': u'string'},
-                                                              u'transfer_characteristic': {u'default': u'SDR',
-                                                                                           u'description': u'Transfer characteristic',
-                                                                                           u'enum': [u'SDR',
-                                                                                                     u'HLG',
-                                                                                                     u'PQ'],
-                                                                                           u'type': u'string'}},
-                                              u'required': [u'format',
-                                                            u'frame_width',
-                                                            u'frame_height',
-                                                            u'colorspace'],
-                                              u'type': u'object'}],
-                                  u'description': u'Describes a Video Flow',
-                                  u'title': u'Video Flow resource',
-                                  u'type': u'object'},
-                                 {u'properties': {u'media_type': {u'anyOf': [{u'enum': [u'video/H264',
-                                                                                        u'video/vc2']},
-                                                                             {u'pattern': u'^video\\/[^\\s\\/]+$'}],
-                                                                  u'description': u'Subclassification of the format using IANA assigned media types',
-                                                                  u'not': {u'enum': [u'video/raw']},
-                                                                  u'type': u'string'}},
-                                  u'required': [u'media_type'],
-                                  u'type': u'object'}],
-                      u'description': u'Describes a coded Video Flow',
-                      u'title': u'Coded Video Flow resource',
-                      u'type': u'object'},
-                     {u'$schema': u'http://json-schema.org/draft-04/schema#',
-                      u'allOf': [{u'$schema': u'http://json-schema.org/draft-04/schema#',
-                                  u'allOf': [{u'$schema': u'http://json-schema.org/draft-04/schema#',
-                                              u'allOf': [{u'$schema': u'http://json-schema.org/draft-04/schema#',
-                                                          u'description': u'Describes the foundations of all NMOS resources',
-                                                          u'properties': {u'description': {u'description': u'Detailed description of the resource',
-                                                                                           u'type': u'string'},
-                                                                          u'id': {u'description': u'Globally unique identifier for the resource',
-                                                                                  u'pattern': u'^[0-9a-f]{8}-[0-9a-f]{4}-[1-5][0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}$',
-                                                                                  u'type': u'string'},
-                                                                          u'label': {u'description': u'Freeform string label for the resource',
-                                                                                     u'type': u'string'},
-                                                                          u'tags': {u'description': u'Key value set of freeform string tags to aid in filtering resources. Values should be represented as an array of strings. Can be empty.',
-                                                                                    u'patternProperties': {u'': {u'items': {u'type': u'string'},
-                                                                                                                 u'type': u'array'}},
-                                                                                    u'type': u'object'},
-                                                                          u'version': {u'description': u'String formatted TAI timestamp (<seconds>:<nanoseconds>) indicating precisely when an attribute of the resource last changed',
-                                                                                       u'pattern': u'^[0-9]+:[0-9]+$',
-                                                                                       u'type': u'string'}},
-                                                          u'required': [u'id',
-                                                                        u'version',
-                                                                        u'label',
-                                                                        u'description',
-                                                                        u'tags'],
-                                                          u'title': u'Base resource',
-                                                          u'type': u'object'},
-                                                         {u'properties': {u'device_id': {u'description': u'Globally unique identifier for the Device which initially created the Flow. This attribute is used to ensure referential integrity by registry implementations (v1.1 onwards).',
-                                                                                         u'pattern': u'^[0-9a-f]{8}-[0-9a-f]{4}-[1-5][0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}$',
-                                                                                         u'type': u'string'},
-                                                                          u'grain_rate': {u'description': u'Number of Grains per second for this Flow. Must be an integer division of, or equal to the Grain rate specified by the parent Source. Grain rate matches the frame rate for video (see NMOS Content Model). Specified for periodic Flows only.',
-                                                                                          u'properties': {u'denominator': {u'default': 1,
-                                                                                                                           u'description': u'Denominator',
-                                                                                                                           u'type': u'integer'},
-                                                                                                          u'numerator': {u'description': u'Numerator',
-                                                                                                                         u'type': u'integer'}},
-                                                                                          u'required': [u'numerator'],
-                                                                                          u'type': u'object'},
-                                                                          u'parents': {u'description': u'Array of UUIDs representing the Flow IDs of Grains which came together to generate this Flow (may change over the lifetime of this Flow)',
-                                                                                       u'items': {u'pattern': u'^[0-9a-f]{8}-[0-9a-f]{4}-[1-5][0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}$',
-                                                                                                  u'type': u'string'},
-                                                                                       u'type': u'array'},
-                                                                          u'source_id': {u'description': u'Globally unique identifier for the Source which initially created the Flow. This attribute is used to ensure referential integrity by registry implementations (v1.0 only).',
-                                                                                         u'pattern': u'^[0-9a-f]{8}-[0-9a-f]{4}-[1-5][0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}$',
-                                                                                         u'type': u'string'}},
-                                                          u'required': [u'source_id',
-                                                                        u'device_id',
-                                                                        u'parents'],
-                                                          u'type': u'object'}],
-                                              u'description': u'Describes a Flow',
-                                              u'title': u'Flow resource',
-                                              u'type': u'object'},
-                                             {u'properties': {u'format': {u'description': u'Format of the data coming from the Flow as a URN',
-                                                                          u'enum': [u'urn:x-nmos:format:audio'],
-                                                                          u'format': u'uri',
-                                                                          u'type': u'string'},
-                                                              u'sample_rate': {u'description': u'Number of audio samples per second for this Flow',
-                                                                               u'properties': {u'denominator': {u'default': 1,
-                                                                                                                u'description': u'Denominator',
-                                                                                                                u'type': u'integer'},
-                                                                                               u'numerator': {u'description': u'Numerator',
-                                                                                                              u'type': u'integer'}},
-                                                                               u'required': [u'numerator'],
-                                                                               u'type': u'object'}},
-                                              u'required': [u'format',
-                                                            u'sample_rate'],
-                                              u'type': u'object'}],
-                                  u'description': u'Describes an audio Flow',
-                                  u'title': u'Audio Flow resource',
-                                  u'type': u'object'},
-                                 {u'properties': {u'bit_depth': {u'description': u'Bit depth of the audio samples',
-                                                                 u'type': u'integer'},
-                                                  u'media_type': {u'anyOf': [{u'enum': [u'audio/L24',
-                                                                                        u'audio/L20',
-                                                                                        u'audio/L16',
-                                                                                        u'audio/L8']},
-                                                                             {u'pattern': u'^audio\\/[^\\s\\/]+$'}],
-                                                                  u'description': u'Subclassification of the format using IANA assigned media types',
-                                                                  u'type': u'string'}},
-                                  u'required': [u'media_type',
-                                                u'bit_depth'],
-                                  u'type': u'object'}],
-                      u'description': u'Describes a raw audio Flow',
-                      u'title': u'Raw Audio Flow resource',
-                      u'type': u'object'},
-                     {u'$schema': u'http://json-schema.org/draft-04/schema#',
-                      u'allOf': [{u'$schema': u'http://json-schema.org/draft-04/schema#',
-                                  u'allOf': [{u'$schema': u'http://json-schema.org/draft-04/schema#',
-                                              u'allOf': [{u'$schema': u'http://json-schema.org/draft-04/schema#',
-                                                          u'description': u'Describes the foundations of all NMOS resources',
-                                                          u'properties': {u'description': {u'description': u'Detailed description of the resource',
-                                                                                           u'type': u'string'},
-                                                                          u'id': {u'description': u'Globally unique identifier for the resource',
-                                                                                  u'pattern': u'^[0-9a-f]{8}-[0-9a-f]{4}-[1-5][0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}$',
-                                                                                  u'type': u'string'},
-                                                                          u'label': {u'description': u'Freeform string label for the resource',
-                                                                                     u'type': u'string'},
-                                                                          u'tags': {u'description': u'Key value set of freeform string tags to aid in filtering resources. Values should be represented as an array of strings. Can be empty.',
-                                                                                    u'patternProperties': {u'': {u'items': {u'type': u'string'},
-                                                                                                                 u'type': u'array'}},
-                                                                                    u'type': u'object'},
-                                                                          u'version': {u'description': u'String formatted TAI timestamp (<seconds>:<nanoseconds>) indicating precisely when an attribute of the resource last changed',
-                                                                                       u'pattern': u'^[0-9]+:[0-9]+$',
-                                                                                       u'type': u'string'}},
-                                                          u'required': [u'id',
-                                                                        u'version',
-                                                                        u'label',
-                                                                        u'description',
-                                                                        u'tags'],
-                                                          u'title': u'Base resource',
-                                                          u'type': u'object'},
-                                                         {u'properties': {u'device_id': {u'description': u'Globally unique identifier for the Device which initially created the Flow. This attribute is used to ensure referential integrity by registry implementations (v1.1 onwards).',
-                                                                                         u'pattern': u'^[0-9a-f]{8}-[0-9a-f]{4}-[1-5][0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}$',
-                                                                                         u'type': u'string'},
-                                                                          u'grain_rate': {u'description': u'Number of Grains per second for this Flow. Must be an integer division of, or equal to the Grain rate specified by the parent Source. Grain rate matches the frame rate for video (see NMOS Content Model). Specified for periodic Flows only.',
-                                                                                          u'properties': {u'denominator': {u'default': 1,
-                                                                                                                           u'description': u'Denominator',
-                                                                                                                           u'type': u'integer'},
-                                                                                                          u'numerator': {u'description': u'Numerator',
-                                                                                                                         u'type': u'integer'}},
-                                                                                          u'required': [u'numerator'],
-                                                                                          u'type': u'object'},
-                                                                          u'parents': {u'description': u'Array of UUIDs representing the Flow IDs of Grains which came together to generate this Flow (may change over the lifetime of this Flow)',
-                                                                                       u'items': {u'pattern': u'^[0-9a-f]{8}-[0-9a-f]{4}-[1-5][0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}$',
-                                                                                                  u'type': u'string'},
-                                                                                       u'type': u'array'},
-                                                                          u'source_id': {u'description': u'Globally unique identifier for the Source which initially created the Flow. This attribute is used to ensure referential integrity by registry implementations (v1.0 only).',
-                                                                                         u'pattern': u'^[0-9a-f]{8}-[0-9a-f]{4}-[1-5][0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}$',
-                                                                                         u'type': u'string'}},
-                                                          u'required': [u'source_id',
-                                                                        u'device_id',
-                                                                        u'parents'],
-                                                          u'type': u'object'}],
-                                              u'description': u'Describes a Flow',
-                                              u'title': u'Flow resource',
-                                              u'type': u'object'},
-                                             {u'properties': {u'format': {u'description': u'Format of the data coming from the Flow as a URN',
-                                                                          u'enum': [u'urn:x-nmos:format:audio'],
-                                                                          u'format': u'uri',
-                                                                          u'type': u'string'},
-                                                              u'sample_rate': {u'description': u'Number of audio samples per second for this Flow',
-                                                                               u'properties': {u'denominator': {u'default': 1,
-                                                                                                                u'description': u'Denominator',
-                                                                                                                u'type': u'integer'},
-                                                                                               u'numerator': {u'description': u'Numerator',
-                                                                                                              u'type': u'integer'}},
-                                                                               u'required': [u'numerator'],
-                                                                               u'type': u'object'}},
-                                              u'required': [u'format',
-                                                            u'sample_rate'],
-                                              u'type': u'object'}],
-                                  u'description': u'Describes an audio Flow',
-                                  u'title': u'Audio Flow resource',
-                                  u'type': u'object'},
-                                 {u'properties': {u'media_type': {u'description': u'Subclassification of the format using IANA assigned media types',
-                                                                  u'not': {u'pattern': u'^audio\\/L[0-9]+$'},
-                                                                  u'pattern': u'^audio\\/[^\\s\\/]+$',
-                                                                  u'type': u'string'}},
-                                  u'required': [u'media_type'],
-                                  u'type': u'object'}],
-                      u'description': u'Describes a coded audio Flow',
-                      u'title': u'Coded Audio Flow resource',
-                      u'type': u'object'},
-                     {u'$schema': u'http://json-schema.org/draft-04/schema#',
-                      u'allOf': [{u'$schema': u'http://json-schema.org/draft-04/schema#',
-                                  u'allOf': [{u'$schema': u'http://json-schema.org/draft-04/schema#',
-                                              u'description': u'Describes the foundations of all NMOS resources',
-                                              u'properties': {u'description': {u'description': u'Detailed description of the resource',
-                                                                               u'type': u'string'},
-                                                              u'id': {u'description': u'Globally unique identifier for the resource',
-                                                                      u'pattern': u'^[0-9a-f]{8}-[0-9a-f]{4}-[1-5][0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}$',
-                                                                      u'type': u'string'},
-                                                              u'label': {u'description': u'Freeform string label for the resource',
-                                                                         u'type': u'string'},
-                                                              u'tags': {u'description': u'Key value set of freeform string tags to aid in filtering resources. Values should be represented as an array of strings. Can be empty.',
-                                                                        u'patternProperties': {u'': {u'items': {u'type': u'string'},
-                                                                                                     u'type': u'array'}},
-                                                                        u'type': u'object'},
-                                                              u'version': {u'description': u'String formatted TAI timestamp (<seconds>:<nanoseconds>) indicating precisely when an attribute of the resource last changed',
-                                                                           u'pattern': u'^[0-9]+:[0-9]+$',
-                                                                           u'type': u'string'}},
-                                              u'required': [u'id',
-                                                            u'version',
-                                                            u'label',
-                                                            u'description',
-                                                            u'tags'],
-                                              u'title': u'Base resource',
-                                              u'type': u'object'},
-                                             {u'properties': {u'device_id': {u'description': u'Globally unique identifier for the Device which initially created the Flow. This attribute is used to ensure referential integrity by registry implementations (v1.1 onwards).',
-                                                                             u'pattern': u'^[0-9a-f]{8}-[0-9a-f]{4}-[1-5][0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}$',
-                                                                             u'type': u'string'},
-                                                              u'grain_rate': {u'description': u'Number of Grains per second for this Flow. Must be an integer division of, or equal to the Grain rate specified by the parent Source. Grain rate matches the frame rate for video (see NMOS Content Model). Specified for periodic Flows only.',
-                                                                              u'properties': {u'denominator': {u'default': 1,
-                                                                                                               u'description': u'Denominator',
-                                                                                                               u'type': u'integer'},
-                                                                                              u'numerator': {u'description': u'Numerator',
-                                                                                                             u'type': u'integer'}},
-                                                                              u'required': [u'numerator'],
-                                                                              u'type': u'object'},
-                                                              u'parents': {u'description': u'Array of UUIDs representing the Flow IDs of Grains which came together to generate this Flow (may change over the lifetime of this Flow)',
-                                                                           u'items': {u'pattern': u'^[0-9a-f]{8}-[0-9a-f]{4}-[1-5][0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}$',
-                                                                                      u'type': u'string'},
-                                                                           u'type': u'array'},
-                                                              u'source_id': {u'description': u'Globally unique identifier for the Source which initially created the Flow. This attribute is used to ensure referential integrity by registry implementations (v1.0 only).',
-                                                                             u'pattern': u'^[0-9a-f]{8}-[0-9a-f]{4}-[1-5][0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}$',
-                                                                             u'type': u'string'}},
-                                              u'required': [u'source_id',
-                                                            u'device_id',
-                                                            u'parents'],
-                                              u'type': u'object'}],
-                                  u'description': u'Describes a Flow',
-                                  u'title': u'Flow resource',
-                                  u'type': u'object'},
-                                 {u'properties': {u'format': {u'description': u'Format of the data coming from the Flow as a URN',
-                                                              u'enum': [u'urn:x-nmos:format:data'],
-                                                              u'format': u'uri',
-                                                              u'type': u'string'},
-                                                  u'media_type': {u'description': u'Subclassification of the format using IANA assigned media types',
-                                                                  u'not': {u'enum': [u'video/smpte291']},
-                                                                  u'pattern': u'^[^\\s\\/]+\\/[^\\s\\/]+$',
-                                                                  u'type': u'string'}},
-                                  u'required': [u'format', u'media_type'],
-                                  u'type': u'object'}],
-                      u'description': u'Describes a generic data Flow',
-                      u'title': u'Generic data Flow resource',
-                      u'type': u'object'},
-                     {u'$schema': u'http://json-schema.org/draft-04/schema#',
-                      u'allOf': [{u'$schema': u'http://json-schema.org/draft-04/schema#',
-                                  u'allOf': [{u'$schema': u'http://json-schema.org/draft-04/schema#',
-                                              u'description': u'Describes the foundations of all NMOS resources',
-                                              u'properties': {u'description': {u'description': u'Detailed description of the resource',
-                                                                               u'type': u'string'},
-                                                              u'id': {u'description': u'Globally unique identifier for the resource',
-                                                                      u'pattern': u'^[0-9a-f]{8}-[0-9a-f]{4}-[1-5][0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}$',
-                                                                      u'type': u'string'},
-                                                              u'label': {u'description': u'Freeform string label for the resource',
-                                                                         u'type': u'string'},
-                                                              u'tags': {u'description': u'Key value set of freeform string tags to aid in filtering resources. Values should be represented as an array of strings. Can be empty.',
-                                                                        u'patternProperties': {u'': {u'items': {u'type': u'string'},
-                                                                                                     u'type': u'array'}},
-                                                                        u'type': u'object'},
-                                                              u'version': {u'description': u'String formatted TAI timestamp (<seconds>:<nanoseconds>) indicating precisely when an attribute of the resource last changed',
-                                                                           u'pattern': u'^[0-9]+:[0-9]+$',
-                                                                           u'type': u'string'}},
-                                              u'required': [u'id',
-                                                            u'version',
-                                                            u'label',
-                                                            u'description',
-                                                            u'tags'],
-                                              u'title': u'Base resource',
-                                              u'type': u'object'},
-                                             {u'properties': {u'device_id': {u'description': u'Globally unique identifier for the Device which initially created the Flow. This attribute is used to ensure referential integrity by registry implementations (v1.1 onwards).',
-                                                                             u'pattern': u'^[0-9a-f]{8}-[0-9a-f]{4}-[1-5][0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}$',
-                                                                             u'type': u'string'},
-                                                              u'grain_rate': {u'description': u'Number of Grains per second for this Flow. Must be an integer division of, or equal to the Grain rate specified by the parent Source. Grain rate matches the frame rate for video (see NMOS Content Model). Specified for periodic Flows only.',
-                                                                              u'properties': {u'denominator': {u'default': 1,
-                                                                                                               u'description': u'Denominator',
-                                                                                                               u'type': u'integer'},
-                                                                                              u'numerator': {u'description': u'Numerator',
-                                                                                                             u'type': u'integer'}},
-                                                                              u'required': [u'numerator'],
-                                                                              u'type': u'object'},
-                                                              u'parents': {u'description': u'Array of UUIDs representing the Flow IDs of Grains which came together to generate this Flow (may change over the lifetime of this Flow)',
-                                                                           u'items': {u'pattern': u'^[0-9a-f]{8}-[0-9a-f]{4}-[1-5][0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}$',
-                                                                                      u'type': u'string'},
-                                                                           u'type': u'array'},
-                                                              u'source_id': {u'description': u'Globally unique identifier for the Source which initially created the Flow. This attribute is used to ensure referential integrity by registry implementations (v1.0 only).',
-                                                                             u'pattern': u'^[0-9a-f]{8}-[0-9a-f]{4}-[1-5][0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}$',
-                                                                             u'type': u'string'}},
-                                              u'required': [u'source_id',
-                                                            u'device_id',
-                                                            u'parents'],
-                                              u'type': u'object'}],
-                                  u'description': u'Describes a Flow',
-                                  u'title': u'Flow resource',
-                                  u'type': u'object'},
-                                 {u'properties': {u'DID_SDID': {u'description': u'List of Data identification and Secondary data identification words',
-                                                                u'items': {u'properties': {u'DID': {u'description': u'Data identification word',
-                                                                                                    u'pattern': u'^0x[0-9a-fA-F]{2}$',
-                                                                                                    u'type': u'string'},
-                                                                                           u'SDID': {u'description': u'Secondary data identification word',
-                                                                                                     u'pattern': u'^0x[0-9a-fA-F]{2}$',
-                                                                                                     u'type': u'string'}},
-                                                                           u'title': u'entry',
-                                                                           u'type': u'object'},
-                                                                u'type': u'array'},
-                                                  u'format': {u'description': u'Format of the data coming from the Flow as a URN',
-                                                              u'enum': [u'urn:x-nmos:format:data'],
-                                                              u'format': u'uri',
-                                                              u'type': u'string'},
-                                                  u'media_type': {u'description': u'Subclassification of the format using IANA assigned media types',
-                                                                  u'enum': [u'video/smpte291'],
-                                                                  u'type': u'string'}},
-                                  u'required': [u'format', u'media_type'],
-                                  u'type': u'object'}],
-                      u'description': u'Describes an SDI ancillary Flow',
-                      u'title': u'SDI ancillary Flow resource',
-                      u'type': u'object'},
-                     {u'$schema': u'http://json-schema.org/draft-04/schema#',
-                      u'allOf': [{u'$schema': u'http://json-schema.org/draft-04/schema#',
-                                  u'allOf': [{u'$schema': u'http://json-schema.org/draft-04/schema#',
-                                              u'description': u'Describes the foundations of all NMOS resources',
-                                              u'properties': {u'description': {u'description': u'Detailed description of the resource',
-                                                                               u'type': u'string'},
-                                                              u'id': {u'description': u'Globally unique identifier for the resource',
-                                                                      u'pattern': u'^[0-9a-f]{8}-[0-9a-f]{4}-[1-5][0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}$',
-                                                                      u'type': u'string'},
-                                                              u'label': {u'description': u'Freeform string label for the resource',
-                                                                         u'type': u'string'},
-                                                              u'tags': {u'description': u'Key value set of freeform string tags to aid in filtering resources. Values should be represented as an array of strings. Can be empty.',
-                                                                        u'patternProperties': {u'': {u'items': {u'type': u'string'},
-                                                                                                     u'type': u'array'}},
-                                                                        u'type': u'object'},
-                                                              u'version': {u'description': u'String formatted TAI timestamp (<seconds>:<nanoseconds>) indicating precisely when an attribute of the resource last changed',
-                                                                           u'pattern': u'^[0-9]+:[0-9]+$',
-                                                                           u'type': u'string'}},
-                                              u'required': [u'id',
-                                                            u'version',
-                                                            u'label',
-                                                            u'description',
-                                                            u'tags'],
-                                              u'title': u'Base resource',
-                                              u'type': u'object'},
-                                             {u'properties': {u'device_id': {u'description': u'Globally unique identifier for the Device which initially created the Flow. This attribute is used to ensure referential integrity by registry implementations (v1.1 onwards).',
-                                                                             u'pattern': u'^[0-9a-f]{8}-[0-9a-f]{4}-[1-5][0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}$',
-                                                                             u'type': u'string'},
-                                                              u'grain_rate': {u'description': u'Number of Grains per second for this Flow. Must be an integer division of, or equal to the Grain rate specified by the parent Source. Grain rate matches the frame rate for video (see NMOS Content Model). Specified for periodic Flows only.',
-                                                                              u'properties': {u'denominator': {u'default': 1,
-                                                                                                               u'description': u'Denominator',
-                                                                                                               u'type': u'integer'},
-                                                                                              u'numerator': {u'description': u'Numerator',
-                                                                                                             u'type': u'integer'}},
-                                                                              u'required': [u'numerator'],
-                                                                              u'type': u'object'},
-                                                              u'parents': {u'description': u'Array of UUIDs representing the Flow IDs of Grains which came together to generate this Flow (may change over the lifetime of this Flow)',
-                                                                           u'items': {u'pattern': u'^[0-9a-f]{8}-[0-9a-f]{4}-[1-5][0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}$',
-                                                                                      u'type': u'string'},
-                                                                           u'type': u'array'},
-                                                              u'source_id': {u'description': u'Globally unique identifier for the Source which initially created the Flow. This attribute is used to ensure referential integrity by registry implementations (v1.0 only).',
-                                                                             u'pattern': u'^[0-9a-f]{8}-[0-9a-f]{4}-[1-5][0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}$',
-                                                                             u'type': u'string'}},
-                                              u'required': [u'source_id',
-                                                            u'device_id',
-                                                            u'parents'],
-                                              u'type': u'object'}],
-                                  u'description': u'Describes a Flow',
-                                  u'title': u'Flow resource',
-                                  u'type': u'object'},
-                                 {u'properties': {u'format': {u'description': u'Format of the data coming from the Flow as a URN',
-                                                              u'enum': [u'urn:x-nmos:format:mux'],
-                                                              u'format': u'uri',
-                                                              u'type': u'string'},
-                                                  u'media_type': {u'anyOf': [{u'enum': [u'video/SMPTE2022-6']},
-                                                                             {u'pattern': u'^[^\\s\\/]+\\/[^\\s\\/]+$'}],
-                                                                  u'description': u'Subclassification of the format using IANA assigned media types',
-                                                                  u'type': u'string'}},
-                                  u'required': [u'format', u'media_type'],
-                                  u'type': u'object'}],
-                      u'description': u'Describes a mux Flow',
-                      u'title': u'Mux Flow resource',
-                      u'type': u'object'}],
-          u'description': u'Describes a Flow',
-          u'title': u'Flow resource',
-          u'type': u'object'},
- 'node': {u'$schema': u'http://json-schema.org/draft-04/schema#',
-          u'allOf': [{u'$schema': u'http://json-schema.org/draft-04/schema#',
-                      u'description': u'Describes the foundations of all NMOS resources',
-                      u'properties': {u'description': {u'description': u'Detailed description of the resource',
-                                                       u'type': u'string'},
-                                      u'id': {u'description': u'Globally unique identifier for the resource',
-                                              u'pattern': u'^[0-9a-f]{8}-[0-9a-f]{4}-[1-5][0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}$',
-                                              u'type': u'string'},
-                                      u'label': {u'description': u'Freeform string label for the resource',
-                                                 u'type': u'string'},
-                                      u'tags': {u'description': u'Key value set of freeform string tags to aid in filtering resources. Values should be represented as an array of strings. Can be empty.',
-                                                u'patternProperties': {u'': {u'items': {u'type': u'string'},
-                                                                             u'type': u'array'}},
-                                                u'type': u'object'},
-                                      u'version': {u'description': u'String formatted TAI timestamp (<seconds>:<nanoseconds>) indicating precisely when an attribute of the resource last changed',
-                                                   u'pattern': u'^[0-9]+:[0-9]+$',
-                                                   u'type': u'string'}},
-                      u'required': [u'id',
-                                    u'version',
-                                    u'label',
-                                    u'description',
-                                    u'tags'],
-                      u'title': u'Base resource',
-                      u'type': u'object'},
-                     {u'properties': {u'api': {u'description': u'URL fragments required to connect to the Node API',
-                                               u'properties': {u'endpoints': {u'description': u'Host, port and protocol details required to connect to the API',
-                                                                              u'items': {u'properties': {u'host': {u'anyOf': [{u'format': u'hostname'},
-                                                                                                                              {u'format': u'ipv4'},
-                                                                                                                              {u'format': u'ipv6'}],
-                                                                                                                   u'description': u'IP address or hostname which the Node API is running on',
-                                                                                                                   u'type': u'string'},
-                                                                                                         u'port': {u'description': u'Port number which the Node API is running on',
-                                                                                                                   u'maximum': 65535,
-                                                                                                                   u'minimum': 1,
-                                                                                                                   u'type': u'integer'},
-                                                                                                         u'protocol': {u'description': u'Protocol supported by this instance of the Node API',
-                                                                                                                       u'enum': [u'http',
-                                                                                                                                 u'https'],
-                                                                                                                       u'type': u'string'}},
-                                                                                         u'required': [u'host',
-                                                                                                       u'port',
-                                                                                                       u'protocol'],
-                                                                                         u'type': u'object'},
-                                                                              u'type': u'array'},
-                                                               u'versions': {u'description': u'Supported API versions running on this Node',
-                                                                             u'items': {u'pattern': u'^v[0-9]+\\.[0-9]+$',
-                                                                                        u'type': u'string'},
-                                                                             u'type': u'array'}},
-                                               u'required': [u'versions',
-                                                             u'endpoints'],
-                                               u'type': u'object'},
-                                      u'caps': {u'description': u'Capabilities (not yet defined)',
-                                                u'type': u'object'},
-                                      u'clocks': {u'description': u'Clocks made available to Devices owned by this Node',
-                                                  u'items': {u'anyOf': [{u'$schema': u'http://json-schema.org/draft-04/schema#',
-                                                                         u'description': u'Describes a clock with no external reference',
-                                                                         u'properties': {u'name': {u'description': u'Name of this refclock (unique for this set of clocks)',
-                                                                                                   u'pattern': u'^clk[0-9]+$',
-                                                                                                   u'type': u'string'},
-                                                                                         u'ref_type': {u'description': u'Type of external reference used by this clock',
-                                                                                                       u'enum': [u'internal'],
-                                                                                                       u'type': u'string'}},
-                                                                         u'required': [u'name',
-                                                                                       u'ref_type'],
-                                                                         u'title': u'Clock with no external reference',
-                                                                         u'type': u'object'},
-                                                                        {u'$schema': u'http://json-schema.org/draft-04/schema#',
-                                                                         u'description': u'Describes a clock referenced to PTP',
-                                                                         u'properties': {u'gmid': {u'description': u'ID of the PTP reference used by this clock',
-                                                                                                   u'pattern': u'^[0-9a-f]{2}-[0-9a-f]{2}-[0-9a-f]{2}-[0-9a-f]{2}-[0-9a-f]{2}-[0-9a-f]{2}-[0-9a-f]{2}-[0-9a-f]{2}$',
-                                                                                                   u'type': u'string'},
-                                                                                         u'locked': {u'description': u'Lock state of this clock to the external reference. If true, this device is slaved, otherwise it has no defined relationship to the external reference',
-                                                                                                     u'type': u'boolean'},
-                                                                                         u'name': {u'description': u'Name of this refclock (unique for this set of clocks)',
-                                                                                                   u'pattern': u'^clk[0-9]+$',
-                                                                                                   u'type': u'string'},
-                                                                                         u'ref_type': {u'description': u'Type of external reference used by this clock',
-                                                                                                       u'enum': [u'ptp'],
-                                                                                                       u'type': u'string'},
-                                                                                         u'traceable': {u'description': u'External refclock is synchronised to International Atomic Time (TAI)',
-                                                                                                        u'type': u'boolean'},
-                                                                                         u'version': {u'description': u'Version of PTP reference used by this clock',
-                                                                                                      u'enum': [u'IEEE1588-2008'],
-                                                                                                      u'type': u'string'}},
-                                                                         u'required': [u'name',
-                                                                                       u'ref_type',
-                                                                                       u'traceable',
-                                                                                       u'version',
-                                                                                       u'gmid',
-                                                                                       u'locked'],
-                                                                         u'title': u'PTP clock',
-                                                                         u'type': u'object'}]},
-                                                  u'type': u'array'},
-                                      u'hostname': {u'description': u'Node hostname (optional, deprecated)',
-                                                    u'format': u'hostname',
-                                                    u'type': u'string'},
-                                      u'href': {u'description': u"HTTP access href for the Node's API (deprecated)",
-                                                u'format': u'uri',
-                                                u'type': u'string'},
-                                      u'interfaces': {u'description': u'Network interfaces made available to devices owned by this Node. Port IDs and Chassis IDs are used to inform topology discovery via IS-06, and require that interfaces implement ARP at a minimum, and ideally LLDP.',
-                                                      u'items': {u'properties': {u'chassis_id': {u'anyOf': [{u'description': u'When the Chassis ID is a MAC address, use this format',
-                                                                                                             u'pattern': u'^([0-9a-f]{2}-){5}([0-9a-f]{2})$',
-                                                                                                             u'type': u'string'},
-                                                                                                            {u'description': u'When the Chassis ID is anything other than a MAC address, a freeform string may be used',
-                                                                                                             u'pattern': u'^.+$',
-                                                                                                             u'type': u'string'},
-                                                                                                            {u'description': u'When the Chassis ID is unavailable it should be set to null',
-                                                                                                             u'type': u'null'}],
-                                                                                                 u'description': u'Chassis ID of the interface, as signalled in LLDP from this node. Set to null where LLDP is unsuitable for use (ie. virtualised environments)'},
-                                                                                 u'name': {u'description': u'Name of the interface (unique in scope of this node).  This attribute is used by sub-resources of this node such as senders and receivers to refer to interfaces to which they are bound.',
-                                                                                           u'type': u'string'},
-                                                                                 u'port_id': {u'description': u'Port ID of the interface, as signalled in LLDP or via ARP responses from this node. Must be a MAC address',
-                                                                                              u'pattern': u'^([0-9a-f]{2}-){5}([0-9a-f]{2})$',
-                                                                                              u'type': u'string'}},
-                                                                 u'required': [u'chassis_id',
-                                                                               u'port_id',
-                                                                               u'name'],
-                                                                 u'type': u'object'},
-                                                      u'type': u'array'},
-                                      u'services': {u'description': u'Array of objects containing a URN format type and href',
-                                                    u'items': {u'properties': {u'href': {u'description': u'URL to reach a service running on the Node',
-                                                                                         u'format': u'uri',
-                                                                                         u'type': u'string'},
-                                                                               u'type': {u'description': u'URN identifying the type of service',
-                                                                                         u'format': u'uri',
-                                                                                         u'type': u'string'}},
-                                                               u'required': [u'href',
-                                                                             u'type'],
-                                                               u'type': u'object'},
-                                                    u'type': u'array'}},
-                      u'required': [u'href',
-                                    u'caps',
-                                    u'api',
-                                    u'services',
-                                    u'clocks',
-                                    u'interfaces'],
-                      u'type': u'object'}],
-          u'description': u'Describes the Node and the services which run on it',
-          u'title': u'Node resource',
-          u'type': u'object'},
- 'receiver': {u'$schema': u'http://json-schema.org/draft-04/schema#',
-              u'description': u'Describes a Receiver',
-              u'oneOf': [{u'$schema': u'http://json-schema.org/draft-04/schema#',
-                          u'allOf': [{u'$schema': u'http://json-schema.org/draft-04/schema#',
-                                      u'allOf': [{u'$schema': u'http://json-schema.org/draft-04/schema#',
-                                                  u'description': u'Describes the foundations of all NMOS resources',
-                                                  u'properties': {u'description': {u'description': u'Detailed description of the resource',
-                                                                                   u'type': u'string'},
-                                                                  u'id': {u'description': u'Globally unique identifier for the resource',
-                                                                          u'pattern': u'^[0-9a-f]{8}-[0-9a-f]{4}-[1-5][0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}$',
-                                                                          u'type': u'string'},
-                                                                  u'label': {u'description': u'Freeform string label for the resource',
-                                                                             u'type': u'string'},
-                                                                  u'tags': {u'description': u'Key value set of freeform string tags to aid in filtering resources. Values should be represented as an array of strings. Can be empty.',
-                                                                            u'patternProperties': {u'': {u'items': {u'type': u'string'},
-                                                                                                         u'type': u'array'}},
-                                                                            u'type': u'object'},
-                                                                  u'version': {u'description': u'String formatted TAI timestamp (<seconds>:<nanoseconds>) indicating precisely when an attribute of the resource last changed',
-                                                                               u'pattern': u'^[0-9]+:[0-9]+$',
-                                                                               u'type': u'string'}},
-                                                  u'required': [u'id',
-                                                                u'version',
-                                                                u'label',
-                                                                u'description',
-                                                                u'tags'],
-                                                  u'title': u'Base resource',
-                                                  u'type': u'object'},
-                                                 {u'properties': {u'device_id': {u'description': u'Device ID which this Receiver forms part of. This attribute is used to ensure referential integrity by registry implementations.',
-                                                                                 u'pattern': u'^[0-9a-f]{8}-[0-9a-f]{4}-[1-5][0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}$',
-                                                                                 u'type': u'string'},
-                                                                  u'interface_bindings': {u'description': u"Binding of Receiver ingress ports to interfaces on the parent Node. Should contain a single network interface unless a redundancy mechanism such as ST.2022-7 is in use, in which case each 'leg' should have its matching interface listed. Where the redundancy mechanism receives more than one copy of the stream via the same interface, that interface should be listed a corresponding number of times.",
-                                                                                          u'items': {u'type': u'string'},
-                                                                                          u'type': u'array'},
-                                                                  u'subscription': {u'description': u"Object containing the 'sender_id' currently subscribed to. Sender_id should be null on initialisation, or when connected to a non-NMOS Sender.",
-                                                                                    u'properties': {u'active': {u'default': False,
-                                                                                                                u'description': u"Receiver is enabled and configured with a Sender's connection parameters",
-                                                                                                                u'type': u'boolean'},
-                                                                                                    u'sender_id': {u'default': None,
-                                                                                                                   u'description': u'UUID of the Sender that this Receiver is currently subscribed to',
-                                                                                                                   u'pattern': u'^[0-9a-f]{8}-[0-9a-f]{4}-[1-5][0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}$',
-                                                                                                                   u'type': [u'string',
-                                                                                                                             u'null']}},
-                                                                                    u'required': [u'sender_id',
-                                                                                                  u'active'],
-                                                                                    u'type': u'object'},
-                                                                  u'transport': {u'description': u'Transport type accepted by the Receiver in URN format',
-                                                                                 u'format': u'uri',
-                                                                                 u'oneOf': [{u'enum': [u'urn:x-nmos:transport:rtp',
-                                                                                                       u'urn:x-nmos:transport:rtp.ucast',
-                                                                                                       u'urn:x-nmos:transport:rtp.mcast',
-                                                                                                       u'urn:x-nmos:transport:dash']},
-                                                                                            {u'not': {u'pattern': u'^urn:x-nmos:'}}],
-                                                                                 u'type': u'string'}},
-                                                  u'required': [u'device_id',
-                                                                u'transport',
-                                                                u'interface_bindings',
-                                                                u'subscription'],
-                                                  u'type': u'object'}],
-                                      u'description': u'Describes a receiver',
-                                      u'title': u'Receiver resource',
-                                      u'type': u'object'},
-                                     {u'properties': {u'caps': {u'description': u'Capabilities',
-                                                                u'properties': {u'media_types': {u'description': u'Subclassification of the formats accepted using IANA assigned media types',
-                                                                                                 u'items': {u'anyOf': [{u'enum': [u'video/raw',
-                                                                                                                                  u'video/H264',
-                                                                                                                                  u'video/vc2']},
-                                                                                                                       {u'pattern': u'^video\\/[^\\s\\/]+$'}],
-                                                                                                            u'type': u'string'},
-                                                                                                 u'minItems': 1,
-                                                                                                 u'type': u'array'}},
-                                                                u'type': u'object'},
-                                                      u'format': {u'description': u'Type of Flow accepted by the Receiver as a URN',
-                                                                  u'enum': [u'urn:x-nmos:format:video'],
-                                                                  u'format': u'uri',
-                                                                  u'type': u'string'}},
-                                      u'required': [u'format', u'caps'],
-                                      u'type': u'object'}],
-                          u'description': u'Describes a video Receiver',
-                          u'title': u'Video Receiver resource',
-                          u'type': u'object'},
-                         {u'$schema': u'http://json-schema.org/draft-04/schema#',
-                          u'allOf': [{u'$schema': u'http://json-schema.org/draft-04/schema#',
-                                      u'allOf': [{u'$schema': u'http://json-schema.org/draft-04/schema#',
-                                                  u'description': u'Describes the foundations of all NMOS resources',
-                                                  u'properties': {u'description': {u'description': u'Detailed description of the resource',
-                                                                                   u'type': u'string'},
-                                                                  u'id': {u'description': u'Globally unique identifier for the resource',
-                                                                          u'pattern': u'^[0-9a-f]{8}-[0-9a-f]{4}-[1-5][0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}$',
-                                                                          u'type': u'string'},
-                                                                  u'label': {u'description': u'Freeform string label for the resource',
-                                                                             u'type': u'string'},
-                                                                  u'tags': {u'description': u'Key value set of freeform string tags to aid in filtering resources. Values should be represented as an array of strings. Can be empty.',
-                                                                            u'patternProperties': {u'': {u'items': {u'type': u'string'},
-                                                                                                         u'type': u'array'}},
-                                                                            u'type': u'object'},
-                                                                  u'version': {u'description': u'String formatted TAI timestamp (<seconds>:<nanoseconds>) indicating precisely when an attribute of the resource last changed',
-                                                                               u'pattern': u'^[0-9]+:[0-9]+$',
-                                                                               u'type': u'string'}},
-                                                  u'required': [u'id',
-                                                                u'version',
-                                                                u'label',
-                                                                u'description',
-                                                                u'tags'],
-                                                  u'title': u'Base resource',
-                                                  u'type': u'object'},
-                                                 {u'properties': {u'device_id': {u'description': u'Device ID which this Receiver forms part of. This attribute is used to ensure referential integrity by registry implementations.',
-                                                                                 u'pattern': u'^[0-9a-f]{8}-[0-9a-f]{4}-[1-5][0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}$',
-                                                                                 u'type': u'string'},
-                                                                  u'interface_bindings': {u'description': u"Binding of Receiver ingress ports to interfaces on the parent Node. Should contain a single network interface unless a redundancy mechanism such as ST.2022-7 is in use, in which case each 'leg' should have its matching interface listed. Where the redundancy mechanism receives more than one copy of the stream via the same interface, that interface should be listed a corresponding number of times.",
-                                                                                          u'items': {u'type': u'string'},
-                                                                                          u'type': u'array'},
-                                                                  u'subscription': {u'description': u"Object containing the 'sender_id' currently subscribed to. Sender_id should be null on initialisation, or when connected to a non-NMOS Sender.",
-                                                                                    u'properties': {u'active': {u'default': False,
-                                                                                                                u'description': u"Receiver is enabled and configured with a Sender's connection parameters",
-                                                                                                                u'type': u'boolean'},
-                                                                                                    u'sender_id': {u'default': None,
-                                                                                                                   u'description': u'UUID of the Sender that this Receiver is currently subscribed to',
-                                                                                                                   u'pattern': u'^[0-9a-f]{8}-[0-9a-f]{4}-[1-5][0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}$',
-                                                                                                                   u'type': [u'string',
-                                                                                                                             u'null']}},
-                                                                                    u'required': [u'sender_id',
-                                                                                                  u'active'],
-                                                                                    u'type': u'object'},
-                                                                  u'transport': {u'description': u'Transport type accepted by the Receiver in URN format',
-                                                                                 u'format': u'uri',
-                                                                                 u'oneOf': [{u'enum': [u'urn:x-nmos:transport:rtp',
-                                                                                                       u'urn:x-nmos:transport:rtp.ucast',
-                                                                                                       u'urn:x-nmos:transport:rtp.mcast',
-                                                                                                       u'urn:x-nmos:transport:dash']},
-                                                                                            {u'not': {u'pattern': u'^urn:x-nmos:'}}],
-                                                                                 u'type': u'string'}},
-                                                  u'required': [u'device_id',
-                                                                u'transport',
-                                                                u'interface_bindings',
-                                                                u'subscription'],
-                                                  u'type': u'object'}],
-                                      u'description': u'Describes a receiver',
-                                      u'title': u'Receiver resource',
-                                      u'type': u'object'},
-                                     {u'properties': {u'caps': {u'description': u'Capabilities',
-                                                                u'properties': {u'media_types': {u'description': u'Subclassification of the formats accepted using IANA assigned media types',
-                                                                                                 u'items': {u'anyOf': [{u'enum': [u'audio/L24',
-                                                                                                                                  u'audio/L20',
-                                                                                                                                  u'audio/L16',
-                                                                                                                                  u'audio/L8']},
-                                                                                                                       {u'pattern': u'^audio\\/[^\\s\\/]+$'}],
-                                                                                                            u'type': u'string'},
-                                                                                                 u'minItems': 1,
-                                                                                                 u'type': u'array'}},
-                                                                u'type': u'object'},
-                                                      u'format': {u'description': u'Type of Flow accepted by the Receiver as a URN',
-                                                                  u'enum': [u'urn:x-nmos:format:audio'],
-                                                                  u'format': u'uri',
-                                                                  u'type': u'string'}},
-                                      u'required': [u'format', u'caps'],
-                                      u'type': u'object'}],
-                          u'description': u'Describes an audio Receiver',
-                          u'title': u'Audio Receiver resource',
-                          u'type': u'object'},
-                         {u'$schema': u'http://json-schema.org/draft-04/schema#',
-                          u'allOf': [{u'$schema': u'http://json-schema.org/draft-04/schema#',
-                                      u'allOf': [{u'$schema': u'http://json-schema.org/draft-04/schema#',
-                                                  u'description': u'Describes the foundations of all NMOS resources',
-                                                  u'properties': {u'description': {u'description': u'Detailed description of the resource',
-                                                                                   u'type': u'string'},
-                                                                  u'id': {u'description': u'Globally unique identifier for the resource',
-                                                                          u'pattern': u'^[0-9a-f]{8}-[0-9a-f]{4}-[1-5][0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}$',
-                                                                          u'type': u'string'},
-                                                                  u'label': {u'description': u'Freeform string label for the resource',
-                                                                             u'type': u'string'},
-                                                                  u'tags': {u'description': u'Key value set of freeform string tags to aid in filtering resources. Values should be represented as an array of strings. Can be empty.',
-                                                                            u'patternProperties': {u'': {u'items': {u'type': u'string'},
-                                                                                                         u'type': u'array'}},
-                                                                            u'type': u'object'},
-                                                                  u'version': {u'description': u'String formatted TAI timestamp (<seconds>:<nanoseconds>) indicating precisely when an attribute of the resource last changed',
-                                                                               u'pattern': u'^[0-9]+:[0-9]+$',
-                                                                               u'type': u'string'}},
-                                                  u'required': [u'id',
-                                                                u'version',
-                                                                u'label',
-                                                                u'description',
-                                                                u'tags'],
-                                                  u'title': u'Base resource',
-                                                  u'type': u'object'},
-                                                 {u'properties': {u'device_id': {u'description': u'Device ID which this Receiver forms part of. This attribute is used to ensure referential integrity by registry implementations.',
-                                                                                 u'pattern': u'^[0-9a-f]{8}-[0-9a-f]{4}-[1-5][0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}$',
-                                                                                 u'type': u'string'},
-                                                                  u'interface_bindings': {u'description': u"Binding of Receiver ingress ports to interfaces on the parent Node. Should contain a single network interface unless a redundancy mechanism such as ST.2022-7 is in use, in which case each 'leg' should have its matching interface listed. Where the redundancy mechanism receives more than one copy of the stream via the same interface, that interface should be listed a corresponding number of times.",
-                                                                                          u'items': {u'type': u'string'},
-                                                                                          u'type': u'array'},
-                                                                  u'subscription': {u'description': u"Object containing the 'sender_id' currently subscribed to. Sender_id should be null on initialisation, or when connected to a non-NMOS Sender.",
-                                                                                    u'properties': {u'active': {u'default': False,
-                                                                                                                u'description': u"Receiver is enabled and configured with a Sender's connection parameters",
-                                                                                                                u'type': u'boolean'},
-                                                                                                    u'sender_id': {u'default': None,
-                                                                                                                   u'description': u'UUID of the Sender that this Receiver is currently subscribed to',
-                                                                                                                   u'pattern': u'^[0-9a-f]{8}-[0-9a-f]{4}-[1-5][0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}$',
-                                                                                                                   u'type': [u'string',
-                                                                                                                             u'null']}},
-                                                                                    u'required': [u'sender_id',
-                                                                                                  u'active'],
-                                                                                    u'type': u'object'},
-                                                                  u'transport': {u'description': u'Transport type accepted by the Receiver in URN format',
-                                                                                 u'format': u'uri',
-                                                                                 u'oneOf': [{u'enum': [u'urn:x-nmos:transport:rtp',
-                                                                                                       u'urn:x-nmos:transport:rtp.ucast',
-                                                                                                       u'urn:x-nmos:transport:rtp.mcast',
-                                                                                                       u'urn:x-nmos:transport:dash']},
-                                                                                            {u'not': {u'pattern': u'^urn:x-nmos:'}}],
-                                                                                 u'type': u'string'}},
-                                                  u'required': [u'device_id',
-                                                                u'transport',
-                                                                u'interface_bindings',
-                                                                u'subscription'],
-                                                  u'type': u'object'}],
-                                      u'description': u'Describes a receiver',
-                                      u'title': u'Receiver resource',
-                                      u'type': u'object'},
-                                     {u'properties': {u'caps': {u'description': u'Capabilities',
-                                                                u'properties': {u'media_types': {u'description': u'Subclassification of the formats accepted using IANA assigned media types',
-                                                                                                 u'items': {u'anyOf': [{u'enum': [u'video/smpte291']},
-                                                                                                                       {u'pattern': u'^[^\\s\\/]+\\/[^\\s\\/]+$'}],
-                                                                                                            u'type': u'string'},
-                                                                                                 u'minItems': 1,
-                                                                                                 u'type': u'array'}},
-                                                                u'type': u'object'},
-                                                      u'format': {u'description': u'Type of Flow accepted by the Receiver as a URN',
-                                                                  u'enum': [u'urn:x-nmos:format:data'],
-                                                                  u'format': u'uri',
-                                                                  u'type': u'string'}},
-                                      u'required': [u'format', u'caps'],
-                                      u'type': u'object'}],
-                          u'description': u'Describes a data Receiver',
-                          u'title': u'Data Receiver resource',
-                          u'type': u'object'},
-                         {u'$schema': u'http://json-schema.org/draft-04/schema#',
-                          u'allOf': [{u'$schema': u'http://json-schema.org/draft-04/schema#',
-                                      u'allOf': [{u'$schema': u'http://json-schema.org/draft-04/schema#',
-                                                  u'description': u'Describes the foundations of all NMOS resources',
-                                                  u'properties': {u'description': {u'description': u'Detailed description of the resource',
-                                                                                   u'type': u'string'},
-                                                                  u'id': {u'description': u'Globally unique identifier for the resource',
-                                                                          u'pattern': u'^[0-9a-f]{8}-[0-9a-f]{4}-[1-5][0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}$',
-                                                                          u'type': u'string'},
-                                                                  u'label': {u'description': u'Freeform string label for the resource',
-                                                                             u'type': u'string'},
-                                                                  u'tags': {u'description': u'Key value set of freeform string tags to aid in filtering resources. Values should be represented as an array of strings. Can be empty.',
-                                                                            u'patternProperties': {u'': {u'items': {u'type': u'string'},
-                                                                                                         u'type': u'array'}},
-                                                                            u'type': u'object'},
-                                                                  u'version': {u'description': u'String formatted TAI timestamp (<seconds>:<nanoseconds>) indicating precisely when an attribute of the resource last changed',
-                                                                               u'pattern': u'^[0-9]+:[0-9]+$',
-                                                                               u'type': u'string'}},
-                                                  u'required': [u'id',
-                                                                u'version',
-                                                                u'label',
-                                                                u'description',
-                                                                u'tags'],
-                                                  u'title': u'Base resource',
-                                                  u'type': u'object'},
-                                                 {u'properties': {u'device_id': {u'description': u'Device ID which this Receiver forms part of. This attribute is used to ensure referential integrity by registry implementations.',
-                                                                                 u'pattern': u'^[0-9a-f]{8}-[0-9a-f]{4}-[1-5][0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}$',
-                                                                                 u'type': u'string'},
-                                                                  u'interface_bindings': {u'description': u"Binding of Receiver ingress ports to interfaces on the parent Node. Should contain a single network interface unless a redundancy mechanism such as ST.2022-7 is in use, in which case each 'leg' should have its matching interface listed. Where the redundancy mechanism receives more than one copy of the stream via the same interface, that interface should be listed a corresponding number of times.",
-                                                                                          u'items': {u'type': u'string'},
-                                                                                          u'type': u'array'},
-                                                                  u'subscription': {u'description': u"Object containing the 'sender_id' currently subscribed to. Sender_id should be null on initialisation, or when connected to a non-NMOS Sender.",
-                                                                                    u'properties': {u'active': {u'default': False,
-                                                                                                                u'description': u"Receiver is enabled and configured with a Sender's connection parameters",
-                                                                                                                u'type': u'boolean'},
-                                                                                                    u'sender_id': {u'default': None,
-                                                                                                                   u'description': u'UUID of the Sender that this Receiver is currently subscribed to',
-                                                                                                                   u'pattern': u'^[0-9a-f]{8}-[0-9a-f]{4}-[1-5][0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}$',
-                                                                                                                   u'type': [u'string',
-                                                                                                                             u'null']}},
-                                                                                    u'required': [u'sender_id',
-                                                                                                  u'active'],
-                                                                                    u'type': u'object'},
-                                                                  u'transport': {u'description': u'Transport type accepted by the Receiver in URN format',
-                                                                                 u'format': u'uri',
-                                                                                 u'oneOf': [{u'enum': [u'urn:x-nmos:transport:rtp',
-                                                                                                       u'urn:x-nmos:transport:rtp.ucast',
-                                                                                                       u'urn:x-nmos:transport:rtp.mcast',
-                                                                                                       u'urn:x-nmos:transport:dash']},
-                                                                                            {u'not': {u'pattern': u'^urn:x-nmos:'}}],
-                                                                                 u'type': u'string'}},
-                                                  u'required': [u'device_id',
-                                                                u'transport',
-                                                                u'interface_bindings',
-                                                                u'subscription'],
-                                                  u'type': u'object'}],
-                                      u'description': u'Describes a receiver',
-                                      u'title': u'Receiver resource',
-                                      u'type': u'object'},
-                                     {u'properties': {u'caps': {u'description': u'Capabilities',
-                                                                u'properties': {u'media_types': {u'description': u'Subclassification of the formats accepted using IANA assigned media types',
-                                                                                                 u'items': {u'anyOf': [{u'enum': [u'video/SMPTE2022-6']},
-                                                                                                                       {u'pattern': u'^[^\\s\\/]+\\/[^\\s\\/]+$'}],
-                                                                                                            u'type': u'string'},
-                                                                                                 u'minItems': 1,
-                                                                                                 u'type': u'array'}},
-                                                                u'type': u'object'},
-                                                      u'format': {u'description': u'Type of Flow accepted by the Receiver as a URN',
-                                                                  u'enum': [u'urn:x-nmos:format:mux'],
-                                                                  u'format': u'uri',
-                                                                  u'type': u'string'}},
-                                      u'required': [u'format', u'caps'],
-                                      u'type': u'object'}],
-                          u'description': u'Describes a mux Receiver',
-                          u'title': u'Mux Receiver resource',
-                          u'type': u'object'}],
-              u'title': u'Receiver resource',
-              u'type': u'object'},
- 'sender': {u'$schema': u'http://json-schema.org/draft-04/schema#',
-            u'allOf': [{u'$schema': u'http://json-schema.org/draft-04/schema#',
-                        u'description': u'Describes the foundations of all NMOS resources',
-                        u'properties': {u'description': {u'description': u'Detailed description of the resource',
-                                                         u'type': u'string'},
-                                        u'id': {u'description': u'Globally unique identifier for the resource',
-                                                u'pattern': u'^[0-9a-f]{8}-[0-9a-f]{4}-[1-5][0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}$',
-                                                u'type': u'string'},
-                                        u'label': {u'description': u'Freeform string label for the resource',
-                                                   u'type': u'string'},
-                                        u'tags': {u'description': u'Key value set of freeform string tags to aid in filtering resources. Values should be represented as an array of strings. Can be empty.',
-                                                  u'patternProperties': {u'': {u'items': {u'type': u'string'},
-                                                                               u'type': u'array'}},
-                                                  u'type': u'object'},
-                                        u'version': {u'description': u'String formatted TAI timestamp (<seconds>:<nanoseconds>) indicating precisely when an attribute of the resource last changed',
-                                                     u'pattern': u'^[0-9]+:[0-9]+$',
-                                                     u'type': u'string'}},
-                        u'required': [u'id',
-                                      u'version',
-                                      u'label',
-                                      u'description',
-                                      u'tags'],
-                        u'title': u'Base resource',
-                        u'type': u'object'},
-                       {u'properties': {u'caps': {u'description': u'Capabilities of this sender',
-                                                  u'properties': {},
-                                                  u'type': u'object'},
-                                        u'device_id': {u'description': u'Device ID which this Sender forms part of. This attribute is used to ensure referential integrity by registry implementations.',
-                                                       u'pattern': u'^[0-9a-f]{8}-[0-9a-f]{4}-[1-5][0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}$',
-                                                       u'type': u'string'},
-                                        u'flow_id': {u'default': None,
-                                                     u'description': u'ID of the Flow currently passing via this Sender',
-                                                     u'pattern': u'^[0-9a-f]{8}-[0-9a-f]{4}-[1-5][0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}$',
-                                                     u'type': [u'string',
-                                                               u'null']},
-                                        u'interface_bindings': {u'description': u"Binding of Sender egress ports to interfaces on the parent Node. Should contain a single network interface unless a redundancy mechanism such as ST.2022-7 is in use, in which case each 'leg' should have its matching interface listed. Where the redundancy mechanism sends more than one copy of the stream via the same interface, that interface should be listed a corresponding number of times.",
-                                                                u'items': {u'type': u'string'},
-                                                                u'type': u'array'},
-                                        u'manifest_href': {u'description': u"HTTP URL to a file describing how to connect to the Sender (SDP for RTP). The Sender's 'version' attribute should be updated if the contents of this file are modified. This URL may return an HTTP 404 where the 'active' parameter in the 'subscription' object is present and set to false (v1.2+ only).",
-                                                           u'format': u'uri',
-                                                           u'type': u'string'},
-                                        u'subscription': {u'description': u"Object containing the 'receiver_id' currently subscribed to (unicast only). Receiver_id should be null on initialisation, or when connected to a non-NMOS unicast Receiver.",
-                                                          u'properties': {u'active': {u'default': False,
-                                                                                      u'description': u'Sender is enabled and configured to stream data to a single Receiver (unicast), or to the network via multicast or a pull-based mechanism',
-                                                                                      u'type': u'boolean'},
-                                                                          u'receiver_id': {u'default': None,
-                                                                                           u'description': u'UUID of the Receiver that this Sender is currently subscribed to',
-                                                                                           u'pattern': u'^[0-9a-f]{8}-[0-9a-f]{4}-[1-5][0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}$',
-                                                                                           u'type': [u'string',
-                                                                                                     u'null']}},
-                                                          u'required': [u'receiver_id',
-                                                                        u'active'],
-                                                          u'type': u'object'},
-                                        u'transport': {u'description': u'Transport type used by the Sender in URN format',
-                                                       u'format': u'uri',
-                                                       u'oneOf': [{u'enum': [u'urn:x-nmos:transport:rtp',
-                                                                             u'urn:x-nmos:transport:rtp.ucast',
-                                                                             u'urn:x-nmos:transport:rtp.mcast',
-                                                                             u'urn:x-nmos:transport:dash']},
-                                                                  {u'not': {u'pattern': u'^urn:x-nmos:'}}],
-                                                       u'type': u'string'}},
-                        u'required': [u'flow_id',
-                                      u'transport',
-                                      u'device_id',
-                                      u'manifest_href',
-                                      u'interface_bindings',
-                                      u'subscription'],
-                        u'type': u'object'}],
-            u'description': u'Describes a sender',
-            u'title': u'Sender resource',
-            u'type': u'object'},
- 'source': {u'$schema': u'http://json-schema.org/draft-04/schema#',
-            u'description': u'Describes a Source',
-            u'oneOf': [{u'$schema': u'http://json-schema.org/draft-04/schema#',
-                        u'allOf': [{u'$schema': u'http://json-schema.org/draft-04/schema#',
-                                    u'allOf': [{u'$schema': u'http://json-schema.org/draft-04/schema#',
-                                                u'description': u'Describes the foundations of all NMOS resources',
-                                                u'properties': {u'description': {u'description': u'Detailed description of the resource',
-                                                                                 u'type': u'string'},
-                                                                u'id': {u'description': u'Globally unique identifier for the resource',
-                                                                        u'pattern': u'^[0-9a-f]{8}-[0-9a-f]{4}-[1-5][0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}$',
-                                                                        u'type': u'string'},
-                                                                u'label': {u'description': u'Freeform string label for the resource',
-                                                                           u'type': u'string'},
-                                                                u'tags': {u'description': u'Key value set of freeform string tags to aid in filtering resources. Values should be represented as an array of strings. Can be empty.',
-                                                                          u'patternProperties': {u'': {u'items': {u'type': u'string'},
-                                                                                                       u'type': u'array'}},
-                                                                          u'type': u'object'},
-                                                                u'version': {u'description': u'String formatted TAI timestamp (<seconds>:<nanoseconds>) indicating precisely when an attribute of the resource last changed',
-                                                                             u'pattern': u'^[0-9]+:[0-9]+$',
-                                                                             u'type': u'string'}},
-                                                u'required': [u'id',
-                                                              u'version',
-                                                              u'label',
-                                                              u'description',
-                                                              u'tags'],
-                                                u'title': u'Base resource',
-                                                u'type': u'object'},
-                                               {u'properties': {u'caps': {u'description': u'Capabilities (not yet defined)',
-                                                                          u'type': u'object'},
-                                                                u'clock_name': {u'description': u'Reference to clock in the originating Node',
-                                                                                u'pattern': u'^clk[0-9]+$',
-                                                                                u'type': [u'string',
-                                                                                          u'null']},
-                                                                u'device_id': {u'description': u'Globally unique identifier for the Device which initially created the Source. This attribute is used to ensure referential integrity by registry implementations.',
-                                                                               u'pattern': u'^[0-9a-f]{8}-[0-9a-f]{4}-[1-5][0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}$',
-                                                                               u'type': u'string'},
-                                                                u'grain_rate': {u'description': u'Maximum number of Grains per second for Flows derived from this Source. Corresponding Flow Grain rates may override this attribute. Grain rate matches the frame rate for video (see NMOS Content Model). Specified for periodic Sources only.',
-                                                                                u'properties': {u'denominator': {u'default': 1,
-                                                                                                                 u'description': u'Denominator',
-                                                                                                                 u'type': u'integer'},
-                                                                                                u'numerator': {u'description': u'Numerator',
-                                                                                                               u'type': u'integer'}},
-                                                                                u'required': [u'numerator'],
-                                                                                u'type': u'object'},
-                                                                u'parents': {u'description': u'Array of UUIDs representing the Source IDs of Grains which came together at the input to this Source (may change over the lifetime of this Source)',
-                                                                             u'items': {u'pattern': u'^[0-9a-f]{8}-[0-9a-f]{4}-[1-5][0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}$',
-                                                                                        u'type': u'string'},
-                                                                             u'type': u'array'}},
-                                                u'required': [u'caps',
-                                                              u'device_id',
-                                                              u'parents',
-                                                              u'clock_name'],
-                                                u'type': u'object'}],
-                                    u'description': u'Describes a Source',
-                                    u'title': u'Source resource',
-                                    u'type': u'object'},
-                                   {u'properties': {u'format': {u'description': u'Format of the data coming from the Source as a URN',
-                                                                u'enum': [u'urn:x-nmos:format:video',
-                                                                          u'urn:x-nmos:format:data',
-                                                                          u'urn:x-nmos:format:mux'],
-                                                                u'format': u'uri',
-                                                                u'type': u'string'}},
-                                    u'required': [u'format'],
-                                    u'type': u'object'}],
-                        u'description': u'Describes a generic Source',
-                        u'title': u'Generic Source resource',
-                        u'type': u'object'},
-                       {u'$schema': u'http://json-schema.org/draft-04/schema#',
-                        u'allOf': [{u'$schema': u'http://json-schema.org/draft-04/schema#',
-                                    u'allOf': [{u'$schema': u'http://json-schema.org/draft-04/schema#',
-                                                u'description': u'Describes the foundations of all NMOS resources',
-                                                u'properties': {u'description': {u'description': u'Detailed description of the resource',
-                                                                                 u'type': u'string'},
-                                                                u'id': {u'description': u'Globally unique identifier for the resource',
-                                                                        u'pattern': u'^[0-9a-f]{8}-[0-9a-f]{4}-[1-5][0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}$',
-                                                                        u'type': u'string'},
-                                                                u'label': {u'description': u'Freeform string label for the resource',
-                                                                           u'type': u'string'},
-                                                                u'tags': {u'description': u'Key value set of freeform string tags to aid in filtering resources. Values should be represented as an array of strings. Can be empty.',
-                                                                          u'patternProperties': {u'': {u'items': {u'type': u'string'},
-                                                                                                       u'type': u'array'}},
-                                                                          u'type': u'object'},
-                                                                u'version': {u'description': u'String formatted TAI timestamp (<seconds>:<nanoseconds>) indicating precisely when an attribute of the resource last changed',
-                                                                             u'pattern': u'^[0-9]+:[0-9]+$',
-                                                                             u'type': u'string'}},
-                                                u'required': [u'id',
-                                                              u'version',
-                                                              u'label',
-                                                              u'description',
-                                                              u'tags'],
-                                                u'title': u'Base resource',
-                                                u'type': u'object'},
-                                               {u'properties': {u'caps': {u'description': u'Capabilities (not yet defined)',
-                                                                          u'type': u'object'},
-                                                                u'clock_name': {u'description': u'Reference to clock in the originating Node',
-                                                                                u'pattern': u'^clk[0-9]+$',
-                                                                                u'type': [u'string',
-                                                                                          u'null']},
-                                                                u'device_id': {u'description': u'Globally unique identifier for the Device which initially created the Source. This attribute is used to ensure referential integrity by registry implementations.',
-                                                                               u'pattern': u'^[0-9a-f]{8}-[0-9a-f]{4}-[1-5][0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}$',
-                                                                               u'type': u'string'},
-                                                                u'grain_rate': {u'description': u'Maximum number of Grains per second for Flows derived from this Source. Corresponding Flow Grain rates may override this attribute. Grain rate matches the frame rate for video (see NMOS Content Model). Specified for periodic Sources only.',
-                                                                                u'properties': {u'denominator': {u'default': 1,
-                                                                                                                 u'description': u'Denominator',
-                                                                                                                 u'type': u'integer'},
-                                                                                                u'numerator': {u'description': u'Numerator',
-                                                                                                               u'type': u'integer'}},
-                                                                                u'required': [u'numerator'],
-                                                                                u'type': u'object'},
-                                                                u'parents': {u'description': u'Array of UUIDs representing the Source IDs of Grains which came together at the input to this Source (may change over the lifetime of this Source)',
-                                                                             u'items': {u'pattern': u'^[0-9a-f]{8}-[0-9a-f]{4}-[1-5][0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}$',
-                                                                                        u'type': u'string'},
-                                                                             u'type': u'array'}},
-                                                u'required': [u'caps',
-                                                              u'device_id',
-                                                              u'parents',
-                                                              u'clock_name'],
-                                                u'type': u'object'}],
-                                    u'description': u'Describes a Source',
-                                    u'title': u'Source resource',
-                                    u'type': u'object'},
-                                   {u'properties': {u'channels': {u'description': u'Array of objects describing the audio channels',
-                                                                  u'items': {u'properties': {u'label': {u'description': u'Label for this channel (free text)',
-                                                                                                        u'type': u'string'},
-                                                                                             u'symbol': {u'description': u'Symbol for this channel (from VSF TR-03 Appendix A)',
-                                                                                                         u'oneOf': [{u'enum': [u'L',
-                                                                                                                               u'R',
-                                                                                                                               u'C',
-                                                                                                                               u'LFE',
-                                                                                                                               u'Ls',
-                                                                                                                               u'Rs',
-                                                                                                                               u'Lss',
-                                                                                                                               u'Rss',
-                                                                                                                               u'Lrs',
-                                                                                                                               u'Rrs',
-                                                                                                                               u'Lc',
-                                                                                                                               u'Rc',
-                                                                                                                               u'Cs',
-                                                                                                                               u'HI',
-                                                                                                                               u'VIN',
-                                                                                                                               u'M1',
-                                                                                                                               u'M2',
-                                                                                                                               u'Lt',
-                                                                                                                               u'Rt',
-                                                                                                                               u'Lst',
-                                                                                                                               u'Rst',
-                                                                                                                               u'S']},
-                                                                                                                    {u'description': u'Numbered Source Channel',
-                                                                                                                     u'pattern': u'NSC(0[0-9]{2}|1[0-1]{1}[0-9]{1}|12[0-7]{1})'},
-                                                                                                                    {u'description': u'Undefined channel',
-                                                                                                                     u'pattern': u'U(0[1-9]{1}|[1-5]{1}[0-9]{1}|6[0-4]{1})'}],
-                                                                                                         u'type': u'string'}},
-                                                                             u'required': [u'label'],
-                                                                             u'title': u'Component',
-                                                                             u'type': u'object'},
-                                                                  u'minItems': 1,
-                                                                  u'type': u'array'},
-                                                    u'format': {u'description': u'Format of the data coming from the Source as a URN',
-                                                                u'enum': [u'urn:x-nmos:format:audio'],
-                                                                u'format': u'uri',
-                                                                u'type': u'string'}},
-                                    u'required': [u'format', u'channels'],
-                                    u'type': u'object'}],
-                        u'description': u'Describes an audio Source',
-                        u'title': u'Audio Source resource',
-                        u'type': u'object'}],
-            u'title': u'Source resource',
-            u'type': u'object'}}
+DEFINITIONS = {'clock_internal.json': {'$schema': 'http://json-schema.org/draft-04/schema#',
+                         'description': 'Describes a clock with no external reference',
+                         'properties': {'name': {'description': 'Name of this refclock (unique for this set of clocks)',
+                                                 'pattern': '^clk[0-9]+$',
+                                                 'type': 'string'},
+                                        'ref_type': {'description': 'Type of external reference used by this clock',
+                                                     'enum': ['internal'],
+                                                     'type': 'string'}},
+                         'required': ['name', 'ref_type'],
+                         'title': 'Clock with no external reference',
+                         'type': 'object'},
+ 'clock_ptp.json': {'$schema': 'http://json-schema.org/draft-04/schema#',
+                    'description': 'Describes a clock referenced to PTP',
+                    'properties': {'gmid': {'description': 'ID of the PTP reference used by this clock',
+                                            'pattern': '^[0-9a-f]{2}-[0-9a-f]{2}-[0-9a-f]{2}-[0-9a-f]{2}-[0-9a-f]{2}-[0-9a-f]{2}-[0-9a-f]{2}-[0-9a-f]{2}$',
+                                            'type': 'string'},
+                                   'locked': {'description': 'Lock state of this clock to the external reference. If '
+                                                             'true, this device is slaved, otherwise it has no defined '
+                                                             'relationship to the external reference',
+                                              'type': 'boolean'},
+                                   'name': {'description': 'Name of this refclock (unique for this set of clocks)',
+                                            'pattern': '^clk[0-9]+$',
+                                            'type': 'string'},
+                                   'ref_type': {'description': 'Type of external reference used by this clock',
+                                                'enum': ['ptp'],
+                                                'type': 'string'},
+                                   'traceable': {'description': 'External refclock is synchronised to International '
+                                                                'Atomic Time (TAI)',
+                                                 'type': 'boolean'},
+                                   'version': {'description': 'Version of PTP reference used by this clock',
+                                               'enum': ['IEEE1588-2008'],
+                                               'type': 'string'}},
+                    'required': ['name', 'ref_type', 'traceable', 'version', 'gmid', 'locked'],
+                    'title': 'PTP clock',
+                    'type': 'object'},
+ 'device.json': {'$schema': 'http://json-schema.org/draft-04/schema#',
+                 'allOf': [{'$ref': 'resource_core.json'},
+                           {'properties': {'controls': {'description': 'Control endpoints exposed for the Device',
+                                                        'items': {'properties': {'href': {'description': 'URL to reach '
+                                                                                                         'a control '
+                                                                                                         'endpoint, '
+                                                                                                         'whether http '
+                                                                                                         'or otherwise',
+                                                                                          'format': 'uri',
+                                                                                          'type': 'string'},
+                                                                                 'type': {'description': 'URN '
+                                                                                                         'identifying '
+                                                                                                         'the control '
+                                                                                                         'format',
+                                                                                          'format': 'uri',
+                                                                                          'type': 'string'}},
+                                                                  'required': ['href', 'type'],
+                                                                  'type': 'object'},
+                                                        'type': 'array'},
+                                           'node_id': {'description': 'Globally unique identifier for the Node which '
+                                                                      'initially created the Device. This attribute is '
+                                                                      'used to ensure referential integrity by '
+                                                                      'registry implementations.',
+                                                       'pattern': '^[0-9a-f]{8}-[0-9a-f]{4}-[1-5][0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}$',
+                                                       'type': 'string'},
+                                           'receivers': {'description': 'UUIDs of Receivers attached to the Device '
+                                                                        '(deprecated)',
+                                                         'items': {'pattern': '^[0-9a-f]{8}-[0-9a-f]{4}-[1-5][0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}$',
+                                                                   'type': 'string'},
+                                                         'type': 'array'},
+                                           'senders': {'description': 'UUIDs of Senders attached to the Device '
+                                                                      '(deprecated)',
+                                                       'items': {'pattern': '^[0-9a-f]{8}-[0-9a-f]{4}-[1-5][0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}$',
+                                                                 'type': 'string'},
+                                                       'type': 'array'},
+                                           'type': {'description': 'Device type URN',
+                                                    'format': 'uri',
+                                                    'oneOf': [{'enum': ['urn:x-nmos:device:generic',
+                                                                        'urn:x-nmos:device:pipeline']},
+                                                              {'not': {'pattern': '^urn:x-nmos:'}}],
+                                                    'type': 'string'}},
+                            'required': ['type', 'node_id', 'senders', 'receivers', 'controls'],
+                            'type': 'object'}],
+                 'description': 'Describes a Device',
+                 'title': 'Device resource',
+                 'type': 'object'},
+ 'flow.json': {'$schema': 'http://json-schema.org/draft-04/schema#',
+               'anyOf': [{'$ref': 'flow_video_raw.json'},
+                         {'$ref': 'flow_video_coded.json'},
+                         {'$ref': 'flow_audio_raw.json'},
+                         {'$ref': 'flow_audio_coded.json'},
+                         {'$ref': 'flow_data.json'},
+                         {'$ref': 'flow_sdianc_data.json'},
+                         {'$ref': 'flow_mux.json'}],
+               'description': 'Describes a Flow',
+               'title': 'Flow resource',
+               'type': 'object'},
+ 'flow_audio.json': {'$schema': 'http://json-schema.org/draft-04/schema#',
+                     'allOf': [{'$ref': 'flow_core.json'},
+                               {'properties': {'format': {'description': 'Format of the data coming from the Flow as a '
+                                                                         'URN',
+                                                          'enum': ['urn:x-nmos:format:audio'],
+                                                          'format': 'uri',
+                                                          'type': 'string'},
+                                               'sample_rate': {'description': 'Number of audio samples per second for '
+                                                                              'this Flow',
+                                                               'properties': {'denominator': {'default': 1,
+                                                                                              'description': 'Denominator',
+                                                                                              'type': 'integer'},
+                                                                              'numerator': {'description': 'Numerator',
+                                                                                            'type': 'integer'}},
+                                                               'required': ['numerator'],
+                                                               'type': 'object'}},
+                                'required': ['format', 'sample_rate'],
+                                'type': 'object'}],
+                     'description': 'Describes an audio Flow',
+                     'title': 'Audio Flow resource',
+                     'type': 'object'},
+ 'flow_audio_coded.json': {'$schema': 'http://json-schema.org/draft-04/schema#',
+                           'allOf': [{'$ref': 'flow_audio.json'},
+                                     {'properties': {'media_type': {'description': 'Subclassification of the format '
+                                                                                   'using IANA assigned media types',
+                                                                    'not': {'pattern': '^audio\\/L[0-9]+$'},
+                                                                    'pattern': '^audio\\/[^\\s\\/]+$',
+                                                                    'type': 'string'}},
+                                      'required': ['media_type'],
+                                      'type': 'object'}],
+                           'description': 'Describes a coded audio Flow',
+                           'title': 'Coded Audio Flow resource',
+                           'type': 'object'},
+ 'flow_audio_raw.json': {'$schema': 'http://json-schema.org/draft-04/schema#',
+                         'allOf': [{'$ref': 'flow_audio.json'},
+                                   {'properties': {'bit_depth': {'description': 'Bit depth of the audio samples',
+                                                                 'type': 'integer'},
+                                                   'media_type': {'anyOf': [{'enum': ['audio/L24',
+                                                                                      'audio/L20',
+                                                                                      'audio/L16',
+                                                                                      'audio/L8']},
+                                                                            {'pattern': '^audio\\/[^\\s\\/]+$'}],
+                                                                  'description': 'Subclassification of the format '
+                                                                                 'using IANA assigned media types',
+                                                                  'type': 'string'}},
+                                    'required': ['media_type', 'bit_depth'],
+                                    'type': 'object'}],
+                         'description': 'Describes a raw audio Flow',
+                         'title': 'Raw Audio Flow resource',
+                         'type': 'object'},
+ 'flow_core.json': {'$schema': 'http://json-schema.org/draft-04/schema#',
+                    'allOf': [{'$ref': 'resource_core.json'},
+                              {'properties': {'device_id': {'description': 'Globally unique identifier for the Device '
+                                                                           'which initially created the Flow. This '
+                                                                           'attribute is used to ensure referential '
+                                                                           'integrity by registry implementations '
+                                                                           '(v1.1 onwards).',
+                                                            'pattern': '^[0-9a-f]{8}-[0-9a-f]{4}-[1-5][0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}$',
+                                                            'type': 'string'},
+                                              'grain_rate': {'description': 'Number of Grains per second for this '
+                                                                            'Flow. Must be an integer division of, or '
+                                                                            'equal to the Grain rate specified by the '
+                                                                            'parent Source. Grain rate matches the '
+                                                                            'frame rate for video (see NMOS Content '
+                                                                            'Model). Specified for periodic Flows '
+                                                                            'only.',
+                                                             'properties': {'denominator': {'default': 1,
+                                                                                            'description': 'Denominator',
+                                                                                            'type': 'integer'},
+                                                                            'numerator': {'description': 'Numerator',
+                                                                                          'type': 'integer'}},
+                                                             'required': ['numerator'],
+                                                             'type': 'object'},
+                                              'parents': {'description': 'Array of UUIDs representing the Flow IDs of '
+                                                                         'Grains which came together to generate this '
+                                                                         'Flow (may change over the lifetime of this '
+                                                                         'Flow)',
+                                                          'items': {'pattern': '^[0-9a-f]{8}-[0-9a-f]{4}-[1-5][0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}$',
+                                                                    'type': 'string'},
+                                                          'type': 'array'},
+                                              'source_id': {'description': 'Globally unique identifier for the Source '
+                                                                           'which initially created the Flow. This '
+                                                                           'attribute is used to ensure referential '
+                                                                           'integrity by registry implementations '
+                                                                           '(v1.0 only).',
+                                                            'pattern': '^[0-9a-f]{8}-[0-9a-f]{4}-[1-5][0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}$',
+                                                            'type': 'string'}},
+                               'required': ['source_id', 'device_id', 'parents'],
+                               'type': 'object'}],
+                    'description': 'Describes a Flow',
+                    'title': 'Flow resource',
+                    'type': 'object'},
+ 'flow_data.json': {'$schema': 'http://json-schema.org/draft-04/schema#',
+                    'allOf': [{'$ref': 'flow_core.json'},
+                              {'properties': {'format': {'description': 'Format of the data coming from the Flow as a '
+                                                                        'URN',
+                                                         'enum': ['urn:x-nmos:format:data'],
+                                                         'format': 'uri',
+                                                         'type': 'string'},
+                                              'media_type': {'description': 'Subclassification of the format using '
+                                                                            'IANA assigned media types',
+                                                             'not': {'enum': ['video/smpte291']},
+                                                             'pattern': '^[^\\s\\/]+\\/[^\\s\\/]+$',
+                                                             'type': 'string'}},
+                               'required': ['format', 'media_type'],
+                               'type': 'object'}],
+                    'description': 'Describes a generic data Flow',
+                    'title': 'Generic data Flow resource',
+                    'type': 'object'},
+ 'flow_mux.json': {'$schema': 'http://json-schema.org/draft-04/schema#',
+                   'allOf': [{'$ref': 'flow_core.json'},
+                             {'properties': {'format': {'description': 'Format of the data coming from the Flow as a '
+                                                                       'URN',
+                                                        'enum': ['urn:x-nmos:format:mux'],
+                                                        'format': 'uri',
+                                                        'type': 'string'},
+                                             'media_type': {'anyOf': [{'enum': ['video/SMPTE2022-6']},
+                                                                      {'pattern': '^[^\\s\\/]+\\/[^\\s\\/]+$'}],
+                                                            'description': 'Subclassification of the format using IANA '
+                                                                           'assigned media types',
+                                                            'type': 'string'}},
+                              'required': ['format', 'media_type'],
+                              'type': 'object'}],
+                   'description': 'Describes a mux Flow',
+                   'title': 'Mux Flow resource',
+                   'type': 'object'},
+ 'flow_sdianc_data.json': {'$schema': 'http://json-schema.org/draft-04/schema#',
+                           'allOf': [{'$ref': 'flow_core.json'},
+                                     {'properties': {'DID_SDID': {'description': 'List of Data identification and '
+                                                                                 'Secondary data identification words',
+                                                                  'items': {'properties': {'DID': {'description': 'Data '
+                                                                                                                  'identification '
+                                                                                                                  'word',
+                                                                                                   'pattern': '^0x[0-9a-fA-F]{2}$',
+                                                                                                   'type': 'string'},
+                                                                                           'SDID': {'description': 'Secondary '
+                                                                                                                   'data '
+                                                                                                                   'identification '
+                                                                                                                   'word',
+                                                                                                    'pattern': '^0x[0-9a-fA-F]{2}$',
+                                                                                                    'type': 'string'}},
+                                                                            'title': 'entry',
+                                                                            'type': 'object'},
+                                                                  'type': 'array'},
+                                                     'format': {'description': 'Format of the data coming from the '
+                                                                               'Flow as a URN',
+                                                                'enum': ['urn:x-nmos:format:data'],
+                                                                'format': 'uri',
+                                                                'type': 'string'},
+                                                     'media_type': {'description': 'Subclassification of the format '
+                                                                                   'using IANA assigned media types',
+                                                                    'enum': ['video/smpte291'],
+                                                                    'type': 'string'}},
+                                      'required': ['format', 'media_type'],
+                                      'type': 'object'}],
+                           'description': 'Describes an SDI ancillary Flow',
+                           'title': 'SDI ancillary Flow resource',
+                           'type': 'object'},
+ 'flow_video.json': {'$schema': 'http://json-schema.org/draft-04/schema#',
+                     'allOf': [{'$ref': 'flow_core.json'},
+                               {'properties': {'colorspace': {'description': 'Colorspace used for the video',
+                                                              'enum': ['BT601', 'BT709', 'BT2020', 'BT2100'],
+                                                              'type': 'string'},
+                                               'format': {'description': 'Format of the data coming from the Flow as a '
+                                                                         'URN',
+                                                          'enum': ['urn:x-nmos:format:video'],
+                                                          'format': 'uri',
+                                                          'type': 'string'},
+                                               'frame_height': {'description': 'Height of the picture in pixels',
+                                                                'type': 'integer'},
+                                               'frame_width': {'description': 'Width of the picture in pixels',
+                                                               'type': 'integer'},
+                                               'interlace_mode': {'default': 'progressive',
+                                                                  'description': 'Interlaced video mode for frames in '
+                                                                                 'this Flow',
+                                                                  'enum': ['progressive',
+                                                                           'interlaced_tff',
+                                                                           'interlaced_bff',
+                                                                           'interlaced_psf'],
+                                                                  'type': 'string'},
+                                               'transfer_characteristic': {'default': 'SDR',
+                                                                           'description': 'Transfer characteristic',
+                                                                           'enum': ['SDR', 'HLG', 'PQ'],
+                                                                           'type': 'string'}},
+                                'required': ['format', 'frame_width', 'frame_height', 'colorspace'],
+                                'type': 'object'}],
+                     'description': 'Describes a Video Flow',
+                     'title': 'Video Flow resource',
+                     'type': 'object'},
+ 'flow_video_coded.json': {'$schema': 'http://json-schema.org/draft-04/schema#',
+                           'allOf': [{'$ref': 'flow_video.json'},
+                                     {'properties': {'media_type': {'anyOf': [{'enum': ['video/H264', 'video/vc2']},
+                                                                              {'pattern': '^video\\/[^\\s\\/]+$'}],
+                                                                    'description': 'Subclassification of the format '
+                                                                                   'using IANA assigned media types',
+                                                                    'not': {'enum': ['video/raw']},
+                                                                    'type': 'string'}},
+                                      'required': ['media_type'],
+                                      'type': 'object'}],
+                           'description': 'Describes a coded Video Flow',
+                           'title': 'Coded Video Flow resource',
+                           'type': 'object'},
+ 'flow_video_raw.json': {'$schema': 'http://json-schema.org/draft-04/schema#',
+                         'allOf': [{'$ref': 'flow_video.json'},
+                                   {'properties': {'components': {'description': 'Array of objects describing the '
+                                                                                 'components',
+                                                                  'items': {'properties': {'bit_depth': {'description': 'Number '
+                                                                                                                        'of '
+                                                                                                                        'bits '
+                                                                                                                        'used '
+                                                                                                                        'to '
+                                                                                                                        'describe '
+                                                                                                                        'each '
+                                                                                                                        'sample',
+                                                                                                         'type': 'integer'},
+                                                                                           'height': {'description': 'Height '
+                                                                                                                     'of '
+                                                                                                                     'this '
+                                                                                                                     'component '
+                                                                                                                     'in '
+                                                                                                                     'pixels',
+                                                                                                      'type': 'integer'},
+                                                                                           'name': {'description': 'Name '
+                                                                                                                   'of '
+                                                                                                                   'this '
+                                                                                                                   'component',
+                                                                                                    'enum': ['Y',
+                                                                                                             'Cb',
+                                                                                                             'Cr',
+                                                                                                             'I',
+                                                                                                             'Ct',
+                                                                                                             'Cp',
+                                                                                                             'A',
+                                                                                                             'R',
+                                                                                                             'G',
+                                                                                                             'B',
+                                                                                                             'DepthMap'],
+                                                                                                    'type': 'string'},
+                                                                                           'width': {'description': 'Width '
+                                                                                                                    'of '
+                                                                                                                    'this '
+                                                                                                                    'component '
+                                                                                                                    'in '
+                                                                                                                    'pixels',
+                                                                                                     'type': 'integer'}},
+                                                                            'required': ['name',
+                                                                                         'width',
+                                                                                         'height',
+                                                                                         'bit_depth'],
+                                                                            'title': 'component',
+                                                                            'type': 'object'},
+                                                                  'minItems': 1,
+                                                                  'type': 'array'},
+                                                   'media_type': {'description': 'Subclassification of the format '
+                                                                                 'using IANA assigned media types',
+                                                                  'enum': ['video/raw'],
+                                                                  'type': 'string'}},
+                                    'required': ['media_type', 'components'],
+                                    'type': 'object'}],
+                         'description': 'Describes a raw Video Flow',
+                         'title': 'Raw Video Flow resource',
+                         'type': 'object'},
+ 'node.json': {'$schema': 'http://json-schema.org/draft-04/schema#',
+               'allOf': [{'$ref': 'resource_core.json'},
+                         {'properties': {'api': {'description': 'URL fragments required to connect to the Node API',
+                                                 'properties': {'endpoints': {'description': 'Host, port and protocol '
+                                                                                             'details required to '
+                                                                                             'connect to the API',
+                                                                              'items': {'properties': {'host': {'anyOf': [{'format': 'hostname'},
+                                                                                                                          {'format': 'ipv4'},
+                                                                                                                          {'format': 'ipv6'}],
+                                                                                                                'description': 'IP '
+                                                                                                                               'address '
+                                                                                                                               'or '
+                                                                                                                               'hostname '
+                                                                                                                               'which '
+                                                                                                                               'the '
+                                                                                                                               'Node '
+                                                                                                                               'API '
+                                                                                                                               'is '
+                                                                                                                               'running '
+                                                                                                                               'on',
+                                                                                                                'type': 'string'},
+                                                                                                       'port': {'description': 'Port '
+                                                                                                                               'number '
+                                                                                                                               'which '
+                                                                                                                               'the '
+                                                                                                                               'Node '
+                                                                                                                               'API '
+                                                                                                                               'is '
+                                                                                                                               'running '
+                                                                                                                               'on',
+                                                                                                                'maximum': 65535,
+                                                                                                                'minimum': 1,
+                                                                                                                'type': 'integer'},
+                                                                                                       'protocol': {'description': 'Protocol '
+                                                                                                                                   'supported '
+                                                                                                                                   'by '
+                                                                                                                                   'this '
+                                                                                                                                   'instance '
+                                                                                                                                   'of '
+                                                                                                                                   'the '
+                                                                                                                                   'Node '
+                                                                                                                                   'API',
+                                                                                                                    'enum': ['http',
+                                                                                                                             'https'],
+                                                                                                                    'type': 'string'}},
+                                                                                        'required': ['host',
+                                                                                                     'port',
+                                                                                                     'protocol'],
+                                                                                        'type': 'object'},
+                                                                              'type': 'array'},
+                                                                'versions': {'description': 'Supported API versions '
+                                                                                            'running on this Node',
+                                                                             'items': {'pattern': '^v[0-9]+\\.[0-9]+$',
+                                                                                       'type': 'string'},
+                                                                             'type': 'array'}},
+                                                 'required': ['versions', 'endpoints'],
+                                                 'type': 'object'},
+                                         'caps': {'description': 'Capabilities (not yet defined)', 'type': 'object'},
+                                         'clocks': {'description': 'Clocks made available to Devices owned by this '
+                                                                   'Node',
+                                                    'items': {'anyOf': [{'$ref': 'clock_internal.json'},
+                                                                        {'$ref': 'clock_ptp.json'}]},
+                                                    'type': 'array'},
+                                         'hostname': {'description': 'Node hostname (optional, deprecated)',
+                                                      'format': 'hostname',
+                                                      'type': 'string'},
+                                         'href': {'description': "HTTP access href for the Node's API (deprecated)",
+                                                  'format': 'uri',
+                                                  'type': 'string'},
+                                         'interfaces': {'description': 'Network interfaces made available to devices '
+                                                                       'owned by this Node. Port IDs and Chassis IDs '
+                                                                       'are used to inform topology discovery via '
+                                                                       'IS-06, and require that interfaces implement '
+                                                                       'ARP at a minimum, and ideally LLDP.',
+                                                        'items': {'properties': {'chassis_id': {'anyOf': [{'description': 'When '
+                                                                                                                          'the '
+                                                                                                                          'Chassis '
+                                                                                                                          'ID '
+                                                                                                                          'is '
+                                                                                                                          'a '
+                                                                                                                          'MAC '
+                                                                                                                          'address, '
+                                                                                                                          'use '
+                                                                                                                          'this '
+                                                                                                                          'format',
+                                                                                                           'pattern': '^([0-9a-f]{2}-){5}([0-9a-f]{2})$',
+                                                                                                           'type': 'string'},
+                                                                                                          {'description': 'When '
+                                                                                                                          'the '
+                                                                                                                          'Chassis '
+                                                                                                                          'ID '
+                                                                                                                          'is '
+                                                                                                                          'anything '
+                                                                                                                          'other '
+                                                                                                                          'than '
+                                                                                                                          'a '
+                                                                                                                          'MAC '
+                                                                                                                          'address, '
+                                                                                                                          'a '
+                                                                                                                          'freeform '
+                                                                                                                          'string '
+                                                                                                                          'may '
+                                                                                                                          'be '
+                                                                                                                          'used',
+                                                                                                           'pattern': '^.+$',
+                                                                                                           'type': 'string'},
+                                                                                                          {'description': 'When '
+                                                                                                                          'the '
+                                                                                                                          'Chassis '
+                                                                                                                          'ID '
+                                                                                                                          'is '
+                                                                                                                          'unavailable '
+                                                                                                                          'it '
+                                                                                                                          'should '
+                                                                                                                          'be '
+                                                                                                                          'set '
+                                                                                                                          'to '
+                                                                                                                          'null',
+                                                                                                           'type': 'null'}],
+                                                                                                'description': 'Chassis '
+                                                                                                               'ID of '
+                                                                                                               'the '
+                                                                                                               'interface, '
+                                                                                                               'as '
+                                                                                                               'signalled '
+                                                                                                               'in '
+                                                                                                               'LLDP '
+                                                                                                               'from '
+                                                                                                               'this '
+                                                                                                               'node. '
+                                                                                                               'Set to '
+                                                                                                               'null '
+                                                                                                               'where '
+                                                                                                               'LLDP '
+                                                                                                               'is '
+                                                                                                               'unsuitable '
+                                                                                                               'for '
+                                                                                                               'use '
+                                                                                                               '(ie. '
+                                                                                                               'virtualised '
+                                                                                                               'environments)'},
+                                                                                 'name': {'description': 'Name of the '
+                                                                                                         'interface '
+                                                                                                         '(unique in '
+                                                                                                         'scope of '
+                                                                                                         'this node).  '
+                                                                                                         'This '
+                                                                                                         'attribute is '
+                                                                                                         'used by '
+                                                                                                         'sub-resources '
+                                                                                                         'of this node '
+                                                                                                         'such as '
+                                                                                                         'senders and '
+                                                                                                         'receivers to '
+                                                                                                         'refer to '
+                                                                                                         'interfaces '
+                                                                                                         'to which '
+                                                                                                         'they are '
+                                                                                                         'bound.',
+                                                                                          'type': 'string'},
+                                                                                 'port_id': {'description': 'Port ID '
+                                                                                                            'of the '
+                                                                                                            'interface, '
+                                                                                                            'as '
+                                                                                                            'signalled '
+                                                                                                            'in LLDP '
+                                                                                                            'or via '
+                                                                                                            'ARP '
+                                                                                                            'responses '
+                                                                                                            'from this '
+                                                                                                            'node. '
+                                                                                                            'Must be a '
+                                                                                                            'MAC '
+                                                                                                            'address',
+                                                                                             'pattern': '^([0-9a-f]{2}-){5}([0-9a-f]{2})$',
+                                                                                             'type': 'string'}},
+                                                                  'required': ['chassis_id', 'port_id', 'name'],
+                                                                  'type': 'object'},
+                                                        'type': 'array'},
+                                         'services': {'description': 'Array of objects containing a URN format type '
+                                                                     'and href',
+                                                      'items': {'properties': {'href': {'description': 'URL to reach a '
+                                                                                                       'service '
+                                                                                                       'running on the '
+                                                                                                       'Node',
+                                                                                        'format': 'uri',
+                                                                                        'type': 'string'},
+                                                                               'type': {'description': 'URN '
+                                                                                                       'identifying '
+                                                                                                       'the type of '
+                                                                                                       'service',
+                                                                                        'format': 'uri',
+                                                                                        'type': 'string'}},
+                                                                'required': ['href', 'type'],
+                                                                'type': 'object'},
+                                                      'type': 'array'}},
+                          'required': ['href', 'caps', 'api', 'services', 'clocks', 'interfaces'],
+                          'type': 'object'}],
+               'description': 'Describes the Node and the services which run on it',
+               'title': 'Node resource',
+               'type': 'object'},
+ 'receiver.json': {'$schema': 'http://json-schema.org/draft-04/schema#',
+                   'description': 'Describes a Receiver',
+                   'oneOf': [{'$ref': 'receiver_video.json'},
+                             {'$ref': 'receiver_audio.json'},
+                             {'$ref': 'receiver_data.json'},
+                             {'$ref': 'receiver_mux.json'}],
+                   'title': 'Receiver resource',
+                   'type': 'object'},
+ 'receiver_audio.json': {'$schema': 'http://json-schema.org/draft-04/schema#',
+                         'allOf': [{'$ref': 'receiver_core.json'},
+                                   {'properties': {'caps': {'description': 'Capabilities',
+                                                            'properties': {'media_types': {'description': 'Subclassification '
+                                                                                                          'of the '
+                                                                                                          'formats '
+                                                                                                          'accepted '
+                                                                                                          'using IANA '
+                                                                                                          'assigned '
+                                                                                                          'media types',
+                                                                                           'items': {'anyOf': [{'enum': ['audio/L24',
+                                                                                                                         'audio/L20',
+                                                                                                                         'audio/L16',
+                                                                                                                         'audio/L8']},
+                                                                                                               {'pattern': '^audio\\/[^\\s\\/]+$'}],
+                                                                                                     'type': 'string'},
+                                                                                           'minItems': 1,
+                                                                                           'type': 'array'}},
+                                                            'type': 'object'},
+                                                   'format': {'description': 'Type of Flow accepted by the Receiver as '
+                                                                             'a URN',
+                                                              'enum': ['urn:x-nmos:format:audio'],
+                                                              'format': 'uri',
+                                                              'type': 'string'}},
+                                    'required': ['format', 'caps'],
+                                    'type': 'object'}],
+                         'description': 'Describes an audio Receiver',
+                         'title': 'Audio Receiver resource',
+                         'type': 'object'},
+ 'receiver_core.json': {'$schema': 'http://json-schema.org/draft-04/schema#',
+                        'allOf': [{'$ref': 'resource_core.json'},
+                                  {'properties': {'device_id': {'description': 'Device ID which this Receiver forms '
+                                                                               'part of. This attribute is used to '
+                                                                               'ensure referential integrity by '
+                                                                               'registry implementations.',
+                                                                'pattern': '^[0-9a-f]{8}-[0-9a-f]{4}-[1-5][0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}$',
+                                                                'type': 'string'},
+                                                  'interface_bindings': {'description': 'Binding of Receiver ingress '
+                                                                                        'ports to interfaces on the '
+                                                                                        'parent Node. Should contain a '
+                                                                                        'single network interface '
+                                                                                        'unless a redundancy mechanism '
+                                                                                        'such as ST.2022-7 is in use, '
+                                                                                        "in which case each 'leg' "
+                                                                                        'should have its matching '
+                                                                                        'interface listed. Where the '
+                                                                                        'redundancy mechanism receives '
+                                                                                        'more than one copy of the '
+                                                                                        'stream via the same '
+                                                                                        'interface, that interface '
+                                                                                        'should be listed a '
+                                                                                        'corresponding number of '
+                                                                                        'times.',
+                                                                         'items': {'type': 'string'},
+                                                                         'type': 'array'},
+                                                  'subscription': {'description': "Object containing the 'sender_id' "
+                                                                                  'currently subscribed to. Sender_id '
+                                                                                  'should be null on initialisation, '
+                                                                                  'or when connected to a non-NMOS '
+                                                                                  'Sender.',
+                                                                   'properties': {'active': {'default': False,
+                                                                                             'description': 'Receiver '
+                                                                                                            'is '
+                                                                                                            'enabled '
+                                                                                                            'and '
+                                                                                                            'configured '
+                                                                                                            'with a '
+                                                                                                            "Sender's "
+                                                                                                            'connection '
+                                                                                                            'parameters',
+                                                                                             'type': 'boolean'},
+                                                                                  'sender_id': {'default': None,
+                                                                                                'description': 'UUID '
+                                                                                                               'of the '
+                                                                                                               'Sender '
+                                                                                                               'that '
+                                                                                                               'this '
+                                                                                                               'Receiver '
+                                                                                                               'is '
+                                                                                                               'currently '
+                                                                                                               'subscribed '
+                                                                                                               'to',
+                                                                                                'pattern': '^[0-9a-f]{8}-[0-9a-f]{4}-[1-5][0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}$',
+                                                                                                'type': ['string',
+                                                                                                         'null']}},
+                                                                   'required': ['sender_id', 'active'],
+                                                                   'type': 'object'},
+                                                  'transport': {'description': 'Transport type accepted by the '
+                                                                               'Receiver in URN format',
+                                                                'format': 'uri',
+                                                                'oneOf': [{'enum': ['urn:x-nmos:transport:rtp',
+                                                                                    'urn:x-nmos:transport:rtp.ucast',
+                                                                                    'urn:x-nmos:transport:rtp.mcast',
+                                                                                    'urn:x-nmos:transport:dash']},
+                                                                          {'not': {'pattern': '^urn:x-nmos:'}}],
+                                                                'type': 'string'}},
+                                   'required': ['device_id', 'transport', 'interface_bindings', 'subscription'],
+                                   'type': 'object'}],
+                        'description': 'Describes a receiver',
+                        'title': 'Receiver resource',
+                        'type': 'object'},
+ 'receiver_data.json': {'$schema': 'http://json-schema.org/draft-04/schema#',
+                        'allOf': [{'$ref': 'receiver_core.json'},
+                                  {'properties': {'caps': {'description': 'Capabilities',
+                                                           'properties': {'media_types': {'description': 'Subclassification '
+                                                                                                         'of the '
+                                                                                                         'formats '
+                                                                                                         'accepted '
+                                                                                                         'using IANA '
+                                                                                                         'assigned '
+                                                                                                         'media types',
+                                                                                          'items': {'anyOf': [{'enum': ['video/smpte291']},
+                                                                                                              {'pattern': '^[^\\s\\/]+\\/[^\\s\\/]+$'}],
+                                                                                                    'type': 'string'},
+                                                                                          'minItems': 1,
+                                                                                          'type': 'array'}},
+                                                           'type': 'object'},
+                                                  'format': {'description': 'Type of Flow accepted by the Receiver as '
+                                                                            'a URN',
+                                                             'enum': ['urn:x-nmos:format:data'],
+                                                             'format': 'uri',
+                                                             'type': 'string'}},
+                                   'required': ['format', 'caps'],
+                                   'type': 'object'}],
+                        'description': 'Describes a data Receiver',
+                        'title': 'Data Receiver resource',
+                        'type': 'object'},
+ 'receiver_mux.json': {'$schema': 'http://json-schema.org/draft-04/schema#',
+                       'allOf': [{'$ref': 'receiver_core.json'},
+                                 {'properties': {'caps': {'description': 'Capabilities',
+                                                          'properties': {'media_types': {'description': 'Subclassification '
+                                                                                                        'of the '
+                                                                                                        'formats '
+                                                                                                        'accepted '
+                                                                                                        'using IANA '
+                                                                                                        'assigned '
+                                                                                                        'media types',
+                                                                                         'items': {'anyOf': [{'enum': ['video/SMPTE2022-6']},
+                                                                                                             {'pattern': '^[^\\s\\/]+\\/[^\\s\\/]+$'}],
+                                                                                                   'type': 'string'},
+                                                                                         'minItems': 1,
+                                                                                         'type': 'array'}},
+                                                          'type': 'object'},
+                                                 'format': {'description': 'Type of Flow accepted by the Receiver as a '
+                                                                           'URN',
+                                                            'enum': ['urn:x-nmos:format:mux'],
+                                                            'format': 'uri',
+                                                            'type': 'string'}},
+                                  'required': ['format', 'caps'],
+                                  'type': 'object'}],
+                       'description': 'Describes a mux Receiver',
+                       'title': 'Mux Receiver resource',
+                       'type': 'object'},
+ 'receiver_video.json': {'$schema': 'http://json-schema.org/draft-04/schema#',
+                         'allOf': [{'$ref': 'receiver_core.json'},
+                                   {'properties': {'caps': {'description': 'Capabilities',
+                                                            'properties': {'media_types': {'description': 'Subclassification '
+                                                                                                          'of the '
+                                                                                                          'formats '
+                                                                                                          'accepted '
+                                                                                                          'using IANA '
+                                                                                                          'assigned '
+                                                                                                          'media types',
+                                                                                           'items': {'anyOf': [{'enum': ['video/raw',
+                                                                                                                         'video/H264',
+                                                                                                                         'video/vc2']},
+                                                                                                               {'pattern': '^video\\/[^\\s\\/]+$'}],
+                                                                                                     'type': 'string'},
+                                                                                           'minItems': 1,
+                                                                                           'type': 'array'}},
+                                                            'type': 'object'},
+                                                   'format': {'description': 'Type of Flow accepted by the Receiver as '
+                                                                             'a URN',
+                                                              'enum': ['urn:x-nmos:format:video'],
+                                                              'format': 'uri',
+                                                              'type': 'string'}},
+                                    'required': ['format', 'caps'],
+                                    'type': 'object'}],
+                         'description': 'Describes a video Receiver',
+                         'title': 'Video Receiver resource',
+                         'type': 'object'},
+ 'resource_core.json': {'$schema': 'http://json-schema.org/draft-04/schema#',
+                        'description': 'Describes the foundations of all NMOS resources',
+                        'properties': {'description': {'description': 'Detailed description of the resource',
+                                                       'type': 'string'},
+                                       'id': {'description': 'Globally unique identifier for the resource',
+                                              'pattern': '^[0-9a-f]{8}-[0-9a-f]{4}-[1-5][0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}$',
+                                              'type': 'string'},
+                                       'label': {'description': 'Freeform string label for the resource',
+                                                 'type': 'string'},
+                                       'tags': {'description': 'Key value set of freeform string tags to aid in '
+                                                               'filtering resources. Values should be represented as '
+                                                               'an array of strings. Can be empty.',
+                                                'patternProperties': {'': {'items': {'type': 'string'},
+                                                                           'type': 'array'}},
+                                                'type': 'object'},
+                                       'version': {'description': 'String formatted TAI timestamp '
+                                                                  '(<seconds>:<nanoseconds>) indicating precisely when '
+                                                                  'an attribute of the resource last changed',
+                                                   'pattern': '^[0-9]+:[0-9]+$',
+                                                   'type': 'string'}},
+                        'required': ['id', 'version', 'label', 'description', 'tags'],
+                        'title': 'Base resource',
+                        'type': 'object'},
+ 'sender.json': {'$schema': 'http://json-schema.org/draft-04/schema#',
+                 'allOf': [{'$ref': 'resource_core.json'},
+                           {'properties': {'caps': {'description': 'Capabilities of this sender',
+                                                    'properties': {},
+                                                    'type': 'object'},
+                                           'device_id': {'description': 'Device ID which this Sender forms part of. '
+                                                                        'This attribute is used to ensure referential '
+                                                                        'integrity by registry implementations.',
+                                                         'pattern': '^[0-9a-f]{8}-[0-9a-f]{4}-[1-5][0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}$',
+                                                         'type': 'string'},
+                                           'flow_id': {'default': None,
+                                                       'description': 'ID of the Flow currently passing via this '
+                                                                      'Sender',
+                                                       'pattern': '^[0-9a-f]{8}-[0-9a-f]{4}-[1-5][0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}$',
+                                                       'type': ['string', 'null']},
+                                           'interface_bindings': {'description': 'Binding of Sender egress ports to '
+                                                                                 'interfaces on the parent Node. '
+                                                                                 'Should contain a single network '
+                                                                                 'interface unless a redundancy '
+                                                                                 'mechanism such as ST.2022-7 is in '
+                                                                                 "use, in which case each 'leg' should "
+                                                                                 'have its matching interface listed. '
+                                                                                 'Where the redundancy mechanism sends '
+                                                                                 'more than one copy of the stream via '
+                                                                                 'the same interface, that interface '
+                                                                                 'should be listed a corresponding '
+                                                                                 'number of times.',
+                                                                  'items': {'type': 'string'},
+                                                                  'type': 'array'},
+                                           'manifest_href': {'description': 'HTTP URL to a file describing how to '
+                                                                            'connect to the Sender (SDP for RTP). The '
+                                                                            "Sender's 'version' attribute should be "
+                                                                            'updated if the contents of this file are '
+                                                                            'modified. This URL may return an HTTP 404 '
+                                                                            "where the 'active' parameter in the "
+                                                                            "'subscription' object is present and set "
+                                                                            'to false (v1.2+ only).',
+                                                             'format': 'uri',
+                                                             'type': 'string'},
+                                           'subscription': {'description': "Object containing the 'receiver_id' "
+                                                                           'currently subscribed to (unicast only). '
+                                                                           'Receiver_id should be null on '
+                                                                           'initialisation, or when connected to a '
+                                                                           'non-NMOS unicast Receiver.',
+                                                            'properties': {'active': {'default': False,
+                                                                                      'description': 'Sender is '
+                                                                                                     'enabled and '
+                                                                                                     'configured to '
+                                                                                                     'stream data to a '
+                                                                                                     'single Receiver '
+                                                                                                     '(unicast), or to '
+                                                                                                     'the network via '
+                                                                                                     'multicast or a '
+                                                                                                     'pull-based '
+                                                                                                     'mechanism',
+                                                                                      'type': 'boolean'},
+                                                                           'receiver_id': {'default': None,
+                                                                                           'description': 'UUID of the '
+                                                                                                          'Receiver '
+                                                                                                          'that this '
+                                                                                                          'Sender is '
+                                                                                                          'currently '
+                                                                                                          'subscribed '
+                                                                                                          'to',
+                                                                                           'pattern': '^[0-9a-f]{8}-[0-9a-f]{4}-[1-5][0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}$',
+                                                                                           'type': ['string', 'null']}},
+                                                            'required': ['receiver_id', 'active'],
+                                                            'type': 'object'},
+                                           'transport': {'description': 'Transport type used by the Sender in URN '
+                                                                        'format',
+                                                         'format': 'uri',
+                                                         'oneOf': [{'enum': ['urn:x-nmos:transport:rtp',
+                                                                             'urn:x-nmos:transport:rtp.ucast',
+                                                                             'urn:x-nmos:transport:rtp.mcast',
+                                                                             'urn:x-nmos:transport:dash']},
+                                                                   {'not': {'pattern': '^urn:x-nmos:'}}],
+                                                         'type': 'string'}},
+                            'required': ['flow_id',
+                                         'transport',
+                                         'device_id',
+                                         'manifest_href',
+                                         'interface_bindings',
+                                         'subscription'],
+                            'type': 'object'}],
+                 'description': 'Describes a sender',
+                 'title': 'Sender resource',
+                 'type': 'object'},
+ 'source.json': {'$schema': 'http://json-schema.org/draft-04/schema#',
+                 'description': 'Describes a Source',
+                 'oneOf': [{'$ref': 'source_generic.json'}, {'$ref': 'source_audio.json'}],
+                 'title': 'Source resource',
+                 'type': 'object'},
+ 'source_audio.json': {'$schema': 'http://json-schema.org/draft-04/schema#',
+                       'allOf': [{'$ref': 'source_core.json'},
+                                 {'properties': {'channels': {'description': 'Array of objects describing the audio '
+                                                                             'channels',
+                                                              'items': {'properties': {'label': {'description': 'Label '
+                                                                                                                'for '
+                                                                                                                'this '
+                                                                                                                'channel '
+                                                                                                                '(free '
+                                                                                                                'text)',
+                                                                                                 'type': 'string'},
+                                                                                       'symbol': {'description': 'Symbol '
+                                                                                                                 'for '
+                                                                                                                 'this '
+                                                                                                                 'channel '
+                                                                                                                 '(from '
+                                                                                                                 'VSF '
+                                                                                                                 'TR-03 '
+                                                                                                                 'Appendix '
+                                                                                                                 'A)',
+                                                                                                  'oneOf': [{'enum': ['L',
+                                                                                                                      'R',
+                                                                                                                      'C',
+                                                                                                                      'LFE',
+                                                                                                                      'Ls',
+                                                                                                                      'Rs',
+                                                                                                                      'Lss',
+                                                                                                                      'Rss',
+                                                                                                                      'Lrs',
+                                                                                                                      'Rrs',
+                                                                                                                      'Lc',
+                                                                                                                      'Rc',
+                                                                                                                      'Cs',
+                                                                                                                      'HI',
+                                                                                                                      'VIN',
+                                                                                                                      'M1',
+                                                                                                                      'M2',
+                                                                                                                      'Lt',
+                                                                                                                      'Rt',
+                                                                                                                      'Lst',
+                                                                                                                      'Rst',
+                                                                                                                      'S']},
+                                                                                                            {'description': 'Numbered '
+                                                                                                                            'Source '
+                                                                                                                            'Channel',
+                                                                                                             'pattern': 'NSC(0[0-9]{2}|1[0-1]{1}[0-9]{1}|12[0-7]{1})'},
+                                                                                                            {'description': 'Undefined '
+                                                                                                                            'channel',
+                                                                                                             'pattern': 'U(0[1-9]{1}|[1-5]{1}[0-9]{1}|6[0-4]{1})'}],
+                                                                                                  'type': 'string'}},
+                                                                        'required': ['label'],
+                                                                        'title': 'Component',
+                                                                        'type': 'object'},
+                                                              'minItems': 1,
+                                                              'type': 'array'},
+                                                 'format': {'description': 'Format of the data coming from the Source '
+                                                                           'as a URN',
+                                                            'enum': ['urn:x-nmos:format:audio'],
+                                                            'format': 'uri',
+                                                            'type': 'string'}},
+                                  'required': ['format', 'channels'],
+                                  'type': 'object'}],
+                       'description': 'Describes an audio Source',
+                       'title': 'Audio Source resource',
+                       'type': 'object'},
+ 'source_core.json': {'$schema': 'http://json-schema.org/draft-04/schema#',
+                      'allOf': [{'$ref': 'resource_core.json'},
+                                {'properties': {'caps': {'description': 'Capabilities (not yet defined)',
+                                                         'type': 'object'},
+                                                'clock_name': {'description': 'Reference to clock in the originating '
+                                                                              'Node',
+                                                               'pattern': '^clk[0-9]+$',
+                                                               'type': ['string', 'null']},
+                                                'device_id': {'description': 'Globally unique identifier for the '
+                                                                             'Device which initially created the '
+                                                                             'Source. This attribute is used to ensure '
+                                                                             'referential integrity by registry '
+                                                                             'implementations.',
+                                                              'pattern': '^[0-9a-f]{8}-[0-9a-f]{4}-[1-5][0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}$',
+                                                              'type': 'string'},
+                                                'grain_rate': {'description': 'Maximum number of Grains per second for '
+                                                                              'Flows derived from this Source. '
+                                                                              'Corresponding Flow Grain rates may '
+                                                                              'override this attribute. Grain rate '
+                                                                              'matches the frame rate for video (see '
+                                                                              'NMOS Content Model). Specified for '
+                                                                              'periodic Sources only.',
+                                                               'properties': {'denominator': {'default': 1,
+                                                                                              'description': 'Denominator',
+                                                                                              'type': 'integer'},
+                                                                              'numerator': {'description': 'Numerator',
+                                                                                            'type': 'integer'}},
+                                                               'required': ['numerator'],
+                                                               'type': 'object'},
+                                                'parents': {'description': 'Array of UUIDs representing the Source IDs '
+                                                                           'of Grains which came together at the input '
+                                                                           'to this Source (may change over the '
+                                                                           'lifetime of this Source)',
+                                                            'items': {'pattern': '^[0-9a-f]{8}-[0-9a-f]{4}-[1-5][0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}$',
+                                                                      'type': 'string'},
+                                                            'type': 'array'}},
+                                 'required': ['caps', 'device_id', 'parents', 'clock_name'],
+                                 'type': 'object'}],
+                      'description': 'Describes a Source',
+                      'title': 'Source resource',
+                      'type': 'object'},
+ 'source_generic.json': {'$schema': 'http://json-schema.org/draft-04/schema#',
+                         'allOf': [{'$ref': 'source_core.json'},
+                                   {'properties': {'format': {'description': 'Format of the data coming from the '
+                                                                             'Source as a URN',
+                                                              'enum': ['urn:x-nmos:format:video',
+                                                                       'urn:x-nmos:format:data',
+                                                                       'urn:x-nmos:format:mux'],
+                                                              'format': 'uri',
+                                                              'type': 'string'}},
+                                    'required': ['format'],
+                                    'type': 'object'}],
+                         'description': 'Describes a generic Source',
+                         'title': 'Generic Source resource',
+                         'type': 'object'}}
+
+SCHEMA = {
+    'device': DEFINITIONS['device.json'],
+    'flow': DEFINITIONS['flow.json'],
+    'node': DEFINITIONS['node.json'],
+    'receiver': DEFINITIONS['receiver.json'],
+    'sender': DEFINITIONS['sender.json'],
+    'source': DEFINITIONS['source.json'],
+}
@@ -17,5 +17,5 @@ from nmosregistration.v1_3 import schema
 
 
 class Routes(RoutesCommon):
-    def __init__(self, logger, registry):
-        super(Routes, self).__init__(logger, registry, "v1.3", schema)
+    def __init__(self, logger, registry, **kwargs):
+        super(Routes, self).__init__(logger, registry, "v1.3", schema, **kwargs)
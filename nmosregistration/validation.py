@@ -0,0 +1,76 @@
+# Copyright 2019 British Broadcasting Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Compiled schema validators. The generated schema modules keep their "$ref"s
+and carry a single DEFINITIONS table; references are resolved against that
+table, so each shared definition is loaded once per API version and every
+validator for that version shares it.
+"""
+
+import jsonschema
+from jsonschema.exceptions import best_match
+
+# Handle if the referencing library is not available (jsonschema < 4.18)
+try:
+    from referencing import Registry, Resource
+    from referencing.jsonschema import DRAFT4
+    HAS_REFERENCING = True
+except ImportError:
+    HAS_REFERENCING = False
+
+FORMATS = ["ipv4", "ipv6"]
+
+_registries = {}
+_validators = {}
+
+
+def _resolver_kwargs(api_schema, root):
+    if HAS_REFERENCING:
+        registry = _registries.get(api_schema.__name__)
+        if registry is None:
+            registry = Registry().with_resources(
+                (name, Resource.from_contents(definition, default_specification=DRAFT4))
+                for name, definition in api_schema.DEFINITIONS.items()
+            )
+            _registries[api_schema.__name__] = registry
+        return {"registry": registry}
+    else:
+        return {"resolver": jsonschema.RefResolver("", root, store=api_schema.DEFINITIONS)}
+
+
+def get_validator(api_schema, resource_type):
+    """
+    Return a validator for RESOURCE_TYPE in the generated schema module
+    API_SCHEMA. Validators are built once and cached.
+    """
+    key = (api_schema.__name__, resource_type)
+    validator = _validators.get(key)
+    if validator is None:
+        root = api_schema.SCHEMA[resource_type]
+        cls = jsonschema.validators.validator_for(root)
+        cls.check_schema(root)
+        validator = cls(root, format_checker=jsonschema.FormatChecker(FORMATS), **_resolver_kwargs(api_schema, root))
+        _validators[key] = validator
+    return validator
+
+
+def validate(instance, api_schema, resource_type):
+    """
+    Validate INSTANCE as a RESOURCE_TYPE, raising the most relevant
+    jsonschema.ValidationError (as jsonschema.validate does) if it is invalid.
+    """
+    error = best_match(get_validator(api_schema, resource_type).iter_errors(instance))
+    if error is not None:
+        raise error
@@ -0,0 +1,146 @@
+# Copyright 2019 British Broadcasting Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Follows changes to a part of the etcd keyspace using the v2 watch API, so that
+in-memory state can be kept in step with writes made by other aggregators.
+"""
+
+import time
+import gevent
+
+from nmoscommon.logger import Logger
+
+from .jsoncodec import loads
+
+RETRY_INTERVAL = 1  # seconds to wait before retrying after the registry was unavailable
+EVENT_INDEX_CLEARED = 401  # etcd error code when the requested waitIndex is too old
+
+
+class Watcher(object):
+
+    def __init__(self, registry, prefix, logger=None, recursive=False, timeout=None):
+        """
+        recursive
+            Read everything under the prefix whenever changes may have been
+            missed, passing it to on_reset.
+        timeout
+            Seconds after which a watch with nothing to report is re-issued,
+            and so the longest the watcher goes without confirming it is in
+            step with the registry. None for the registry's default.
+        """
+        self.registry = registry
+        self.prefix = prefix
+        self.recursive = recursive
+        self.timeout = timeout
+        self._depth = len([k for k in prefix.split("/") if len(k) > 0])
+        self.logger = Logger("watcher", logger)
+        self.synced = False
+        self.index = None
+        self.confirmed = None
+        self.resets = 0
+        self._listeners = []
+        self._greenlet = None
+
+    def subscribe(self, on_event, on_reset):
+        """
+        on_event(action, key, node, prev_node) is called for every change
+        under the prefix, with KEY split into its path segments below it.
+        on_reset(index, root) is called whenever changes may have been missed
+        and any state derived from them must be discarded; INDEX is the etcd
+        index from which changes will be followed, or None while the
+        registry is unavailable. For a recursive watcher, ROOT is the etcd
+        node at the prefix, holding everything below it as of INDEX;
+        otherwise it is None.
+        """
+        self._listeners.append((on_event, on_reset))
+
+    def start(self):
+        if self._greenlet is None:
+            self._greenlet = gevent.spawn(self._run)
+
+    def stop(self):
+        if self._greenlet is not None:
+            self._greenlet.kill()
+            self._greenlet = None
+        self._reset(None)
+
+    def staleness(self):
+        """Seconds since the watcher last confirmed it was in step, or None if it never has"""
+        if self.confirmed is None:
+            return None
+        return time.time() - self.confirmed
+
+    def _reset(self, index, root=None):
+        self.synced = index is not None
+        self.index = index
+        self.resets += 1
+        for _, on_reset in self._listeners:
+            on_reset(index, root)
+
+    def _run(self):
+        while True:
+            try:
+                if not self.synced:
+                    r = self.registry.get_raw(self.prefix, recurse=self.recursive)
+                    root = None
+                    if self.recursive:
+                        # The prefix does not exist until something is written below it
+                        root = loads(r.content).get("node", {})
+                    self.confirmed = time.time()
+                    self._reset(int(r.headers["X-Etcd-Index"]), root)
+
+                if self.timeout is None:
+                    index, r = self.registry.watch(self.prefix, wait_index=self.index + 1)
+                else:
+                    index, r = self.registry.watch(self.prefix, wait_index=self.index + 1, timeout=self.timeout)
+                if r is None:
+                    # Timed out with nothing to report, so nothing changed up
+                    # to the index at which the watch began. Waiting from there
+                    # rather than the same index keeps the watch within the
+                    # events etcd remembers, however busy the rest of the
+                    # keyspace is.
+                    if index is not None:
+                        self.index = max(self.index, index)
+                    self.confirmed = time.time()
+                    continue
+
+                event = loads(r.content)
+                if "errorCode" in event:
+                    if event["errorCode"] == EVENT_INDEX_CLEARED:
+                        self.logger.writeDebug("watch fell behind, resyncing")
+                    else:
+                        self.logger.writeWarning("watch failed: {}".format(event.get("message")))
+                    self.synced = False
+                    continue
+
+                self._dispatch(event)
+
+            except self.registry.RegistryUnavailable:
+                self.logger.writeWarning("registry unavailable")
+                self._reset(None)
+                gevent.sleep(RETRY_INTERVAL)
+
+            except Exception as e:
+                self.logger.writeError("unhandled exception: {}".format(e))
+                self._reset(None)
+                gevent.sleep(RETRY_INTERVAL)
+
+    def _dispatch(self, event):
+        self.confirmed = time.time()
+        node = event.get("node", {})
+        self.index = node["modifiedIndex"]
+        key = [k for k in node["key"].split("/") if len(k) > 0][self._depth:]
+        for on_event, _ in self._listeners:
+            on_event(event["action"], key, node, event.get("prevNode"))
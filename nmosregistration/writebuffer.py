@@ -0,0 +1,183 @@
+# Copyright 2019 British Broadcasting Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Buffering of registry writes while the registry is unavailable.
+
+Writes are held in order of first arrival, one per key: a later write to a key
+replaces the one held, keeping its place, so that a parent is still written
+before the children registered after it. Once the registry is available again
+the held writes are replayed, oldest first. Until then, a new write joins the
+buffer if a write to its key, or to a key it depends on, is held, so that it
+cannot overtake it; other writes are made straight away, so that the buffer
+drains however busy the registry is.
+
+Writes may also be appended to a journal file, from which any held writes are
+recovered on startup.
+"""
+
+import os
+import gevent
+from collections import OrderedDict
+
+from nmoscommon.logger import Logger
+
+from .jsoncodec import loads, dumps
+
+LIMIT = 10000  # keys for which writes may be held
+INTERVAL = 1  # seconds between checks for whether held writes can be replayed
+
+
+class WriteBuffer(object):
+
+    def __init__(self, registry, availability, limit=LIMIT, path=None, logger=None, interval=INTERVAL):
+        """
+        path
+            File in which to journal held writes, or None to hold them in
+            memory only.
+        interval
+            Number of seconds between checks for whether held writes can be
+            replayed. An interval of '0' means 'never check'.
+        """
+        self.registry = registry
+        self.availability = availability
+        self.limit = limit
+        self.logger = Logger("writebuffer", logger)
+        self.stats = {'buffered': 0, 'rejected': 0, 'replayed': 0, 'failed': 0}
+        self._entries = OrderedDict()
+        self._journal = None
+        self._journalled = 0
+        if path is not None:
+            self._recover(path)
+        if interval > 0:
+            gevent.spawn(self._run, interval)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        """Test whether a write is held for KEY, ("resource", rtype, rkey) or ("health", rkey)"""
+        return key in self._entries
+
+    def get_stats(self):
+        stats = dict(self.stats)
+        stats['held'] = len(self._entries)
+        return stats
+
+    def holds(self, rtype, rkey):
+        """
+        Test whether a held write registers or removes a resource.
+        Returns: True for a registration, False for a removal, or None if no write is held
+        """
+        op = self._entries.get(("resource", rtype, rkey))
+        if op is None:
+            return None
+        return op['op'] == 'put'
+
+    def put(self, rtype, rkey, value):
+        """Hold a write of a resource. Returns False if the buffer is full."""
+        return self._add(("resource", rtype, rkey), {'op': 'put', 'type': rtype, 'id': rkey, 'value': value})
+
+    def delete(self, rtype, rkey):
+        return self._add(("resource", rtype, rkey), {'op': 'delete', 'type': rtype, 'id': rkey})
+
+    def put_health(self, rkey, value, ttl):
+        return self._add(("health", rkey), {'op': 'health', 'id': rkey, 'value': value, 'ttl': ttl})
+
+    def _add(self, key, op, journal=True):
+        if key not in self._entries and len(self._entries) >= self.limit:
+            self.stats['rejected'] += 1
+            return False
+        self._entries[key] = op
+        self.stats['buffered'] += 1
+        if journal and self._journal is not None:
+            self._journal.write(dumps(op) + "\n")
+            self._journal.flush()
+            self._journalled += 1
+            if self._journalled > 2 * len(self._entries) + self.limit:
+                self._compact()
+        return True
+
+    def replay(self):
+        """Replay held writes, oldest first. Returns True once all have been replayed."""
+        while len(self._entries) > 0:
+            key, op = next(iter(self._entries.items()))
+            try:
+                r = self._apply(op)
+            except self.registry.RegistryUnavailable:
+                self.availability.failed()
+                return False
+
+            # A newer write to the key may have been held meanwhile
+            if self._entries.get(key) is op:
+                del self._entries[key]
+            self.stats['replayed'] += 1
+            if r is not None and r.status_code // 100 != 2:
+                self.stats['failed'] += 1
+                self.logger.writeWarning("replayed {} of {} failed: {}".format(op['op'], op['id'], r.status_code))
+
+        if self._journal is not None:
+            self._compact()
+        return True
+
+    def _apply(self, op):
+        if op['op'] == 'put':
+            return self.registry.put(op['type'], op['id'], op['value'])
+        elif op['op'] == 'health':
+            # As for a heartbeat, only a registered node's health is written
+            r = self.registry.put_health(op['id'], op['value'], ttl=op['ttl'], prev_exist=True)
+            if r.status_code == 404 and self.registry.resource_exists("nodes", op['id']):
+                r = self.registry.put_health(op['id'], op['value'], ttl=op['ttl'])
+            return r
+        r = self.registry.delete(op['type'], op['id'])
+        if op['type'] == 'nodes' and r.status_code // 100 == 2:
+            self.registry.delete_health(op['id'])
+        return r
+
+    def _recover(self, path):
+        if os.path.exists(path):
+            with open(path) as journal:
+                for line in journal:
+                    try:
+                        op = loads(line)
+                    except ValueError:
+                        # Cut short when last written
+                        continue
+                    if op['op'] == 'health':
+                        key = ("health", op['id'])
+                    else:
+                        key = ("resource", op['type'], op['id'])
+                    self._add(key, op, journal=False)
+            if len(self._entries) > 0:
+                self.logger.writeInfo("recovered {} held writes".format(len(self._entries)))
+        self._journal = open(path, "a+")
+        self._compact()
+
+    def _compact(self):
+        """Rewrite the journal to hold just the writes currently held"""
+        self._journal.seek(0)
+        self._journal.truncate()
+        for op in self._entries.values():
+            self._journal.write(dumps(op) + "\n")
+        self._journal.flush()
+        self._journalled = len(self._entries)
+
+    def _run(self, interval):
+        while True:
+            gevent.sleep(interval)
+            try:
+                if len(self._entries) > 0 and self.availability.available():
+                    self.replay()
+            except Exception as e:
+                self.logger.writeError("unhandled exception: {}".format(e))
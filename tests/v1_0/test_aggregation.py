@@ -17,6 +17,7 @@ import time
 import json
 
 from nmosregistration.v1_0 import routes as v1_0
+from nmoscommon.webapi import expects_json
 
 from werkzeug.exceptions import HTTPException
 from werkzeug.wrappers import Response
@@ -76,11 +77,44 @@ class MockRegistry_broken():
         self.invocations.append(('put', args, kwargs))
         raise self.RegistryUnavailable
 
+    def put_health(self, *args, **kwargs):
+        self.invocations.append(('put_health', args, kwargs))
+        raise self.RegistryUnavailable
+
     def delete(self, *args, **kwargs):
         self.invocations.append(('delete', args, kwargs))
         raise self.RegistryUnavailable
 
 
+class MockEtcdResponse():
+    def __init__(self, status_code, body):
+        self.status_code = status_code
+        self.reason = ''
+        self.content = json.dumps(body)
+
+
+class MockHealthRegistry():
+    """Registry in which nodes have a health key only while alive"""
+    def __init__(self, nodes, healths):
+        self.nodes = nodes
+        self.healths = healths
+        self.invocations = []
+
+    class RegistryUnavailable(Exception):
+        pass
+
+    def put_health(self, rkey, value, ttl=None, prev_exist=None, port=2379):
+        self.invocations.append(('put_health', rkey, prev_exist))
+        if prev_exist and rkey not in self.healths:
+            return MockEtcdResponse(404, {'errorCode': 100, 'message': 'Key not found'})
+        self.healths.add(rkey)
+        return MockEtcdResponse(200, {'action': 'set', 'node': {'key': '/health/' + rkey, 'value': str(value)}})
+
+    def resource_exists(self, resource_type, resource_id, port=2379):
+        self.invocations.append(('resource_exists', resource_type, resource_id))
+        return resource_id in self.nodes
+
+
 class TestAggregatorAPI(unittest.TestCase):
     """An attempt to test AggregatorAPI - may not be the best way to do this. We mock out things where necessary."""
 
@@ -159,6 +193,28 @@ class TestAggregatorAPI(unittest.TestCase):
         # Check ID within Node object is lowercase
         self.assertEqual(key.lower(), json.loads(self.mock_registry.invocations[0][1][2])['id'])
 
+    def test_add_resource_representation(self):
+        """Metadata is stored with the resource but kept out of the representation returned"""
+        key = "17c27274-6aaf-4f4b-9b9a-5b5b5dc2af63"
+        resource = {
+            'type': 'node',
+            'data': {
+                'label': 'test',
+                'href': 'http://127.0.0.1:8080',
+                'version': '1442328230:920000000',
+                'caps': {},
+                'services': [],
+                'id': key,
+                '@_apiversion': 'v1.3'
+            }
+        }
+        r, representation = self.api._add_resource(json.dumps(resource))
+        del resource['data']['@_apiversion']
+        self.assertEqual(resource['data'], json.loads(representation))
+        stored = json.loads(self.mock_registry.invocations[0][1][2])
+        self.assertEqual('v1.0', stored.pop('@_apiversion'))
+        self.assertEqual(resource['data'], stored)
+
     def test_add_resource_non_type(self):
         """Attempting to register resources of a non-supported type aborts"""
         with self.assertRaises(HTTPException) as cm:
@@ -181,6 +237,231 @@ class TestAggregatorAPI(unittest.TestCase):
         self.assertEqual(expected, self.mock_registry.invocations)
 
 
+class MockRegistry_rejecting(MockRegistry):
+    """Accepts heartbeats but rejects resources"""
+    def put(self, *args, **kwargs):
+        self.invocations.append(('put', args, kwargs))
+        return Response('Mock!', status=403)
+
+    def delete_health(self, *args, **kwargs):
+        self.invocations.append(('delete_health', args, kwargs))
+        return Response('Mock!')
+
+
+class TestAddNode(unittest.TestCase):
+
+    def setUp(self):
+        self.mock_log = MockLogger()
+        self.mock_registry = MockRegistry_rejecting()
+        self.api = v1_0.Routes(logger=self.mock_log, registry=self.mock_registry)
+
+    def test_initial_heartbeat_removed(self):
+        """An initial heartbeat written alongside a rejected node is removed"""
+        key = "17c27274-6aaf-4f4b-9b9a-5b5b5dc2af63"
+        resource = {
+            'type': 'node',
+            'data': {
+                'label': 'test',
+                'href': 'http://127.0.0.1:8080',
+                'version': '1442328230:920000000',
+                'caps': {},
+                'services': [],
+                'id': key
+            }
+        }
+        r, representation = self.api._add_resource(json.dumps(resource))
+        self.assertEqual(403, r.status_code)
+        self.assertEqual(
+            ['put', 'put_health', 'delete_health'],
+            [invocation[0] for invocation in self.mock_registry.invocations]
+        )
+
+
+class TestHeartbeat(unittest.TestCase):
+
+    def setUp(self):
+        self.mock_log = MockLogger()
+        self.mock_registry = MockHealthRegistry(nodes={'alive', 'expired'}, healths={'alive'})
+        self.api = v1_0.Routes(logger=self.mock_log, registry=self.mock_registry)
+
+    def test_heartbeat_alive(self):
+        """A heartbeat for a live node is a single conditional write"""
+        status, health = self.api._health('alive')
+        self.assertEqual(204, status)
+        self.assertEqual(str(int(time.time())), health)
+        self.assertEqual([('put_health', 'alive', True)], self.mock_registry.invocations)
+
+    def test_heartbeat_expired(self):
+        """A registered node whose health has expired is revived"""
+        status, health = self.api._health('expired')
+        self.assertEqual(204, status)
+        self.assertEqual([
+            ('put_health', 'expired', True),
+            ('resource_exists', 'nodes', 'expired'),
+            ('put_health', 'expired', None)
+        ], self.mock_registry.invocations)
+
+    def test_heartbeat_unknown(self):
+        """A heartbeat for an unregistered node does not create a health key"""
+        status, health = self.api._health('unknown')
+        self.assertEqual(404, status)
+        self.assertNotIn('unknown', self.mock_registry.healths)
+
+    def test_heartbeat_rejected(self):
+        """A heartbeat for a node known not to be registered never reaches the registry"""
+        class MockExistence():
+            def might_exist(self, resource_type, resource_id):
+                return resource_id != 'unknown'
+
+        api = v1_0.Routes(logger=self.mock_log, registry=self.mock_registry, existence=MockExistence())
+        status, health = api._health('unknown')
+        self.assertEqual(404, status)
+        self.assertEqual([], self.mock_registry.invocations)
+
+
+class TestBulkHeartbeat(unittest.TestCase):
+
+    def setUp(self):
+        self.mock_log = MockLogger()
+        self.mock_registry = MockHealthRegistry(nodes={'alive', 'expired'}, healths={'alive'})
+        self.api = v1_0.Routes(logger=self.mock_log, registry=self.mock_registry)
+
+    def test_heartbeats(self):
+        """Each node in the list gets its own result, in order"""
+        results = self.api._healths(json.dumps(['alive', 'unknown', 'expired']))
+        self.assertEqual(['alive', 'unknown', 'expired'], [result['id'] for result in results])
+        self.assertEqual([204, 404, 204], [result['code'] for result in results])
+        self.assertEqual(str(int(time.time())), results[0]['health'])
+        self.assertNotIn('unknown', self.mock_registry.healths)
+
+    def test_not_a_list(self):
+        """The body must be a list of node IDs"""
+        for body in [{'id': 'alive'}, [{'id': 'alive'}]]:
+            with self.assertRaises(HTTPException) as e:
+                self.api._healths(json.dumps(body))
+            self.assertEqual(400, e.exception.code)
+
+
+class MockWebSocket():
+    def __init__(self, messages):
+        self.messages = list(messages)
+        self.sent = []
+
+    def receive(self):
+        if len(self.messages) == 0:
+            return None
+        return self.messages.pop(0)
+
+    def send(self, message):
+        self.sent.append(json.loads(message))
+
+
+class TestHeartbeatSocket(unittest.TestCase):
+
+    def setUp(self):
+        self.mock_log = MockLogger()
+        self.mock_registry = MockHealthRegistry(nodes={'alive', 'expired'}, healths={'alive'})
+        self.api = v1_0.Routes(logger=self.mock_log, registry=self.mock_registry)
+        self.handler = self.api.on_websocket_connect(expects_json(self.api._RoutesCommon__health_socket))
+
+    def test_heartbeats(self):
+        """Each node ID received is answered with its heartbeat result"""
+        ws = MockWebSocket(['"alive"', '["unknown", "expired"]'])
+        self.handler(ws)
+        self.assertEqual(['alive', 'unknown', 'expired'], [sent['id'] for sent in ws.sent])
+        self.assertEqual([204, 404, 204], [sent['code'] for sent in ws.sent])
+
+    def test_malformed(self):
+        """Malformed messages are answered without closing the connection"""
+        ws = MockWebSocket(['alive', '{"id": "alive"}', '"alive"'])
+        self.handler(ws)
+        self.assertEqual([400, 400, 204], [sent['code'] for sent in ws.sent])
+
+
+class MockBulkRegistry(MockRegistry):
+    """Registry holding a set of existing resources, which may refuse some writes"""
+    def __init__(self, existing=(), refused=()):
+        MockRegistry.__init__(self)
+        self.existing = set(existing)
+        self.refused = set(refused)
+
+    def put(self, rtype, rkey, value, port=2379):
+        self.invocations.append(('put', rtype, rkey))
+        if rkey in self.refused:
+            return Response('Mock!', status=403)
+        self.existing.add((rtype, rkey))
+        return Response('Mock!', status=201)
+
+    def put_health(self, *args, **kwargs):
+        return Response('Mock!', status=201)
+
+    def delete_health(self, *args, **kwargs):
+        return Response('Mock!')
+
+    def resource_exists(self, rtype, rkey, port=2379):
+        self.invocations.append(('resource_exists', rtype, rkey))
+        return (rtype, rkey) in self.existing
+
+
+class TestBulkRegistration(unittest.TestCase):
+
+    NODE = "17c27274-6aaf-4f4b-9b9a-5b5b5dc2af63"
+    DEVICE = "a2a8b0c4-4bf3-4d3b-9bdb-4b7bd7f7e2a5"
+
+    def setUp(self):
+        self.mock_log = MockLogger()
+
+    def node(self):
+        return {'type': 'node', 'data': {
+            'label': 'test', 'href': 'http://127.0.0.1:8080', 'version': '1442328230:920000000',
+            'caps': {}, 'services': [], 'id': self.NODE
+        }}
+
+    def device(self, node_id):
+        return {'type': 'device', 'data': {
+            'label': 'test', 'type': 'urn:x-ipstudio:device:generic', 'version': '1442328230:920000000',
+            'senders': [], 'receivers': [], 'node_id': node_id, 'id': self.DEVICE
+        }}
+
+    def test_parents_resolved_within_batch(self):
+        """A node and its device are written in order, without looking the node up"""
+        registry = MockBulkRegistry()
+        api = v1_0.Routes(logger=self.mock_log, registry=registry)
+        results = api._add_resources(json.dumps([self.node(), self.device(self.NODE)]))
+        self.assertEqual([201, 201], [result['code'] for result in results])
+        self.assertEqual(
+            "/x-nmos/registration/v1.0/resource/devices/{}/".format(self.DEVICE), results[1]['location']
+        )
+        self.assertEqual([('put', 'nodes', self.NODE), ('put', 'devices', self.DEVICE)], registry.invocations)
+
+    def test_parent_in_registry(self):
+        """Parents not in the batch must already be registered"""
+        registry = MockBulkRegistry(existing=[('nodes', self.NODE)])
+        api = v1_0.Routes(logger=self.mock_log, registry=registry)
+        unknown = "e3c1a43b-57b4-4a3e-8d7c-3bfc4b43e1a3"
+        results = api._add_resources(json.dumps([self.device(self.NODE), self.device(unknown)]))
+        self.assertEqual(201, results[0]['code'])
+        self.assertEqual(400, results[1]['code'])
+        self.assertEqual('Node {} does not exist'.format(unknown), results[1]['error'])
+
+    def test_per_item_errors(self):
+        """Invalid items fail alone, and children of refused parents are not written"""
+        registry = MockBulkRegistry(refused=[self.NODE])
+        api = v1_0.Routes(logger=self.mock_log, registry=registry)
+        invalid = self.node()
+        del invalid['data']['href']
+        results = api._add_resources(json.dumps([invalid, self.node(), self.device(self.NODE), {'type': 'node'}]))
+        self.assertEqual([400, 403, 400, 400], [result['code'] for result in results])
+        self.assertNotIn(('put', 'devices', self.DEVICE), registry.invocations)
+
+    def test_not_a_list(self):
+        """The body must be a list of resources"""
+        api = v1_0.Routes(logger=self.mock_log, registry=MockBulkRegistry())
+        with self.assertRaises(HTTPException) as e:
+            api._add_resources(json.dumps(self.node()))
+        self.assertEqual(400, e.exception.code)
+
+
 class TestAggregatorAPI_NoRegistry(unittest.TestCase):
 
     def setUp(self):
@@ -189,7 +470,7 @@ class TestAggregatorAPI_NoRegistry(unittest.TestCase):
         self.api = v1_0.Routes(logger=self.mock_log, registry=self.mock_registry)
 
     def test_add_resource_no_registry(self):
-        """Return error if registry unavailable, and add no initial health check"""
+        """Return error if registry unavailable, having attempted the node and its initial health check together"""
         key = "17c27274-6aaf-4f4b-9b9a-5b5b5dc2af63"
         resource = {
             'type': 'node',
@@ -213,6 +494,11 @@ class TestAggregatorAPI_NoRegistry(unittest.TestCase):
                     '{{"version": "1442328230:920000000", "label": "test", "href": "http://127.0.0.1:8080", "@_apiversion": "v1.0", "services": [], "caps": {}, "id": "{}"}}'.format({}, key) # noqa E402
                 ),
                 {'port': REGISTRY_PORT}
+            ),
+            (
+                'put_health',
+                (key, int(time.time())),
+                {'port': 2379, 'ttl': 12}
             )
         ]
         self.assertEqual(len(expected), len(self.mock_registry.invocations))
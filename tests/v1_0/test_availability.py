@@ -0,0 +1,105 @@
+# Copyright 2019 British Broadcasting Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+import gevent
+
+from nmosregistration.availability import Availability
+
+
+class MockWatcher():
+    def __init__(self):
+        self.listeners = []
+
+    def subscribe(self, on_event, on_reset):
+        self.listeners.append((on_event, on_reset))
+
+    def reset(self, index):
+        for _, on_reset in self.listeners:
+            on_reset(index, None)
+
+
+class MockRegistry():
+    class RegistryUnavailable(Exception):
+        pass
+
+    def __init__(self):
+        self.broken = True
+
+    def get_raw(self, rkey, recurse=True):
+        if self.broken:
+            raise self.RegistryUnavailable
+
+
+class TestAvailability(unittest.TestCase):
+
+    def setUp(self):
+        self.registry = MockRegistry()
+        self.watcher = MockWatcher()
+        self.availability = Availability(self.registry, watcher=self.watcher, retry_after=0.01)
+
+    def fail(self, times=3):
+        for _ in range(times):
+            self.availability.failed()
+
+    def test_failure(self):
+        """After repeated failures, requests are turned away until the watcher is back in step"""
+        self.assertTrue(self.availability.available())
+        self.fail()
+        self.assertFalse(self.availability.available())
+        self.watcher.reset(10)
+        self.assertTrue(self.availability.available())
+
+    def test_threshold(self):
+        """Failures only count towards the threshold if nothing is heard from the registry in between"""
+        self.fail(2)
+        self.assertTrue(self.availability.available())
+        self.watcher.reset(10)
+        self.fail(2)
+        self.assertTrue(self.availability.available())
+
+    def test_window(self):
+        availability = Availability(self.registry, retry_after=0.01, window=0.01)
+        availability.failed()
+        availability.failed()
+        gevent.sleep(0.02)
+        availability.failed()
+        self.assertTrue(availability.available())
+
+    def test_watcher_lost(self):
+        for _ in range(3):
+            self.watcher.reset(None)
+        self.assertFalse(self.availability.available())
+
+    def test_probe(self):
+        """The registry is probed until it is back"""
+        self.fail()
+        gevent.sleep(0.05)
+        self.assertFalse(self.availability.available())
+        self.registry.broken = False
+        gevent.sleep(0.05)
+        self.assertTrue(self.availability.available())
+
+    def test_probe_at_once(self):
+        """A registry which is back by the time the threshold is reached is not taken to be down for long"""
+        availability = Availability(self.registry, retry_after=10)
+        self.registry.broken = False
+        for _ in range(3):
+            availability.failed()
+        gevent.sleep(0)
+        self.assertTrue(availability.available())
+
+
+if __name__ == '__main__':
+    unittest.main()
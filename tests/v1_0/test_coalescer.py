@@ -0,0 +1,75 @@
+# Copyright 2019 British Broadcasting Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+import gevent
+
+from nmosregistration.coalescer import Coalescer
+
+
+class Writes(object):
+    def __init__(self):
+        self.made = []
+
+    def write(self, key, value, duration=0):
+        self.made.append(('start', key, value))
+        gevent.sleep(duration)
+        self.made.append(('end', key, value))
+        return value
+
+    def fail(self, key, value):
+        raise ValueError("write failed")
+
+
+class TestCoalescer(unittest.TestCase):
+
+    def setUp(self):
+        self.writes = Writes()
+        self.coalescer = Coalescer(window=0.02)
+
+    def test_coalesced(self):
+        """Only the newest write within the window is made, and all callers get its result"""
+        greenlets = [gevent.spawn(self.coalescer.submit, "a", self.writes.write, "a", value) for value in [1, 2, 3]]
+        other = gevent.spawn(self.coalescer.submit, "b", self.writes.write, "b", 4)
+        gevent.joinall(greenlets + [other])
+        self.assertEqual([3, 3, 3], [greenlet.get() for greenlet in greenlets])
+        self.assertEqual(4, other.get())
+        self.assertEqual([('a', 3), ('b', 4)], [made[1:] for made in self.writes.made if made[0] == 'start'])
+        self.assertEqual({'writes': 2, 'coalesced': 2, 'pending': 0}, self.coalescer.get_stats())
+
+    def test_order(self):
+        """A write held while an earlier write to the key is being made waits for it"""
+        first = gevent.spawn(self.coalescer.submit, "a", self.writes.write, "a", 1, duration=0.05)
+        gevent.sleep(0.03)
+        second = gevent.spawn(self.coalescer.submit, "a", self.writes.write, "a", 2)
+        gevent.joinall([first, second])
+        self.assertEqual([('start', 'a', 1), ('end', 'a', 1), ('start', 'a', 2), ('end', 'a', 2)], self.writes.made)
+
+    def test_flush(self):
+        """A deletion flushes any write held for the key first"""
+        held = gevent.spawn(self.coalescer.submit, "a", self.writes.write, "a", 1)
+        gevent.sleep(0)
+        self.coalescer.flush("a")
+        self.assertEqual([('start', 'a', 1), ('end', 'a', 1)], self.writes.made)
+        self.assertEqual(1, held.get())
+
+    def test_failure(self):
+        greenlets = [gevent.spawn(self.coalescer.submit, "a", self.writes.fail, "a", value) for value in [1, 2]]
+        gevent.joinall(greenlets)
+        for greenlet in greenlets:
+            self.assertIsInstance(greenlet.exception, ValueError)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,146 @@
+# Copyright 2019 British Broadcasting Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+import gevent
+
+from nmosregistration.existence import ExistenceCache
+
+
+class MockWatcher():
+    def __init__(self):
+        self.synced = True
+        self.listeners = []
+
+    def subscribe(self, on_event, on_reset):
+        self.listeners.append((on_event, on_reset))
+
+    def event(self, action, key):
+        for on_event, _ in self.listeners:
+            on_event(action, key, {}, None)
+
+    def reset(self, index=None):
+        for _, on_reset in self.listeners:
+            on_reset(index)
+
+
+class MockBackend():
+    def __init__(self, resources):
+        self.resources = resources
+        self.lookups = []
+
+    class RegistryUnavailable(Exception):
+        pass
+
+    def getresources(self, rtype):
+        self.lookups.append((rtype,))
+        return [rid for t, rid in self.resources if t == rtype]
+
+    def resource_exists(self, rtype, rid):
+        self.lookups.append((rtype, rid))
+        return (rtype, rid) in self.resources
+
+
+class TestExistenceCache(unittest.TestCase):
+
+    def setUp(self):
+        self.backend = MockBackend({('nodes', 'a')})
+        self.watcher = MockWatcher()
+        self.cache = ExistenceCache(self.backend, self.watcher, negative_size=2)
+
+    def test_hit(self):
+        self.assertTrue(self.cache.exists('nodes', 'a'))
+        self.assertTrue(self.cache.exists('nodes', 'a'))
+        self.assertEqual([('nodes', 'a')], self.backend.lookups)
+
+    def test_negative(self):
+        self.assertFalse(self.cache.exists('nodes', 'b'))
+        self.assertFalse(self.cache.exists('nodes', 'b'))
+        self.assertEqual([('nodes', 'b')], self.backend.lookups)
+
+    def test_negative_bounded(self):
+        for rid in ['b', 'c', 'd']:
+            self.cache.exists('nodes', rid)
+        self.cache.exists('nodes', 'b')
+        self.assertEqual(2, self.backend.lookups.count(('nodes', 'b')))
+
+    def test_local_writes(self):
+        self.assertFalse(self.cache.exists('devices', 'x'))
+        self.cache.added('devices', 'x')
+        self.assertTrue(self.cache.exists('devices', 'x'))
+        self.cache.removed('devices', 'x')
+        self.cache.exists('devices', 'x')
+        self.assertEqual(2, len(self.backend.lookups))
+
+    def test_watch_events(self):
+        self.cache.exists('nodes', 'a')
+        self.watcher.event('delete', ['nodes', 'a'])
+        self.backend.resources = set()
+        self.assertFalse(self.cache.exists('nodes', 'a'))
+
+        self.cache.exists('sources', 's')
+        self.watcher.event('set', ['sources', 's'])
+        self.assertTrue(self.cache.exists('sources', 's'))
+        self.assertEqual(3, len(self.backend.lookups))
+
+    def test_unsynced(self):
+        """The cache is bypassed and emptied while the watch is not in step"""
+        self.cache.exists('nodes', 'a')
+        self.watcher.synced = False
+        self.watcher.reset()
+        self.cache.exists('nodes', 'a')
+        self.cache.added('nodes', 'a')
+        self.watcher.synced = True
+        self.cache.exists('nodes', 'a')
+        self.assertEqual(3, len(self.backend.lookups))
+
+    def test_untracked_type(self):
+        self.cache.exists('flows', 'f')
+        self.cache.exists('flows', 'f')
+        self.assertEqual(2, len(self.backend.lookups))
+
+    def test_might_exist(self):
+        """Nodes known to be absent are rejected without looking them up"""
+        self.assertTrue(self.cache.might_exist('nodes', 'b'))
+        self.cache.exists('nodes', 'b')
+        self.assertFalse(self.cache.might_exist('nodes', 'b'))
+        self.cache.added('nodes', 'b')
+        self.assertTrue(self.cache.might_exist('nodes', 'b'))
+
+    def test_node_filter(self):
+        """Once loaded, the filter of node IDs answers for nodes not yet looked up"""
+        self.watcher.reset(1)
+        self.assertTrue(self.cache.might_exist('nodes', 'b'))
+        gevent.sleep(0)
+        self.assertEqual([('nodes',)], self.backend.lookups)
+        self.assertTrue(self.cache.might_exist('nodes', 'a'))
+        self.assertFalse(self.cache.might_exist('nodes', 'b'))
+        self.watcher.event('set', ['nodes', 'b'])
+        self.assertTrue(self.cache.might_exist('nodes', 'b'))
+
+        self.watcher.reset()
+        self.assertTrue(self.cache.might_exist('nodes', 'c'))
+
+    def test_node_filter_count(self):
+        """Registrations seen twice, from a local write and the watch, are counted once"""
+        self.watcher.reset(1)
+        gevent.sleep(0)
+        self.cache.added('nodes', 'b')
+        self.watcher.event('set', ['nodes', 'b'])
+        self.watcher.event('set', ['nodes', 'a'])
+        self.assertEqual(2, self.cache._nodes.count)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -45,6 +45,13 @@ class MockDataBackend():
     def delete(self, rtype, rid):
         self._data[rtype] = [x for x in self._data.get(rtype, []) if x['id'] != rid]
 
+    def get_health_value_index(self, rid):
+        value = self._data.get('/health', {}).get('/health/' + rid)
+        return value, None if value is None else 1
+
+    def delete_health(self, rid):
+        self._data.get('/health', {}).pop('/health/' + rid, None)
+
     def put_obj(self, value):
         exist = self._data.setdefault(value['type'] + 's', [])
         exist.append(value['data'])
@@ -237,6 +244,29 @@ class GarbageCollectionTest(unittest.TestCase):
             else:
                 self.assertIsNone(res)
 
+    def test_orphaned_health(self):
+        """A health key whose node is not registered is removed"""
+        self._registry.set_data({'/health': {
+            '/health/33279d1d-1be9-43eb-9ac5-7c7a5a80a2c5': '0',
+            '/health/58ae56e0-c769-4be2-9ffb-a525068484c5': '0'
+        }})
+        for r in self.tree_resources:
+            self._registry.put_obj(r)
+        self._collector._collect()
+        self.assertEqual(['/health/33279d1d-1be9-43eb-9ac5-7c7a5a80a2c5'],
+                         list(self._registry.get_healths()['/health']))
+
+    def test_node_expired(self):
+        """An expired node is removed, unless it has been given health again"""
+        self._registry.set_data({'/health': {'/health/33279d1d-1be9-43eb-9ac5-7c7a5a80a2c5': '0'}})
+        for r in self.tree_resources:
+            self._registry.put_obj(r)
+        self._collector.node_expired('33279d1d-1be9-43eb-9ac5-7c7a5a80a2c5')
+        self.assertIsNotNone(self._registry.get('nodes', '33279d1d-1be9-43eb-9ac5-7c7a5a80a2c5'))
+        self._registry.delete_health('33279d1d-1be9-43eb-9ac5-7c7a5a80a2c5')
+        self._collector.node_expired('33279d1d-1be9-43eb-9ac5-7c7a5a80a2c5')
+        self.assertIsNone(self._registry.get('nodes', '33279d1d-1be9-43eb-9ac5-7c7a5a80a2c5'))
+
     def test_orphan_resources(self):
         for r in self.orphan_resources:
             self._registry.put_obj(r)
@@ -0,0 +1,210 @@
+# Copyright 2019 British Broadcasting Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import unittest
+import gevent
+
+from nmoscommon.webapi import WebAPI
+
+from nmosregistration.idindex import IdIndex
+from nmosregistration.v1_0 import routes as v1_0
+
+
+class MockWatcher():
+    def __init__(self):
+        self.synced = False
+        self.listeners = []
+
+    def subscribe(self, on_event, on_reset):
+        self.listeners.append((on_event, on_reset))
+
+    def event(self, action, key):
+        for on_event, _ in self.listeners:
+            on_event(action, key, {}, None)
+
+    def reset(self, index, root=None):
+        self.synced = index is not None
+        for _, on_reset in self.listeners:
+            on_reset(index, root)
+
+
+class MockRegistry():
+    class RegistryUnavailable(Exception):
+        pass
+
+    def __init__(self, resources):
+        self.resources = resources
+        self.requests = 0
+
+    def getresources(self, rtype, port=2379):
+        self.requests += 1
+        gevent.sleep(0)
+        return list(self.resources.get(rtype, []))
+
+    def put(self, rtype, rkey, value, ttl=None, port=2379):
+        return MockResponse(201)
+
+    def put_health(self, rkey, value, ttl=None, prev_exist=None, port=2379):
+        return MockResponse(201)
+
+    def delete(self, rtype, rkey, port=2379):
+        return MockResponse(200)
+
+    def delete_health(self, rkey, prev_index=None, port=2379):
+        return MockResponse(200)
+
+
+class MockResponse():
+    def __init__(self, status_code):
+        self.status_code = status_code
+        self.content = "{}"
+        self.headers = {}
+
+
+class MockLogger():
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: None
+
+
+class TestIdIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.watcher = MockWatcher()
+        self.registry = MockRegistry({"devices": ["c", "a", "b"]})
+        self.index = IdIndex(self.registry, self.watcher)
+
+    def test_load(self):
+        self.watcher.reset(10)
+        self.assertFalse(self.index.synced)
+        # Changes seen while loading are applied once loaded
+        self.watcher.event("set", ["devices", "d"])
+        self.watcher.event("delete", ["devices", "a"])
+        gevent.sleep(0.01)
+        self.assertTrue(self.index.synced)
+        self.assertEqual(["b", "c", "d"], self.index.ids("devices"))
+        self.assertEqual([], self.index.ids("nodes"))
+
+    def test_load_from_root(self):
+        self.watcher.reset(10, {"key": "/resource", "dir": True, "nodes": [
+            {"key": "/resource/nodes", "dir": True, "nodes": [
+                {"key": "/resource/nodes/b"}, {"key": "/resource/nodes/a"}
+            ]}
+        ]})
+        self.assertEqual(["a", "b"], self.index.ids("nodes"))
+        self.assertEqual(0, self.registry.requests)
+
+    def test_pages(self):
+        self.watcher.reset(10)
+        gevent.sleep(0.01)
+        self.assertEqual(["a", "b"], self.index.ids("devices", limit=2))
+        self.assertEqual(["c"], self.index.ids("devices", after="b", limit=2))
+        self.assertEqual(["b", "c"], self.index.ids("devices", after="aa"))
+
+    def test_events(self):
+        self.watcher.reset(10)
+        gevent.sleep(0.01)
+        self.watcher.event("update", ["devices", "a"])
+        self.watcher.event("create", ["devices", "ab"])
+        self.watcher.event("expire", ["devices", "c"])
+        self.assertEqual(["a", "ab", "b"], self.index.ids("devices"))
+        self.watcher.event("delete", ["devices"])
+        self.assertEqual([], self.index.ids("devices"))
+
+    def test_local_writes(self):
+        """Writes by this instance are applied at once, or once loaded if loading"""
+        self.watcher.reset(10)
+        self.index.added("devices", "d")
+        gevent.sleep(0.01)
+        self.index.added("devices", "e")
+        self.index.removed("devices", "a")
+        self.assertEqual(["b", "c", "d", "e"], self.index.ids("devices"))
+
+    def test_out_of_step(self):
+        self.watcher.reset(10)
+        gevent.sleep(0.01)
+        self.watcher.reset(None)
+        self.assertFalse(self.index.synced)
+
+
+class TestListings(unittest.TestCase):
+
+    def setUp(self):
+        self.watcher = MockWatcher()
+        self.registry = MockRegistry({"devices": ["c", "a", "b"], "nodes": ["n"]})
+        self.index = IdIndex(self.registry, self.watcher)
+        routes = v1_0.Routes(MockLogger(), self.registry, id_index=self.index)
+
+        class API(WebAPI):
+            def __init__(self):
+                super(API, self).__init__()
+                self.add_routes(routes, basepath="/x-nmos/registration/v1.0")
+
+        self.client = API().app.test_client()
+
+    def get(self, url):
+        r = self.client.get("/x-nmos/registration/v1.0" + url)
+        self.assertEqual(200, r.status_code)
+        return json.loads(r.get_data()), r.headers.get("Link")
+
+    def test_pages_from_index(self):
+        self.watcher.reset(10)
+        gevent.sleep(0.01)
+        requests = self.registry.requests
+
+        ids, link = self.get("/resource/devices?limit=2")
+        self.assertEqual(["a", "b"], ids)
+        self.assertEqual('</x-nmos/registration/v1.0/resource/devices?limit=2&after=b>; rel="next"', link)
+        ids, link = self.get("/resource/devices?limit=2&after=b")
+        self.assertEqual(["c"], ids)
+        self.assertIsNone(link)
+        ids, _ = self.get("/health/nodes/")
+        self.assertEqual(["n"], ids)
+        self.assertEqual(requests, self.registry.requests)
+
+    def test_pages_from_registry(self):
+        """Out of step, listings are read from the registry and paged from there"""
+        ids, _ = self.get("/resource/devices")
+        self.assertEqual(["c", "a", "b"], ids)
+        ids, link = self.get("/resource/devices?after=a&limit=1")
+        self.assertEqual(["b"], ids)
+        self.assertIn("after=b", link)
+
+    def test_registered_listed(self):
+        """A resource registered by this instance is listed before the watch reports it"""
+        self.watcher.reset(10)
+        gevent.sleep(0.01)
+        node = "17c27274-6aaf-4f4b-9b9a-5b5b5dc2af63"
+        r = self.client.post("/x-nmos/registration/v1.0/resource", content_type="application/json",
+                             data=json.dumps({'type': 'node', 'data': {
+                                 'label': 'test', 'href': 'http://127.0.0.1:8080', 'version': '1442328230:920000000',
+                                 'caps': {}, 'services': [], 'id': node
+                             }}))
+        self.assertEqual(201, r.status_code)
+        ids, _ = self.get("/resource/nodes")
+        self.assertEqual([node, "n"], ids)
+
+        r = self.client.delete("/x-nmos/registration/v1.0/resource/nodes/" + node)
+        self.assertEqual(204, r.status_code)
+        ids, _ = self.get("/resource/nodes")
+        self.assertEqual(["n"], ids)
+
+    def test_bad_limit(self):
+        for limit in ["0", "x"]:
+            r = self.client.get("/x-nmos/registration/v1.0/resource/devices?limit=" + limit)
+            self.assertEqual(400, r.status_code)
+
+
+if __name__ == '__main__':
+    unittest.main()
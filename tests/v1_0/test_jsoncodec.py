@@ -0,0 +1,47 @@
+# Copyright 2019 British Broadcasting Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+from nmosregistration import jsoncodec
+
+
+class TestJsonCodec(unittest.TestCase):
+
+    def setUp(self):
+        self.obj = {
+            "id": u"d553e551-e5df-4e46-8973-45f4cacf1172",
+            "href": u"http://127.0.0.1:8080/x-nmos/node/v1.3/",
+            "label": u"M\u00fcnchen",
+            "tags": {u"host": [u"hostname"]},
+            "caps": {},
+            "interlace": False,
+            "frame_width": 1920,
+            "parent": None
+        }
+
+    def test_roundtrip(self):
+        text = jsoncodec.dumps(self.obj)
+        self.assertIsInstance(text, type(u""))
+        self.assertEqual(self.obj, jsoncodec.loads(text))
+
+    def test_loads_bytes(self):
+        self.assertEqual(self.obj, jsoncodec.loads(jsoncodec.dumps(self.obj).encode('utf-8')))
+
+    def test_slashes_not_escaped(self):
+        self.assertIn("http://127.0.0.1:8080/", jsoncodec.dumps(self.obj))
+
+
+if __name__ == '__main__':
+    unittest.main()
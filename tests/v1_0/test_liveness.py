@@ -0,0 +1,223 @@
+# Copyright 2019 British Broadcasting Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+import json
+import time
+
+from nmosregistration.liveness import HeartbeatAbsorber
+from nmosregistration.timingwheel import TimingWheel
+
+
+class MockEtcdResponse():
+    def __init__(self, status_code, body):
+        self.status_code = status_code
+        self.content = json.dumps(body)
+
+
+class MockHealthBackend():
+    """Health keys held as {node_id: (value, modifiedIndex)}"""
+
+    class RegistryUnavailable(Exception):
+        pass
+
+    def __init__(self):
+        self.healths = {}
+        self.index = 0
+        self.writes = []
+
+    def _write(self, rkey, value):
+        self.index += 1
+        self.healths[rkey] = (value, self.index)
+        return MockEtcdResponse(200, {'node': {'key': '/health/' + rkey, 'value': value, 'modifiedIndex': self.index}})
+
+    def put_health(self, rkey, value, ttl=None, prev_exist=None, port=2379):
+        self.writes.append(('put_health', rkey, ttl))
+        if prev_exist and rkey not in self.healths:
+            return MockEtcdResponse(404, {'errorCode': 100})
+        return self._write(rkey, str(value))
+
+    def refresh_health(self, rkey, ttl, prev_index=None, port=2379):
+        self.writes.append(('refresh_health', rkey, ttl))
+        if rkey not in self.healths or (prev_index is not None and self.healths[rkey][1] != prev_index):
+            return MockEtcdResponse(412, {'errorCode': 101})
+        return self._write(rkey, self.healths[rkey][0])
+
+    def delete_health(self, rkey, prev_index=None, port=2379):
+        self.writes.append(('delete_health', rkey))
+        if rkey in self.healths and (prev_index is None or self.healths[rkey][1] == prev_index):
+            del self.healths[rkey]
+            return MockEtcdResponse(200, {})
+        return MockEtcdResponse(412, {'errorCode': 101})
+
+    def get_raw(self, rkey, recurse=True, port=2379):
+        return MockEtcdResponse(200, {'node': {'key': '/health', 'dir': True, 'nodes': [
+            {'key': '/health/' + k, 'value': v, 'modifiedIndex': i, 'ttl': 30} for k, (v, i) in self.healths.items()
+        ]}})
+
+
+class MockWatcher():
+    def __init__(self):
+        self.synced = True
+        self.listeners = []
+
+    def subscribe(self, on_event, on_reset):
+        self.listeners.append((on_event, on_reset))
+
+    def event(self, action, key, node):
+        for on_event, _ in self.listeners:
+            on_event(action, key, node, None)
+
+
+class TestHeartbeatAbsorber(unittest.TestCase):
+
+    def setUp(self):
+        self.backend = MockHealthBackend()
+        self.backend.healths['node'] = ('0', 0)
+        self.watcher = MockWatcher()
+        self.absorber = HeartbeatAbsorber(self.backend, ttl=12, factor=5, interval=0, watcher=self.watcher)
+
+    def test_absorb(self):
+        """Only the first heartbeat is written, with the extended TTL"""
+        self.assertEqual('100', self.absorber.heartbeat('node', 100))
+        self.assertEqual('105', self.absorber.heartbeat('node', 105))
+        self.assertEqual('110', self.absorber.heartbeat('node', 110))
+        self.assertEqual([('put_health', 'node', 60)], self.backend.writes)
+        self.assertEqual('110', self.absorber.get_health('node'))
+
+    def test_unknown_node(self):
+        self.assertIsNone(self.absorber.heartbeat('unknown', 100))
+        self.assertNotIn('unknown', self.backend.healths)
+
+    def test_taken_over(self):
+        """Heartbeats are written again once the watch reports another instance has written the key"""
+        self.absorber.heartbeat('node', 100)
+        r = self.backend.put_health('node', 102)
+        self.watcher.event('set', ['node'], json.loads(r.content)['node'])
+        self.absorber.heartbeat('node', 105)
+        self.assertEqual(('105', 3), self.backend.healths['node'])
+
+    def test_removed(self):
+        self.absorber.heartbeat('node', 100)
+        self.backend.delete_health('node')
+        self.watcher.event('delete', ['node'], {'key': '/health/node', 'modifiedIndex': 2})
+        self.assertIsNone(self.absorber.heartbeat('node', 105))
+
+    def test_out_of_step(self):
+        """Heartbeats are written through while the watch may be missing takeovers"""
+        self.absorber.heartbeat('node', 100)
+        self.watcher.synced = False
+        self.absorber.heartbeat('node', 105)
+        self.assertEqual(2, len(self.backend.writes))
+
+    def test_taken_over_unwatched(self):
+        """Without a watch, a takeover is noticed when the key is refreshed"""
+        absorber = HeartbeatAbsorber(self.backend, ttl=12, factor=5, interval=0)
+        absorber.heartbeat('node', 100)
+        self.backend.put_health('node', 102)
+        absorber._refresh(('node', absorber._holdings['node']))
+        self.assertNotIn('node', absorber._holdings)
+
+    def test_reconcile(self):
+        """Keys written elsewhere while the watch was out of step are no longer held"""
+        self.absorber.heartbeat('node', 100)
+        self.absorber.heartbeat('other', 100)
+        self.backend.healths['other'] = ('0', 0)
+        self.backend.put_health('other', 102)
+        self.absorber.rebuild()
+        self.assertFalse(self.absorber._holdings['node'].adopted)
+        self.assertTrue(self.absorber._holdings['other'].adopted)
+        self.assertEqual(self.backend.healths['other'][1], self.absorber._holdings['other'].index)
+
+    def test_refresh(self):
+        self.absorber.heartbeat('node', 100)
+        holding = self.absorber._holdings['node']
+        holding.expiry = 0
+        self.absorber._refresh(('node', holding))
+        self.assertEqual(('refresh_health', 'node', 60), self.backend.writes[-1])
+        self.assertEqual(self.backend.healths['node'][1], holding.index)
+
+    def test_expire(self):
+        """An expired node's key is removed, unless another instance has written it since"""
+        self.absorber.heartbeat('node', 100)
+        self.absorber._expire(('node', self.absorber._holdings['node']))
+        self.assertNotIn('node', self.backend.healths)
+
+        self.backend.healths['node'] = ('0', 0)
+        self.absorber.heartbeat('node', 100)
+        holding = self.absorber._holdings['node']
+        self.backend.put_health('node', 110)
+        self.absorber._expire(('node', holding))
+        self.assertIn('node', self.backend.healths)
+
+    def test_flush(self):
+        """Nodes not heard from are expired, and the expiry announced; others are kept"""
+        expired = []
+        self.absorber.subscribe(expired.append)
+        self.absorber._wheel = TimingWheel(time.time() - 20)
+        self.backend.healths['other'] = ('0', 0)
+        now = int(time.time())
+        self.absorber.heartbeat('node', now - 13)
+        self.absorber.heartbeat('other', now - 13)
+        self.absorber.heartbeat('other', now)
+        self.absorber.flush()
+        self.assertEqual(['node'], expired)
+        self.assertNotIn('node', self.backend.healths)
+        self.assertIn('other', self.absorber._wheel)
+
+    def test_rebuild(self):
+        """Adopted keys are taken over by their first heartbeat, but lapse if their nodes are not heard from"""
+        self.backend.healths['other'] = ('0', 0)
+        self.absorber.rebuild()
+        now = int(time.time())
+        self.assertEqual(str(now), self.absorber.heartbeat('node', now))
+        self.assertEqual(str(now + 1), self.absorber.heartbeat('node', now + 1))
+        self.assertEqual([('put_health', 'node', 60)], self.backend.writes)
+        self.assertFalse(self.absorber._holdings['node'].adopted)
+
+        self.absorber._wheel = TimingWheel(time.time() - 40)
+        self.absorber._holdings['other'].expiry = 0
+        self.absorber._hold('other', self.absorber._holdings['other'])
+        self.absorber.flush()
+        self.assertNotIn('other', self.absorber._holdings)
+        self.assertIn('other', self.backend.healths)
+
+
+class TestSharedHealth(unittest.TestCase):
+    """Two instances sharing a registry"""
+
+    def setUp(self):
+        self.backend = MockHealthBackend()
+        self.backend.healths['node'] = ('0', 0)
+        self.first = HeartbeatAbsorber(self.backend, ttl=12, factor=5, interval=0)
+        self.second = HeartbeatAbsorber(self.backend, ttl=12, factor=5, interval=0)
+        self.expired = []
+        self.first.subscribe(self.expired.append)
+
+    def test_adopted_elsewhere(self):
+        """A node heard from only by the instance which adopted its key is not removed by the one which wrote it"""
+        now = int(time.time())
+        self.first.heartbeat('node', now - 13)
+        self.second.rebuild()
+        self.second.heartbeat('node', now)
+
+        self.first._wheel = TimingWheel(time.time() - 20)
+        self.first._hold('node', self.first._holdings['node'])
+        self.first.flush()
+        self.assertEqual([], self.expired)
+        self.assertEqual(str(now), self.backend.healths['node'][0])
+
+
+if __name__ == '__main__':
+    unittest.main()
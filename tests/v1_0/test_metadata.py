@@ -0,0 +1,55 @@
+# Copyright 2019 British Broadcasting Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+import json
+
+from nmosregistration.metadata import attach_metadata, split_metadata
+
+
+class TestMetadata(unittest.TestCase):
+
+    def setUp(self):
+        self.resource = {
+            "id": "17c27274-6aaf-4f4b-9b9a-5b5b5dc2af63",
+            "label": "test \"@_quoted\"",
+            "tags": {"@_nested": ["kept"]},
+            "version": "1442328230:920000000"
+        }
+        self.metadata = {"@_apiversion": "v1.3"}
+
+    def test_roundtrip(self):
+        representation = json.dumps(self.resource)
+        value = attach_metadata(representation, self.metadata)
+        self.assertEqual(dict(self.resource, **self.metadata), json.loads(value))
+        self.assertEqual((representation, self.metadata), split_metadata(value))
+
+    def test_empty_representation(self):
+        value = attach_metadata("{}", self.metadata)
+        self.assertEqual(("{}", self.metadata), split_metadata(value))
+
+    def test_no_metadata(self):
+        representation = json.dumps(self.resource)
+        self.assertEqual((representation, {}), split_metadata(representation))
+
+    def test_legacy_value(self):
+        """Values with metadata in any position are still split"""
+        value = json.dumps(dict(self.resource, **self.metadata), sort_keys=True)
+        representation, metadata = split_metadata(value)
+        self.assertEqual(self.metadata, metadata)
+        self.assertEqual(self.resource, json.loads(representation))
+
+
+if __name__ == '__main__':
+    unittest.main()
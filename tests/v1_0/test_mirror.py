@@ -0,0 +1,233 @@
+# Copyright 2019 British Broadcasting Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+import json
+
+from nmoscommon.webapi import WebAPI
+
+from nmosregistration.mirror import Mirror
+from nmosregistration.availability import Availability
+from nmosregistration.v1_0 import routes as v1_0
+
+
+class MockWatcher():
+    def __init__(self):
+        self.synced = True
+        self.resets = 0
+        self.listeners = []
+
+    def subscribe(self, on_event, on_reset):
+        self.listeners.append((on_event, on_reset))
+
+    def staleness(self):
+        return 1.5
+
+    def event(self, action, key, node):
+        for on_event, _ in self.listeners:
+            on_event(action, key, node, None)
+
+    def reset(self, index, root):
+        for _, on_reset in self.listeners:
+            on_reset(index, root)
+
+
+class MockEtcdResponse():
+    def __init__(self, status_code, body):
+        self.status_code = status_code
+        self.content = json.dumps(body)
+
+
+def etcd_node(key, value, index):
+    return {'key': key, 'value': value, 'modifiedIndex': index}
+
+
+class TestMirror(unittest.TestCase):
+
+    def setUp(self):
+        self.resources = MockWatcher()
+        self.healths = MockWatcher()
+        self.mirror = Mirror(self.resources, self.healths)
+        self.resources.reset(10, {'key': '/resource', 'dir': True, 'nodes': [
+            {'key': '/resource/nodes', 'dir': True, 'nodes': [etcd_node('/resource/nodes/a', '{"id": "a"}', 5)]}
+        ]})
+        self.healths.reset(10, {'key': '/health', 'dir': True, 'nodes': [etcd_node('/health/a', '100', 6)]})
+
+    def test_load(self):
+        self.assertEqual('{"id": "a"}', self.mirror.get_value('nodes', 'a'))
+        self.assertEqual(['a'], self.mirror.getresources('nodes'))
+        self.assertTrue(self.mirror.resource_exists('nodes', 'a'))
+        self.assertFalse(self.mirror.resource_exists('devices', 'a'))
+        self.assertEqual('100', self.mirror.get_health('a'))
+
+    def test_events(self):
+        self.resources.event('set', ['devices', 'd'], etcd_node('/resource/devices/d', '{"id": "d"}', 11))
+        self.resources.event('delete', ['nodes', 'a'], {'key': '/resource/nodes/a', 'modifiedIndex': 12})
+        self.healths.event('expire', ['a'], {'key': '/health/a', 'modifiedIndex': 13})
+        self.assertEqual(['d'], self.mirror.getresources('devices'))
+        self.assertIsNone(self.mirror.get_value('nodes', 'a'))
+        self.assertIsNone(self.mirror.get_health('a'))
+        self.assertEqual(3, self.mirror.get_stats()['events'])
+
+    def test_local_writes(self):
+        """Local writes are readable at once, and not undone by older changes reported late"""
+        self.mirror.resource_written('nodes', 'a', MockEtcdResponse(200, {
+            'action': 'set', 'node': etcd_node('/resource/nodes/a', '{"id": "a", "v": 2}', 20)
+        }))
+        self.resources.event('set', ['nodes', 'a'], etcd_node('/resource/nodes/a', '{"id": "a", "v": 1}', 15))
+        self.assertEqual('{"id": "a", "v": 2}', self.mirror.get_value('nodes', 'a'))
+
+        self.mirror.resource_deleted('nodes', 'a', MockEtcdResponse(200, {
+            'action': 'delete', 'node': {'key': '/resource/nodes/a', 'modifiedIndex': 21}
+        }))
+        self.resources.event('set', ['nodes', 'a'], etcd_node('/resource/nodes/a', '{"id": "a", "v": 2}', 20))
+        self.assertFalse(self.mirror.resource_exists('nodes', 'a'))
+        self.resources.event('delete', ['nodes', 'a'], {'key': '/resource/nodes/a', 'modifiedIndex': 21})
+        self.assertEqual({}, self.mirror._tombstones)
+
+
+class MockLogger():
+    def __getattr__(self, name):
+        return lambda *args: None
+
+
+class MockRegistry():
+    class RegistryUnavailable(Exception):
+        pass
+
+    def __init__(self):
+        self.requests = 0
+        self.broken = False
+
+    def get_value_index(self, rtype, rkey):
+        self.requests += 1
+        if self.broken:
+            raise self.RegistryUnavailable
+        return None, None
+
+    def get_values(self, rtype, rkeys):
+        self.requests += 1
+        return {rkey: '{"id": "%s", "@_apiversion": "v1.0"}' % rkey for rkey in rkeys if rkey != "missing"}
+
+
+class TestMirroredReads(unittest.TestCase):
+
+    def setUp(self):
+        self.resources = MockWatcher()
+        self.healths = MockWatcher()
+        self.mirror = Mirror(self.resources, self.healths)
+        self.resources.reset(10, {'key': '/resource', 'dir': True, 'nodes': [
+            {'key': '/resource/nodes', 'dir': True, 'nodes': [etcd_node('/resource/nodes/a', '{"id": "a"}', 5)]}
+        ]})
+        self.registry = MockRegistry()
+        self.availability = Availability(self.registry, retry_after=5, threshold=1)
+        routes = v1_0.Routes(MockLogger(), self.registry, mirror=self.mirror, availability=self.availability)
+
+        class API(WebAPI):
+            def __init__(self):
+                super(API, self).__init__()
+                self.add_routes(routes, basepath="/x-nmos/registration/v1.0")
+
+        self.client = API().app.test_client()
+
+    def test_read_from_mirror(self):
+        r = self.client.get("/x-nmos/registration/v1.0/resource/nodes/a")
+        self.assertEqual(200, r.status_code)
+        self.assertEqual({"id": "a"}, json.loads(r.get_data()))
+        self.assertEqual("1.500", r.headers["X-Registry-Staleness"])
+
+    def test_etag(self):
+        r = self.client.get("/x-nmos/registration/v1.0/resource/nodes/a")
+        self.assertEqual('"5"', r.headers["ETag"])
+
+        r = self.client.get("/x-nmos/registration/v1.0/resource/nodes/a", headers={"If-None-Match": '"5"'})
+        self.assertEqual(304, r.status_code)
+        self.assertEqual(b"", r.get_data())
+        self.assertEqual('"5"', r.headers["ETag"])
+
+        r = self.client.get("/x-nmos/registration/v1.0/resource/nodes/a", headers={"If-None-Match": 'W/"5"'})
+        self.assertEqual(304, r.status_code)
+
+        r = self.client.get("/x-nmos/registration/v1.0/resource/nodes/a", headers={"If-None-Match": '"4"'})
+        self.assertEqual(200, r.status_code)
+        self.assertEqual(0, self.registry.requests)
+
+    def test_health_etag(self):
+        self.healths.reset(10, {'key': '/health', 'dir': True, 'nodes': [etcd_node('/health/a', '1000', 7)]})
+        r = self.client.get("/x-nmos/registration/v1.0/health/nodes/a")
+        self.assertEqual({"health": "1000"}, json.loads(r.get_data()))
+        self.assertEqual('"7"', r.headers["ETag"])
+
+        r = self.client.get("/x-nmos/registration/v1.0/health/nodes/a", headers={"If-None-Match": '"7"'})
+        self.assertEqual(304, r.status_code)
+
+    def get_resources(self, items):
+        r = self.client.post("/x-nmos/registration/v1.0/bulk/get", data=json.dumps(items),
+                             content_type="application/json")
+        self.assertEqual(200, r.status_code)
+        return json.loads(r.get_data())
+
+    def test_bulk_get(self):
+        results = self.get_resources([
+            {"type": "nodes", "id": "a"}, {"type": "nodes", "id": "b"}, {"type": "things", "id": "a"}
+        ])
+        self.assertEqual([
+            {"type": "nodes", "id": "a", "code": 200, "resource": {"id": "a"}},
+            {"type": "nodes", "id": "b", "code": 404},
+            {"type": "things", "id": "a", "code": 404},
+        ], results)
+        self.assertEqual(0, self.registry.requests)
+
+    def test_bulk_get_from_registry(self):
+        """Out of step with the mirror, each type is read from the registry once"""
+        self.healths.synced = False
+        results = self.get_resources([
+            {"type": "devices", "id": "c"}, {"type": "devices", "id": "missing"}, {"type": "nodes", "id": "a"},
+            {"type": "devices", "id": "d"}
+        ])
+        self.assertEqual([200, 404, 200, 200], [result["code"] for result in results])
+        self.assertEqual({"id": "c"}, results[0]["resource"])
+        self.assertEqual(2, self.registry.requests)
+
+    def test_bulk_get_malformed(self):
+        r = self.client.post("/x-nmos/registration/v1.0/bulk/get", data=json.dumps([["nodes", "a"]]),
+                             content_type="application/json")
+        self.assertEqual(400, r.status_code)
+
+    def test_read_from_registry_when_out_of_step(self):
+        self.healths.synced = False
+        r = self.client.get("/x-nmos/registration/v1.0/resource/nodes/a")
+        self.assertEqual(404, r.status_code)
+        self.assertNotIn("X-Registry-Staleness", r.headers)
+
+    def test_degraded_reads(self):
+        """While the registry is unavailable, reads are answered from the last known state"""
+        self.resources.synced = False
+        self.registry.broken = True
+        for _ in range(2):
+            r = self.client.get("/x-nmos/registration/v1.0/resource/nodes/a")
+            self.assertEqual(200, r.status_code)
+            self.assertEqual("1.500", r.headers["X-Registry-Staleness"])
+        self.assertEqual(1, self.registry.requests)
+
+    def test_writes_rejected(self):
+        """While the registry is known to be unavailable, writes are turned away at once"""
+        self.availability.failed()
+        r = self.client.delete("/x-nmos/registration/v1.0/resource/nodes/a")
+        self.assertEqual(503, r.status_code)
+        self.assertEqual("5", r.headers["Retry-After"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -128,6 +128,43 @@ class TestModification(unittest.TestCase):
         resource["data"]["id"] = resource["data"]["id"].upper()
         self.assertEqual(orig_resource, self.modifier.modify(resource))
 
+    def test_corrected_receiver(self):
+        orig_resource = self._make_receiver_resource()
+        orig_resource["data"]["subscription"]["sender_id"] = u"9aba4e98-de16-47dc-980f-c4dd3bcbb27b"
+        resource = copy.deepcopy(orig_resource)
+        resource["data"]["subscription"]["sender_id"] = resource["data"]["subscription"]["sender_id"].upper()
+        self.assertEqual(orig_resource, self.modifier.modify(resource))
+
+    def test_null_subscription(self):
+        resource = self._make_receiver_resource()
+        resource["data"]["subscription"]["sender_id"] = None
+        self.assertEqual(resource, self.modifier.modify(copy.deepcopy(resource)))
+
+
+class TestCompileSchema(unittest.TestCase):
+
+    def test_compile(self):
+        compiled = modifier.compile_schema(modifier.SCHEMA["device"])
+        self.assertEqual(
+            sorted(path for path, _ in compiled if modifier.EACH not in path),
+            [("data", "node_id")]
+        )
+        self.assertEqual(
+            sorted(path[:-1] for path, _ in compiled if modifier.EACH in path),
+            [("data", "receivers"), ("data", "senders")]
+        )
+
+    def test_list_of_subresources(self):
+        compiled = modifier.compile_schema({"data": {"items": [{"id": modifier.UuidModifier}]}})
+        data = {"data": {"items": [{"id": u"ABC"}, {"id": u"DEF"}]}}
+        for path, modify in compiled:
+            modifier._apply(data, path, modify)
+        self.assertEqual(data, {"data": {"items": [{"id": u"abc"}, {"id": u"def"}]}})
+
+    def test_unrecognised(self):
+        with self.assertRaises(Exception):
+            modifier.compile_schema({"data": {"id": "nonsense"}})
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,152 @@
+# Copyright 2019 British Broadcasting Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import unittest
+
+from nmoscommon.webapi import WebAPI
+
+from nmosregistration.mergepatch import merge_patch
+from nmosregistration.v1_0 import routes as v1_0
+
+
+class TestMergePatch(unittest.TestCase):
+
+    def test_merge_patch(self):
+        target = {"a": "b", "c": {"d": "e", "f": "g"}, "h": [1]}
+        patch = {"a": "z", "c": {"f": None}, "h": [2], "i": {"j": None}}
+        self.assertEqual({"a": "z", "c": {"d": "e"}, "h": [2], "i": {}}, merge_patch(target, patch))
+        self.assertEqual({"a": "b", "c": {"d": "e", "f": "g"}, "h": [1]}, target)
+
+    def test_replace_document(self):
+        self.assertEqual(["a"], merge_patch({"a": "b"}, ["a"]))
+        self.assertEqual({"a": "b"}, merge_patch("c", {"a": "b"}))
+
+
+class MockEtcdResponse():
+    def __init__(self, status_code, body):
+        self.status_code = status_code
+        self.content = json.dumps(body)
+        self.headers = {}
+
+
+class MockRegistry():
+    class RegistryUnavailable(Exception):
+        pass
+
+    def __init__(self):
+        self.values = {}
+        self.index = 10
+        self.writes = []
+        self.before_write = None
+
+    def store(self, rtype, rkey, value):
+        self.index += 1
+        self.values[(rtype, rkey)] = (value, self.index)
+
+    def get_value_index(self, rtype, rkey, port=2379):
+        return self.values.get((rtype, rkey), (None, None))
+
+    def put(self, rtype, rkey, value, ttl=None, prev_index=None, port=2379):
+        if self.before_write is not None:
+            self.before_write()
+        self.writes.append((rtype, rkey, prev_index))
+        if prev_index is not None and self.values.get((rtype, rkey), (None, None))[1] != prev_index:
+            return MockEtcdResponse(412, {"errorCode": 101})
+        self.store(rtype, rkey, value)
+        return MockEtcdResponse(200, {"node": {"value": value, "modifiedIndex": self.index}})
+
+    def resource_exists(self, rtype, rkey, port=2379):
+        return (rtype, rkey) in self.values
+
+
+class MockLogger():
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: None
+
+
+class TestPatch(unittest.TestCase):
+
+    NODE = "17c27274-6aaf-4f4b-9b9a-5b5b5dc2af63"
+
+    def setUp(self):
+        self.registry = MockRegistry()
+        self.node = {
+            'label': 'test', 'href': 'http://127.0.0.1:8080', 'version': '1442328230:920000000',
+            'caps': {}, 'services': [], 'id': self.NODE
+        }
+        self.registry.store("nodes", self.NODE, json.dumps(self.node)[:-1] + ', "@_apiversion": "v1.0"}')
+        routes = v1_0.Routes(MockLogger(), self.registry)
+
+        class API(WebAPI):
+            def __init__(self):
+                super(API, self).__init__()
+                self.add_routes(routes, basepath="/x-nmos/registration/v1.0")
+
+        self.client = API().app.test_client()
+
+    def patch(self, body, rtype="nodes", rkey=None, content_type="application/merge-patch+json"):
+        return self.client.patch("/x-nmos/registration/v1.0/resource/{}/{}".format(rtype, rkey or self.NODE),
+                                 data=json.dumps(body), content_type=content_type)
+
+    def stored(self):
+        return json.loads(self.registry.values[("nodes", self.NODE)][0])
+
+    def test_patch(self):
+        r = self.patch({'label': 'patched', 'version': '1442328231:0'})
+        self.assertEqual(200, r.status_code)
+        expected = dict(self.node, label='patched', version='1442328231:0')
+        self.assertEqual(expected, json.loads(r.get_data()))
+        self.assertEqual(dict(expected, **{'@_apiversion': 'v1.0'}), self.stored())
+        self.assertEqual([("nodes", self.NODE, 11)], self.registry.writes)
+
+    def test_invalid(self):
+        """The patched resource must still be valid"""
+        r = self.patch({'label': None})
+        self.assertEqual(400, r.status_code)
+        r = self.patch({'id': "a2a8b0c4-4bf3-4d3b-9bdb-4b7bd7f7e2a5"})
+        self.assertEqual(400, r.status_code)
+        r = self.patch(["not", "a", "patch"])
+        self.assertEqual(400, r.status_code)
+        self.assertEqual([], self.registry.writes)
+
+    def test_content_type(self):
+        """Only a JSON merge patch is accepted"""
+        r = self.patch({'label': 'patched'}, content_type="application/json")
+        self.assertEqual(415, r.status_code)
+        r = self.patch({'label': 'patched'}, content_type="application/merge-patch+json; charset=utf-8")
+        self.assertEqual(200, r.status_code)
+
+    def test_not_found(self):
+        r = self.patch({'label': 'patched'}, rkey="a2a8b0c4-4bf3-4d3b-9bdb-4b7bd7f7e2a5")
+        self.assertEqual(404, r.status_code)
+        r = self.patch({'label': 'patched'}, rtype="things")
+        self.assertEqual(404, r.status_code)
+
+    def test_changed_while_patching(self):
+        """A patch is applied again to a resource which changed after it was read"""
+        def change():
+            self.registry.before_write = None
+            self.registry.store("nodes", self.NODE, json.dumps(dict(self.node, description='changed')))
+
+        self.registry.before_write = change
+        r = self.patch({'label': 'patched'})
+        self.assertEqual(200, r.status_code)
+        self.assertEqual([("nodes", self.NODE, 11), ("nodes", self.NODE, 12)], self.registry.writes)
+        self.assertEqual('changed', self.stored()['description'])
+        self.assertEqual('patched', self.stored()['label'])
+
+
+if __name__ == '__main__':
+    unittest.main()
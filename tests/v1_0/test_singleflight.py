@@ -0,0 +1,146 @@
+# Copyright 2019 British Broadcasting Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import json
+import unittest
+import gevent
+
+from nmoscommon.webapi import WebAPI
+
+from nmosregistration.singleflight import SingleFlight
+from nmosregistration.v1_2 import routes as v1_2
+from nmosregistration.v1_3 import routes as v1_3
+
+NODE_FIXTURE = os.path.join(os.path.dirname(os.path.realpath(__file__)), "..", "v1_2", "fixtures", "node.json")
+
+
+class MockResponse():
+    def __init__(self, status_code):
+        self.status_code = status_code
+        self.content = "{}"
+        self.headers = {}
+
+
+class MockRegistry():
+    class RegistryUnavailable(Exception):
+        pass
+
+    def __init__(self):
+        self.puts = []
+
+    def put(self, rtype, rkey, value, ttl=None, port=2379):
+        self.puts.append(value)
+        gevent.sleep(0.01)
+        return MockResponse(201)
+
+    def put_health(self, rkey, value, ttl=None, prev_exist=None, port=2379):
+        return MockResponse(201)
+
+
+class MockLogger():
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: None
+
+
+class TestSingleFlight(unittest.TestCase):
+
+    def setUp(self):
+        self.singleflight = SingleFlight()
+        self.calls = []
+
+    def call(self, value):
+        self.calls.append(value)
+        gevent.sleep(0.01)
+        return value
+
+    def fail(self, value):
+        self.calls.append(value)
+        gevent.sleep(0.01)
+        raise ValueError(value)
+
+    def test_shared(self):
+        """Concurrent calls for the same key share one call"""
+        greenlets = [gevent.spawn(self.singleflight.do, "a", self.call, 1) for _ in range(3)]
+        greenlets.append(gevent.spawn(self.singleflight.do, "b", self.call, 2))
+        gevent.joinall(greenlets)
+        self.assertEqual([1, 1, 1, 2], [greenlet.get() for greenlet in greenlets])
+        self.assertEqual([1, 2], self.calls)
+        self.assertEqual({'calls': 2, 'shared': 2, 'in_flight': 0}, self.singleflight.get_stats())
+
+    def test_not_shared_once_done(self):
+        self.assertEqual(1, self.singleflight.do("a", self.call, 1))
+        self.assertEqual(2, self.singleflight.do("a", self.call, 2))
+        self.assertEqual([1, 2], self.calls)
+
+    def test_failure_shared(self):
+        greenlets = [gevent.spawn(self.singleflight.do, "a", self.fail, 1) for _ in range(2)]
+        gevent.joinall(greenlets)
+        for greenlet in greenlets:
+            self.assertIsInstance(greenlet.exception, ValueError)
+        self.assertEqual([1], self.calls)
+
+    def test_caller_killed(self):
+        """Callers waiting on a call whose caller is killed are not left waiting"""
+        leader = gevent.spawn(self.singleflight.do, "a", self.call, 1)
+        gevent.sleep(0)
+        follower = gevent.spawn(self.singleflight.do, "a", self.call, 1)
+        gevent.sleep(0)
+        leader.kill()
+        follower.join(timeout=1)
+        self.assertTrue(follower.ready())
+        self.assertEqual(0, len(self.singleflight._flights))
+
+
+class TestSharedRegistrations(unittest.TestCase):
+
+    def setUp(self):
+        self.registry = MockRegistry()
+        singleflight = SingleFlight()
+        registry = self.registry
+
+        class API(WebAPI):
+            def __init__(self):
+                super(API, self).__init__()
+                for version, routes in [("v1.2", v1_2), ("v1.3", v1_3)]:
+                    self.add_routes(routes.Routes(MockLogger(), registry, singleflight=singleflight),
+                                    basepath="/x-nmos/registration/" + version)
+
+        self.client = API().app.test_client()
+        with open(NODE_FIXTURE) as fixture:
+            self.body = json.dumps({'type': 'node', 'data': json.load(fixture)})
+
+    def post(self, version):
+        return self.client.post("/x-nmos/registration/{}/resource".format(version), data=self.body,
+                                content_type="application/json")
+
+    def test_versions_not_shared(self):
+        """The same registration made through two API versions is not shared"""
+        greenlets = [gevent.spawn(self.post, version) for version in ["v1.2", "v1.3"]]
+        gevent.joinall(greenlets)
+        self.assertEqual([201, 201], [greenlet.value.status_code for greenlet in greenlets])
+        self.assertIn("/v1.2/", greenlets[0].value.headers["Location"])
+        self.assertIn("/v1.3/", greenlets[1].value.headers["Location"])
+        self.assertEqual(2, len(self.registry.puts))
+        self.assertEqual({"v1.2", "v1.3"}, set(json.loads(value)["@_apiversion"] for value in self.registry.puts))
+
+    def test_retries_shared(self):
+        greenlets = [gevent.spawn(self.post, "v1.3") for _ in range(2)]
+        gevent.joinall(greenlets)
+        self.assertEqual([201, 201], [greenlet.value.status_code for greenlet in greenlets])
+        self.assertEqual(1, len(self.registry.puts))
+
+
+if __name__ == '__main__':
+    unittest.main()
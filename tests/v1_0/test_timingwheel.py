@@ -0,0 +1,72 @@
+# Copyright 2019 British Broadcasting Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+import random
+
+from nmosregistration.timingwheel import TimingWheel
+
+
+class TestTimingWheel(unittest.TestCase):
+
+    def test_due(self):
+        wheel = TimingWheel(100, slots=4, levels=2)
+        wheel.schedule('a', 102)
+        wheel.schedule('b', 110.5)
+        self.assertEqual([], wheel.advance(101))
+        self.assertEqual(['a'], wheel.advance(102))
+        self.assertEqual([], wheel.advance(110))
+        self.assertEqual(['b'], wheel.advance(111))
+        self.assertEqual(0, len(wheel))
+
+    def test_reschedule_and_cancel(self):
+        wheel = TimingWheel(0, slots=4, levels=2)
+        wheel.schedule('a', 2)
+        wheel.schedule('a', 5)
+        wheel.schedule('b', 3)
+        wheel.cancel('b')
+        self.assertEqual([], wheel.advance(4))
+        self.assertEqual(['a'], wheel.advance(5))
+
+    def test_past_deadline(self):
+        wheel = TimingWheel(10)
+        wheel.schedule('a', 5)
+        self.assertEqual(['a'], wheel.advance(11))
+
+    def test_beyond_range(self):
+        """Deadlines beyond the range of every level come due on time"""
+        wheel = TimingWheel(0, slots=2, levels=2)
+        wheel.schedule('a', 9)
+        self.assertEqual([], wheel.advance(8))
+        self.assertEqual(['a'], wheel.advance(9))
+
+    def test_random(self):
+        rand = random.Random(0)
+        for slots, levels in [(2, 1), (3, 2), (4, 3), (8, 2)]:
+            wheel = TimingWheel(0, slots=slots, levels=levels)
+            deadlines = {}
+            now = 0
+            for _ in range(500):
+                key = rand.randint(0, 50)
+                deadline = now + rand.randint(1, 200)
+                wheel.schedule(key, deadline)
+                deadlines[key] = deadline
+                now += rand.randint(0, 5)
+                for key in wheel.advance(now):
+                    self.assertLessEqual(deadlines.pop(key), now)
+                self.assertTrue(all(deadline > now for deadline in deadlines.values()))
+
+
+if __name__ == '__main__':
+    unittest.main()
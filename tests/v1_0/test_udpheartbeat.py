@@ -0,0 +1,67 @@
+# Copyright 2019 British Broadcasting Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+import hmac
+import time
+import hashlib
+
+from nmosregistration.udpheartbeat import HeartbeatListener
+
+NODE_A = "17c27274-6aaf-4f4b-9b9a-5b5b5dc2af63"
+NODE_B = "a2a8b0c4-4bf3-4d3b-9bdb-4b7bd7f7e2a5"
+
+
+class TestHeartbeatListener(unittest.TestCase):
+
+    def setUp(self):
+        self.heartbeats = []
+        self.listener = HeartbeatListener(self.heartbeat, 0, interval=0)
+
+    def heartbeat(self, node_id):
+        self.heartbeats.append(node_id)
+        return {'id': node_id, 'code': 204 if node_id == NODE_A else 404}
+
+    def sign(self, key, message):
+        return message + b" " + hmac.new(key, message, hashlib.sha256).hexdigest().encode('ascii')
+
+    def test_batched(self):
+        """Node IDs received between batches are heartbeated once each"""
+        self.listener.handle(NODE_A.encode('ascii'), None)
+        self.listener.handle("{} {}".format(NODE_A, NODE_B).encode('ascii'), None)
+        self.listener.flush()
+        self.assertEqual(sorted([NODE_A, NODE_B]), sorted(self.heartbeats))
+        self.assertEqual(1, self.listener.stats['alive'])
+        self.assertEqual(1, self.listener.stats['unknown'])
+
+        self.listener.flush()
+        self.assertEqual(2, len(self.heartbeats))
+
+    def test_malformed(self):
+        """Datagrams which do not hold node IDs are rejected"""
+        for data in [b"", b"not-a-node-id", b"\xff\xfe", "{} x".format(NODE_A).encode('ascii')]:
+            self.listener.handle(data, None)
+        self.listener.flush()
+        self.assertEqual([], self.heartbeats)
+        self.assertEqual(4, self.listener.stats['rejected'])
+
+    def test_signed(self):
+        """With a key set, only correctly signed, recent datagrams are accepted"""
+        self.listener.key = b"secret"
+        now = "{}".format(int(time.time())).encode('ascii')
+        stale = "{}".format(int(time.time()) - 3600).encode('ascii')
+        self.assertEqual([NODE_A], self.listener.parse(self.sign(b"secret", now + b" " + NODE_A.encode('ascii'))))
+        self.assertIsNone(self.listener.parse(self.sign(b"wrong", now + b" " + NODE_A.encode('ascii'))))
+        self.assertIsNone(self.listener.parse(self.sign(b"secret", stale + b" " + NODE_A.encode('ascii'))))
+        self.assertIsNone(self.listener.parse(NODE_A.encode('ascii')))
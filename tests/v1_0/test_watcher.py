@@ -0,0 +1,87 @@
+# Copyright 2019 British Broadcasting Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import unittest
+import gevent
+
+from nmosregistration.watcher import Watcher
+
+HISTORY = 10  # events etcd remembers
+
+
+class MockEtcdResponse():
+    def __init__(self, body, index):
+        self.content = json.dumps(body)
+        self.headers = {"X-Etcd-Index": str(index)}
+
+
+class MockEtcd():
+    """Writes elsewhere in the keyspace move the etcd index on while a watch waits"""
+
+    class RegistryUnavailable(Exception):
+        pass
+
+    def __init__(self, report_index=True):
+        self.index = 100
+        self.report_index = report_index
+        self.events = []
+
+    def get_raw(self, rkey, recurse=True, port=2379):
+        return MockEtcdResponse({"node": {"key": "/" + rkey, "dir": True}}, self.index)
+
+    def write(self, key):
+        self.index += 1
+        self.events.append({"action": "set", "node": {"key": key, "modifiedIndex": self.index}})
+
+    def watch(self, rkey, wait_index=None, timeout=None, port=2379):
+        gevent.sleep(0.001)
+        if wait_index <= self.index - HISTORY:
+            return self.index, MockEtcdResponse({"errorCode": 401, "index": self.index}, self.index)
+        for event in self.events:
+            if event["node"]["modifiedIndex"] >= wait_index and event["node"]["key"].startswith("/" + rkey):
+                return self.index, MockEtcdResponse(event, self.index)
+        start = self.index
+        for _ in range(HISTORY // 2):
+            self.write("/health/node")
+        return start if self.report_index else None, None
+
+
+class TestWatcher(unittest.TestCase):
+
+    def run_watcher(self, registry, timeouts):
+        watcher = Watcher(registry, "resource", timeout=1)
+        events = []
+        watcher.subscribe(lambda action, key, node, prev_node: events.append(key), lambda index, root: None)
+        watcher.start()
+        gevent.sleep(0.001 * timeouts)
+        registry.write("/resource/nodes/a")
+        gevent.sleep(0.01)
+        watcher.stop()
+        return watcher, events
+
+    def test_idle(self):
+        """A watch which times out waits from where it began, rather than falling out of etcd's history"""
+        watcher, events = self.run_watcher(MockEtcd(), 5)
+        self.assertEqual(2, watcher.resets)  # on starting and stopping
+        self.assertEqual([["nodes", "a"]], events)
+
+    def test_history_cleared(self):
+        """Without the index at which a watch began, it falls behind and must resync"""
+        watcher, _ = self.run_watcher(MockEtcd(report_index=False), 5)
+        self.assertGreater(watcher.resets, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
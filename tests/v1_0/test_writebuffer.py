@@ -0,0 +1,271 @@
+# Copyright 2019 British Broadcasting Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import json
+import shutil
+import tempfile
+import unittest
+
+from nmoscommon.webapi import WebAPI
+
+from nmosregistration.writebuffer import WriteBuffer
+from nmosregistration.availability import Availability
+from nmosregistration.v1_0 import routes as v1_0
+
+
+class MockResponse():
+    def __init__(self, status_code):
+        self.status_code = status_code
+        self.content = '{"node": {}}'
+        self.headers = {}
+
+
+class MockRegistry():
+    class RegistryUnavailable(Exception):
+        pass
+
+    def __init__(self):
+        self.broken = False
+        self.invocations = []
+        self.on_write = None
+
+    def _write(self, *invocation):
+        if self.broken:
+            raise self.RegistryUnavailable()
+        self.invocations.append(invocation)
+        if self.on_write is not None:
+            self.on_write()
+        return MockResponse(200)
+
+    def put(self, rtype, rkey, value, ttl=None, port=2379):
+        return self._write('put', rtype, rkey, value)
+
+    def delete(self, rtype, rkey, port=2379):
+        return self._write('delete', rtype, rkey)
+
+    def put_health(self, rkey, value, ttl=None, prev_exist=None, port=2379):
+        if prev_exist and not self.broken and ('health', rkey) not in self.invocations:
+            return MockResponse(404)
+        return self._write('health', rkey)
+
+    def resource_exists(self, rtype, rkey, port=2379):
+        if self.broken:
+            raise self.RegistryUnavailable()
+        return ('put', rtype, rkey) in [invocation[:3] for invocation in self.invocations]
+
+    def delete_health(self, rkey, prev_index=None, port=2379):
+        return self._write('delete_health', rkey)
+
+    def get_raw(self, rkey, recurse=True, port=2379):
+        if self.broken:
+            raise self.RegistryUnavailable()
+
+
+class MockLogger():
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: None
+
+
+class TestWriteBuffer(unittest.TestCase):
+
+    def setUp(self):
+        self.registry = MockRegistry()
+        self.availability = Availability(self.registry, retry_after=0, threshold=1)
+        self.buffer = WriteBuffer(self.registry, self.availability, limit=3, logger=MockLogger(), interval=0)
+
+    def test_replay_in_order(self):
+        self.buffer.put("nodes", "a", "1")
+        self.buffer.put("devices", "b", "2")
+        self.buffer.put_health("a", 10, 12)
+        self.assertTrue(self.buffer.replay())
+        self.assertEqual([('put', 'nodes', 'a', '1'), ('put', 'devices', 'b', '2'), ('health', 'a')],
+                         self.registry.invocations)
+        self.assertEqual(0, len(self.buffer))
+
+    def test_health_of_unregistered_node(self):
+        """Held health is only written for nodes which are registered by the time it is replayed"""
+        self.buffer.put_health("a", 10, 12)
+        self.assertTrue(self.buffer.replay())
+        self.assertEqual([], self.registry.invocations)
+        self.assertEqual(1, self.buffer.stats['failed'])
+
+    def test_later_write_replaces_in_place(self):
+        """A later write to a key replaces the one held, without losing its place"""
+        self.buffer.put("nodes", "a", "1")
+        self.buffer.put("devices", "b", "2")
+        self.buffer.put("nodes", "a", "3")
+        self.buffer.replay()
+        self.assertEqual([('put', 'nodes', 'a', '3'), ('put', 'devices', 'b', '2')], self.registry.invocations)
+
+    def test_held_delete(self):
+        self.buffer.put("nodes", "a", "1")
+        self.assertTrue(self.buffer.holds("nodes", "a"))
+        self.buffer.delete("nodes", "a")
+        self.assertFalse(self.buffer.holds("nodes", "a"))
+        self.assertIsNone(self.buffer.holds("nodes", "b"))
+        self.buffer.replay()
+        self.assertEqual([('delete', 'nodes', 'a'), ('delete_health', 'a')], self.registry.invocations)
+
+    def test_limit(self):
+        for key in ["a", "b", "c"]:
+            self.assertTrue(self.buffer.put("nodes", key, "1"))
+        self.assertFalse(self.buffer.put("nodes", "d", "1"))
+        self.assertTrue(self.buffer.put("nodes", "a", "2"))
+        self.assertEqual(1, self.buffer.get_stats()['rejected'])
+
+    def test_replay_stops_when_unavailable(self):
+        self.buffer.put("nodes", "a", "1")
+        self.registry.broken = True
+        self.assertFalse(self.buffer.replay())
+        self.assertFalse(self.availability.available())
+        self.assertEqual(1, len(self.buffer))
+
+    def test_newer_write_during_replay(self):
+        """A write held while an older write to the same key is being replayed is kept"""
+        self.buffer.put("nodes", "a", "1")
+
+        def write_again():
+            self.registry.on_write = None
+            self.buffer.put("nodes", "a", "2")
+
+        self.registry.on_write = write_again
+        self.buffer.replay()
+        self.assertEqual([('put', 'nodes', 'a', '1'), ('put', 'nodes', 'a', '2')], self.registry.invocations)
+
+
+class TestJournal(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, "journal")
+        self.registry = MockRegistry()
+        self.availability = Availability(self.registry, retry_after=0, threshold=1)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def open(self):
+        return WriteBuffer(self.registry, self.availability, path=self.path, logger=MockLogger(), interval=0)
+
+    def test_recover(self):
+        buffer = self.open()
+        buffer.put("nodes", "a", "1")
+        buffer.put("devices", "b", "2")
+        buffer.put("nodes", "a", "3")
+        with open(self.path, "a") as journal:
+            journal.write('{"op": "pu')
+
+        recovered = self.open()
+        self.assertEqual(2, len(recovered))
+        recovered.replay()
+        self.assertEqual([('put', 'nodes', 'a', '3'), ('put', 'devices', 'b', '2')], self.registry.invocations)
+        self.assertEqual(0, len(self.open()))
+
+
+class TestHeldWrites(unittest.TestCase):
+
+    NODE = "17c27274-6aaf-4f4b-9b9a-5b5b5dc2af63"
+    DEVICE = "a2a8b0c4-4bf3-4d3b-9bdb-4b7bd7f7e2a5"
+
+    def setUp(self):
+        self.registry = MockRegistry()
+        self.availability = Availability(self.registry, retry_after=0, threshold=1)
+        self.buffer = WriteBuffer(self.registry, self.availability, logger=MockLogger(), interval=0)
+        routes = v1_0.Routes(MockLogger(), self.registry, availability=self.availability, write_buffer=self.buffer)
+
+        class API(WebAPI):
+            def __init__(self):
+                super(API, self).__init__()
+                self.add_routes(routes, basepath="/x-nmos/registration/v1.0")
+
+        self.client = API().app.test_client()
+
+    def post(self, body):
+        return self.client.post("/x-nmos/registration/v1.0/resource", data=json.dumps(body),
+                                content_type="application/json")
+
+    def test_held_while_unavailable(self):
+        """Writes are held while the registry is unavailable, and made in order once it is back"""
+        self.registry.broken = True
+        r = self.post({'type': 'node', 'data': {
+            'label': 'test', 'href': 'http://127.0.0.1:8080', 'version': '1442328230:920000000',
+            'caps': {}, 'services': [], 'id': self.NODE
+        }})
+        self.assertEqual(202, r.status_code)
+        self.assertEqual("/x-nmos/registration/v1.0/resource/nodes/{}/".format(self.NODE), r.headers["Location"])
+
+        # The parent check is answered by the held node
+        r = self.post({'type': 'device', 'data': {
+            'label': 'test', 'type': 'urn:x-ipstudio:device:generic', 'version': '1442328230:920000000',
+            'senders': [], 'receivers': [], 'node_id': self.NODE, 'id': self.DEVICE
+        }})
+        self.assertEqual(202, r.status_code)
+
+        r = self.client.post("/x-nmos/registration/v1.0/health/nodes/{}".format(self.NODE))
+        self.assertEqual(200, r.status_code)
+
+        r = self.client.delete("/x-nmos/registration/v1.0/resource/devices/{}".format(self.DEVICE))
+        self.assertEqual(202, r.status_code)
+
+        self.registry.broken = False
+        self.availability.succeeded()
+        self.assertTrue(self.buffer.replay())
+        self.assertEqual(['put', 'health', 'delete'], [invocation[0] for invocation in self.registry.invocations])
+        self.assertEqual(('put', 'nodes', self.NODE), self.registry.invocations[0][:3])
+
+    def test_drains_under_load(self):
+        """Once the registry is back, only writes which would overtake one held join the buffer"""
+        self.registry.broken = True
+        r = self.post({'type': 'node', 'data': {
+            'label': 'test', 'href': 'http://127.0.0.1:8080', 'version': '1442328230:920000000',
+            'caps': {}, 'services': [], 'id': self.NODE
+        }})
+        self.assertEqual(202, r.status_code)
+        self.registry.broken = False
+        self.availability.succeeded()
+
+        other = "58ae56e0-c769-4be2-9ffb-a525068484c5"
+        r = self.post({'type': 'node', 'data': {
+            'label': 'other', 'href': 'http://127.0.0.1:8080', 'version': '1442328230:920000000',
+            'caps': {}, 'services': [], 'id': other
+        }})
+        self.assertEqual(200, r.status_code)
+        r = self.client.post("/x-nmos/registration/v1.0/health/nodes/{}".format(other))
+        self.assertEqual(200, r.status_code)
+
+        # The held node's heartbeats and children wait for it to be written
+        r = self.post({'type': 'device', 'data': {
+            'label': 'test', 'type': 'urn:x-ipstudio:device:generic', 'version': '1442328230:920000000',
+            'senders': [], 'receivers': [], 'node_id': self.NODE, 'id': self.DEVICE
+        }})
+        self.assertEqual(202, r.status_code)
+        r = self.client.post("/x-nmos/registration/v1.0/health/nodes/{}".format(self.NODE))
+        self.assertEqual(200, r.status_code)
+        self.assertEqual(3, len(self.buffer))
+
+        self.assertTrue(self.buffer.replay())
+        self.assertEqual(0, len(self.buffer))
+
+    def test_heartbeat_for_unknown_node(self):
+        """While writes are held, heartbeats from nodes not known to be registered are refused"""
+        self.registry.broken = True
+        self.availability.failed()
+        r = self.client.post("/x-nmos/registration/v1.0/health/nodes/{}".format(self.NODE))
+        self.assertEqual(404, r.status_code)
+        self.assertEqual(0, len(self.buffer))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -16,6 +16,7 @@ import unittest
 import jsonschema
 
 from nmosregistration.v1_3 import schema
+from nmosregistration.validation import get_validator
 from . import util
 
 
@@ -23,7 +24,7 @@ class SchemaValidCase(unittest.TestCase):
 
     def assertValidates(self, obj, against):
         try:
-            jsonschema.validate(obj, against)
+            against.validate(obj)
         except jsonschema.ValidationError as ex:
             self.fail("Validation failed: path={} {}".format(
                 ex.schema_path,
@@ -31,14 +32,14 @@ class SchemaValidCase(unittest.TestCase):
 
     def assertInvalid(self, obj, against):
         with self.assertRaises(jsonschema.ValidationError):
-            jsonschema.validate(obj, against)
+            against.validate(obj)
 
 
 class TestFlowSchema(SchemaValidCase):
 
     @classmethod
     def setUpClass(cls):
-        cls.schema = schema.SCHEMA["flow"]
+        cls.schema = get_validator(schema, "flow")
 
     def test_audio_ok(self):
         obj = util.json_fixture("fixtures/audio-flow.json")
@@ -70,7 +71,7 @@ class TestSourceSchema(SchemaValidCase):
 
     @classmethod
     def setUpClass(cls):
-        cls.schema = schema.SCHEMA["source"]
+        cls.schema = get_validator(schema, "source")
 
     def test_generic_refclock_none_ok(self):
         obj = util.json_fixture("fixtures/source-generic-refclock-none.json")
@@ -93,7 +94,7 @@ class TestNodeSchema(SchemaValidCase):
 
     @classmethod
     def setUpClass(cls):
-        cls.schema = schema.SCHEMA["node"]
+        cls.schema = get_validator(schema, "node")
 
     def test_generic_node_ok(self):
         obj = util.json_fixture("fixtures/node.json")
@@ -104,7 +105,7 @@ class TestDeviceSchema(SchemaValidCase):
 
     @classmethod
     def setUpClass(cls):
-        cls.schema = schema.SCHEMA["device"]
+        cls.schema = get_validator(schema, "device")
 
     def test_generic_device_ok(self):
         obj = util.json_fixture("fixtures/device.json")
@@ -115,7 +116,7 @@ class TestSenderSchema(SchemaValidCase):
 
     @classmethod
     def setUpClass(cls):
-        cls.schema = schema.SCHEMA["sender"]
+        cls.schema = get_validator(schema, "sender")
 
     def test_generic_sender_ok(self):
         obj = util.json_fixture("fixtures/sender.json")
@@ -126,7 +127,7 @@ class TestReceiverSchema(SchemaValidCase):
 
     @classmethod
     def setUpClass(cls):
-        cls.schema = schema.SCHEMA["receiver"]
+        cls.schema = get_validator(schema, "receiver")
 
     def test_generic_receiver_ok(self):
         obj = util.json_fixture("fixtures/receiver.json")